@@ -0,0 +1,253 @@
+"""
+Benchmarks of the hot paths of pynabi: the probability functions, the
+  knowledge base, the engine and full headless games.
+
+All benchmarks run on games dealt from fixed seeds, such that the results
+  of two commits can be compared. Run from the root of the repository:
+
+    PYTHONPATH=src python benchmarks/bench.py -o before.json
+    PYTHONPATH=src python benchmarks/bench.py --compare before.json
+
+The timings are the seconds per call, where the best of the repetitions
+  is the most stable figure to compare.
+
+The heuristics of ProbabilisticEngine are memoized in a cache shared
+  across games (see caching), which the repetitions of a benchmark would
+  fill. The engine and the games are therefore timed without the cache,
+  and separately with a warm cache, marked as 'cached'.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import timeit
+from typing import Callable, Dict, Tuple
+
+from pynabi.base import CardColour, HanabiGameState
+from pynabi.caching import HEURISTIC_CACHE
+from pynabi.engine import ProbabilisticEngine
+from pynabi.probability import card_probability, get_possible_cards, potential_score
+from pynabi.simulation import create_game, play_game
+
+SEED = 2024
+
+# The number of turns played before the state used by the micro benchmarks.
+WARMUP_TURNS = 10
+
+# A benchmark creates its state and returns the function to time.
+Benchmark = Callable[[], Callable[[], object]]
+
+
+def _midgame(n_players: int = 3, turns: int = WARMUP_TURNS):
+    """
+    Creates a game from the fixed seed, which has been played for a number
+      of turns, such that the players have some knowledge of their hands.
+    """
+    game = create_game(n_players, rng=random.Random(SEED))
+    game.start()
+
+    for _ in range(turns):
+        if game.state != HanabiGameState.Playing:
+            break
+        game.step(ProbabilisticEngine(game, game.current_player).make_move())
+
+    return game
+
+
+def bench_get_possible_cards():
+    game = _midgame()
+    player = game.current_player
+    return lambda: get_possible_cards(game, player, 0)
+
+
+def bench_card_probability():
+    game = _midgame()
+    possible_cards = get_possible_cards(game, game.current_player, 0)
+    card = possible_cards[0]
+    return lambda: card_probability(card, possible_cards)
+
+
+def bench_potential_score():
+    game = _midgame()
+    possible_cards = get_possible_cards(game, game.current_player, 0)
+    card = possible_cards[0]
+    return lambda: potential_score(card, game, possible_cards)
+
+
+def bench_make_move():
+    game = _midgame()
+    player = game.current_player
+    return lambda: ProbabilisticEngine(game, player, cache=None).make_move()
+
+
+def bench_make_move_cached():
+    game = _midgame()
+    player = game.current_player
+    # The first move fills the cache with all the heuristics of the state.
+    ProbabilisticEngine(game, player).make_move()
+    return lambda: ProbabilisticEngine(game, player).make_move()
+
+
+def bench_reveal_colour():
+    kb = _midgame().current_player.knowledgebase
+    return lambda: kb.reveal_colour(CardColour.Red)
+
+
+def bench_reveal_value():
+    kb = _midgame().current_player.knowledgebase
+    return lambda: kb.reveal_value(1)
+
+
+def _bench_game(n_players: int, cached: bool = False) -> Benchmark:
+    def _play():
+        # All the games are played from the same seed, thus every game
+        # but the first would find its heuristics in the cache.
+        if not cached:
+            HEURISTIC_CACHE.clear()
+        return play_game(n_players, seed=SEED)
+
+    return lambda: _play
+
+
+BENCHMARKS: Dict[str, Tuple[Benchmark, int]] = {
+    # name: (benchmark, calls per repetition)
+    "probability.get_possible_cards": (bench_get_possible_cards, 2000),
+    "probability.card_probability": (bench_card_probability, 20000),
+    "probability.potential_score": (bench_potential_score, 20000),
+    "engine.ProbabilisticEngine.make_move": (bench_make_move, 100),
+    "engine.ProbabilisticEngine.make_move[cached]": (bench_make_move_cached, 100),
+    "knowledgebase.reveal_colour": (bench_reveal_colour, 20000),
+    "knowledgebase.reveal_value": (bench_reveal_value, 20000),
+    "game.play[3 players]": (_bench_game(3), 1),
+    "game.play[4 players]": (_bench_game(4), 1),
+    "game.play[5 players]": (_bench_game(5), 1),
+    "game.play[3 players, cached]": (_bench_game(3, cached=True), 1),
+    "game.play[4 players, cached]": (_bench_game(4, cached=True), 1),
+    "game.play[5 players, cached]": (_bench_game(5, cached=True), 1),
+}
+
+
+def run(repeat: int = 5, scale: float = 1.0, only: str | None = None) -> dict:
+    """
+    Runs the benchmarks, whose name contains 'only' (if given), and
+      returns the seconds per call of each repetition.
+    """
+    results = {}
+
+    for name, (benchmark, number) in BENCHMARKS.items():
+        if only and only not in name:
+            continue
+
+        number = max(1, int(number * scale))
+        times = timeit.Timer(benchmark()).repeat(repeat=repeat, number=number)
+        per_call = [t / number for t in times]
+
+        results[name] = {
+            "number": number,
+            "repeat": repeat,
+            "best": min(per_call),
+            "median": statistics.median(per_call),
+        }
+
+    return results
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    """
+    Prints the change of each benchmark relative to the baseline and
+      returns whether any of them got slower by more than the threshold.
+    """
+    regressed = False
+
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<48} {'new':>10}")
+            continue
+
+        ratio = result["best"] / before["best"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressed = True
+
+        print(f"{name:<48} {ratio:>9.2f}x{flag}")
+
+    return regressed
+
+
+def format_table(results: dict) -> str:
+    lines = [f"{'benchmark':<48} {'best':>12} {'median':>12}"]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<48} {result['best'] * 1e6:>10.1f}us {result['median'] * 1e6:>10.1f}us"
+        )
+
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1].strip())
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    parser.add_argument("--compare", help="compare with the results in a JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default: 0.1)",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="scales the number of calls per repetition",
+    )
+    parser.add_argument("-k", "--only", help="run the benchmarks matching a name")
+    args = parser.parse_args(argv)
+
+    current = {
+        "meta": {
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": SEED,
+        },
+        "results": run(args.repeat, args.scale, args.only),
+    }
+
+    print(format_table(current["results"]))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        print()
+        if compare(baseline, current, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
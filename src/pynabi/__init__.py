@@ -1,13 +1,23 @@
+import argparse
+import os
 import sys
+import time
 
+from .analytics import analyse_directory, analyse_file
 from .base import AbstractPlayer
+from .caching import HEURISTIC_CACHE
 from .board import HanabiBoard
 from .deck import HanabiDeck
+from .events import NULL_SINK, ConsoleRenderer, EventBus, EventSink
 from .game import HanabiGame
 from .hand import PlayerHand
 from .knowledgebase import KnowledgeBase
 from .player import HumanPlayer, AIPlayer
+from .profiling import Profiler
+from .replay import ReplayWriter
+from .simulation import GameResult, simulate, format_summary
 from .tokens import HanabiTokens
+from .tournament import TournamentStats, run_tournament
 
 
 def format_welcome_message() -> str:
@@ -45,7 +55,9 @@ def prompt_players() -> int:
     return n_players
 
 
-def create_players(n_players: int) -> list[AbstractPlayer]:
+def create_players(
+    n_players: int, events: EventSink = NULL_SINK
+) -> list[AbstractPlayer]:
     def _create_player(player_id: int) -> AbstractPlayer:
         while True:
             try:
@@ -55,9 +67,11 @@ def create_players(n_players: int) -> list[AbstractPlayer]:
 
                 match from_user:
                     case "y" | "yes":
-                        return AIPlayer(player_id, KnowledgeBase(PlayerHand()))
+                        return AIPlayer(player_id, KnowledgeBase(PlayerHand(), events))
                     case "n" | "no":
-                        return HumanPlayer(player_id, KnowledgeBase(PlayerHand()))
+                        return HumanPlayer(
+                            player_id, KnowledgeBase(PlayerHand(), events)
+                        )
                     case _:
                         print("Nah, that can't be quite right. Try again...")
             except KeyboardInterrupt:
@@ -66,18 +80,197 @@ def create_players(n_players: int) -> list[AbstractPlayer]:
     return [_create_player(player_id) for player_id in range(n_players)]
 
 
-def main() -> None:
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pynabi",
+        description="A python implementation of the Hanabi card game.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    simulate_parser = subparsers.add_parser(
+        "simulate",
+        help="Play AI-only games headlessly and report the results.",
+    )
+    simulate_parser.add_argument(
+        "-n", "--games", type=int, default=100, help="Number of games to play."
+    )
+    simulate_parser.add_argument(
+        "-p",
+        "--players",
+        type=int,
+        choices=range(3, 6),
+        default=3,
+        help="Number of players per game.",
+    )
+    simulate_parser.add_argument(
+        "-s", "--seed", type=int, default=None, help="Seed of the first game."
+    )
+    simulate_parser.add_argument(
+        "--per-game",
+        action="store_true",
+        help="Also print the score and number of turns of every game.",
+    )
+    simulate_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time spent in each phase of the games.",
+    )
+    simulate_parser.add_argument(
+        "--profile-json",
+        metavar="FILE",
+        default=None,
+        help="Write the time spent in each phase of the games as JSON.",
+    )
+    simulate_parser.add_argument(
+        "--record",
+        metavar="FILE",
+        default=None,
+        help="Append replays of the games to a file.",
+    )
+
+    tournament_parser = subparsers.add_parser(
+        "tournament",
+        help="Play AI-only games across several processes and report statistics.",
+    )
+    tournament_parser.add_argument(
+        "-n", "--games", type=int, default=1000, help="Number of games to play."
+    )
+    tournament_parser.add_argument(
+        "-p",
+        "--players",
+        type=int,
+        choices=range(3, 6),
+        default=3,
+        help="Number of players per game.",
+    )
+    tournament_parser.add_argument(
+        "-s", "--seed", type=int, default=0, help="Seed of the first game."
+    )
+    tournament_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs).",
+    )
+    tournament_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=16,
+        help="Number of games handed to a worker at a time.",
+    )
+    tournament_parser.add_argument(
+        "--record-dir",
+        metavar="DIR",
+        default=None,
+        help="Record replays of the games to files in a directory.",
+    )
+
+    analyse_parser = subparsers.add_parser(
+        "analyse",
+        help="Replay recorded games and report statistics about them.",
+    )
+    analyse_parser.add_argument(
+        "path", help="A replay file or a directory of replay files."
+    )
+    analyse_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs).",
+    )
+
+    return parser
+
+
+def run_analysis(args: argparse.Namespace) -> None:
+    if os.path.isdir(args.path):
+        stats = analyse_directory(args.path, workers=args.workers)
+    else:
+        stats = analyse_file(args.path)
+
+    print(stats)
+
+
+def run_tournament_command(args: argparse.Namespace) -> None:
+    for stats in run_tournament(
+        args.games,
+        players=args.players,
+        workers=args.workers,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        record_dir=args.record_dir,
+    ):
+        print(stats, flush=True)
+
+
+def run_simulation(args: argparse.Namespace) -> None:
+    profiler = Profiler() if args.profile or args.profile_json else None
+
+    replays = ReplayWriter(args.record) if args.record else None
+
+    start = time.perf_counter()
+    try:
+        results = simulate(
+            args.games,
+            players=args.players,
+            seed=args.seed,
+            profiler=profiler,
+            replays=replays,
+        )
+    finally:
+        if replays is not None:
+            replays.close()
+    elapsed = time.perf_counter() - start
+
+    if args.per_game:
+        for i, result in enumerate(results):
+            print(f"{i}\t{result.score}\t{result.turns}")
+
+    print(format_summary(results, elapsed))
+
+    if profiler is None:
+        return
+
+    if args.profile:
+        print(profiler.format_table())
+        print(f"Heuristic cache: {HEURISTIC_CACHE.cache_info()}")
+
+    if args.profile_json:
+        with open(args.profile_json, "w") as f:
+            f.write(profiler.to_json(indent=2))
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = create_parser().parse_args(argv)
+
+    if args.command == "simulate":
+        run_simulation(args)
+        return
+
+    if args.command == "tournament":
+        run_tournament_command(args)
+        return
+
+    if args.command == "analyse":
+        run_analysis(args)
+        return
+
     print(format_welcome_message())
 
     n_players = prompt_players()
 
-    players = create_players(n_players)
+    # Only interactive games are rendered to the console.
+    events = EventBus(ConsoleRenderer())
+
+    players = create_players(n_players, events)
 
-    tokens = HanabiTokens()
-    board = HanabiBoard(tokens)
+    tokens = HanabiTokens(events)
+    board = HanabiBoard(tokens, events)
     deck = HanabiDeck()
 
-    hanabi = HanabiGame(players=players, board=board, deck=deck)
+    hanabi = HanabiGame(players=players, board=board, deck=deck, events=events)
 
     try:
         hanabi.play()
@@ -0,0 +1,150 @@
+"""
+A fixed action space, where every move is an integer action id.
+
+The action space is the same for all games with the same number of
+  players. With h = HAND_SIZE and the other players numbered by their
+  offset r = 1, ..., n - 1 from the acting player, the actions are:
+
+    i                       play the card in slot i
+    h + i                   discard the card in slot i
+    2h + 10(r - 1) + c      hint the r'th next player the colour COLOURS[c]
+    2h + 10(r - 1) + 4 + v  hint the r'th next player the value v
+
+Sets of actions, such as the legal actions of a player, are represented
+  as integers, where bit i is set if the action with id i is in the set
+  (like the sets of cards in masks).
+"""
+
+from functools import lru_cache
+from typing import Iterator, List
+
+from .base import CARDS, COLOURS, HAND_SIZE, Action, AbstractGame, PlayerMove
+from .engine import create_move
+
+# The hints, which can be given about each card id, relative to the
+# first hint action of the player holding the card.
+_HINTS = tuple(
+    1 << COLOURS.index(card.colour) | 1 << (4 + card.value) for card in CARDS
+)
+
+_SLOTS = (1 << HAND_SIZE) - 1
+
+
+def n_actions(n_players: int) -> int:
+    return 2 * HAND_SIZE + 10 * (n_players - 1)
+
+
+def action_to_move(n_players: int, player_id: int, action: int) -> tuple:
+    """
+    Converts an action id of a player to a move (see base.Action).
+    """
+    return _move_table(n_players, player_id)[action]
+
+
+def move_to_action(n_players: int, player_id: int, move: tuple) -> int:
+    """
+    Converts a move of a player to its action id.
+    """
+    match move:
+        case [Action.PLAY, card_index]:
+            return card_index
+        case [Action.DISCARD, card_index]:
+            return HAND_SIZE + card_index
+
+    _, target_id, info = move
+    base = 2 * HAND_SIZE + 10 * ((target_id - player_id) % n_players - 1)
+
+    if isinstance(info, int):
+        return base + 4 + info
+    return base + COLOURS.index(info)
+
+
+@lru_cache(maxsize=None)
+def _move_table(n_players: int, player_id: int) -> tuple:
+    moves: List[tuple] = [(Action.PLAY, i) for i in range(HAND_SIZE)]
+    moves += [(Action.DISCARD, i) for i in range(HAND_SIZE)]
+
+    for offset in range(1, n_players):
+        target_id = (player_id + offset) % n_players
+        moves += [(Action.INFO, target_id, colour) for colour in COLOURS]
+        moves += [(Action.INFO, target_id, value) for value in range(1, 6)]
+
+    return tuple(moves)
+
+
+@lru_cache(maxsize=None)
+def _create_move(n_players: int, player_id: int, action: int) -> PlayerMove:
+    return create_move(action_to_move(n_players, player_id, action))
+
+
+def create_move_from_id(game: AbstractGame, action: int) -> PlayerMove:
+    """
+    Creates the move of the current player with the given action id.
+
+    Moves only depend on their action id, the number of players and the
+      acting player, so they are created once and shared by all games.
+    """
+    return _create_move(len(game.players), game.current_player.player_id, action)
+
+
+def iter_actions(actions: int) -> Iterator[int]:
+    """
+    Iterates over the action ids in a set of actions.
+    """
+    while actions:
+        low = actions & -actions
+        yield low.bit_length() - 1
+        actions ^= low
+
+
+class LegalActions:
+    """
+    The legal actions of the players of a game.
+
+    The hints, which can be given to each player, are cached, such that
+      they are only computed again when the hand of that player changes,
+      i.e. after update() is told about a move playing or discarding
+      one of its cards.
+    """
+
+    def __init__(self, game: AbstractGame) -> None:
+        self._game = game
+        self._n_players = len(game.players)
+        self._hints = [0] * self._n_players
+
+        for player_id in range(self._n_players):
+            self._update_hints(player_id)
+
+    def update(self, player_id: int, move: tuple) -> None:
+        """
+        Updates the cache after the given move of a player.
+        """
+        if move[0] != Action.INFO:
+            self._update_hints(player_id)
+
+    def mask(self, player_id: int | None = None) -> int:
+        """
+        The set of legal actions of a player (by default, the current one).
+        """
+        game = self._game
+        if player_id is None:
+            player_id = game.current_player.player_id
+
+        slots = _SLOTS >> (HAND_SIZE - len(game.players[player_id].knowledgebase.hand))
+        actions = slots | slots << HAND_SIZE
+
+        if game.board.tokens.hint_tokens:
+            n_players = self._n_players
+            shift = 2 * HAND_SIZE
+            for offset in range(1, n_players):
+                actions |= self._hints[(player_id + offset) % n_players] << shift
+                shift += 10
+
+        return actions
+
+    def _update_hints(self, player_id: int) -> None:
+        hints = 0
+        for card in self._game.players[player_id].knowledgebase.hand:
+            hints |= _HINTS[card.id]
+
+        self._hints[player_id] = hints
@@ -1,41 +1,66 @@
-import copy
-import random
-import time
 import math
 from dataclasses import dataclass, field
-from typing import Dict, Union, Self
+from types import MappingProxyType
+from typing import Mapping, Sequence, Union, Self
 
-from .base import (
-    HanabiGameState,
-    AbstractGame,
-    AbstractPlayer,
-    PlayerMove,
-    Action,
-)
 
+# The children of a node without any, which is shared by all leaves
+# (i.e. most of the nodes of a tree) rather than an empty dict each.
+_NO_CHILDREN: Mapping[tuple, "Node"] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class Node:
-    move: tuple
-    player: AbstractPlayer
+    """
+    A node of a search tree, i.e. the move leading to it along with
+      its statistics.
+
+    Nodes are slotted and leaves share an empty mapping of children,
+      as a search creates a node per iteration. The exploration constant
+      is given by the engine when selecting among the children.
+    """
+
+    # The move leading to the node, which the root does not have.
+    move: Union[tuple, None]
     parent: Union[Self, None] = None
     visits: int = 0
-    wins: int = 0
-    children: Dict[PlayerMove, Self] = field(default_factory=dict)
-    constant: float = 1.42
+    wins: float = 0
+    children: Mapping[tuple, "Node"] = field(default_factory=lambda: _NO_CHILDREN)
+    # The number of times the move was legal when its parent was visited,
+    # which is only counted when the legal moves vary between visits (ISMCTS).
+    available: int = 0
 
     def add_children(self, children: list) -> None:
+        own_children = self.children
+        if not isinstance(own_children, dict):
+            own_children = self.children = {}
+
         for child in children:
-            self.children[child.move] = child
+            own_children[child.move] = child
+
+
+def select_child(parent: Node, children: Sequence[Node], constant: float) -> Node:
+    """
+    Selects the child with the highest UCB value, i.e. the first one
+      in case of ties.
+
+    The logarithm of the visits of the parent is taken once for all the
+      children, unless a child counts the times it was available instead.
+    """
+    log, sqrt = math.log, math.sqrt
+    log_visits = log(parent.visits) if parent.visits else 0.0
 
-    def ucb_value(self):
-        """
-        Calculates the UCB value for the current node.
-        """
-        if self.visits == 0:
-            return 0
+    best, best_value = children[0], -1.0
+    for child in children:
+        visits = child.visits
+        if not visits:
+            value = 0.0
+        elif child.available:
+            value = child.wins / visits + constant * sqrt(log(child.available) / visits)
+        else:
+            value = child.wins / visits + constant * sqrt(log_visits / visits)
 
-        winning_ratio = self.wins / self.visits
-        visit_ratio = math.sqrt(math.log(self.parent.visits) / self.visits)
+        if value > best_value:
+            best, best_value = child, value
 
-        return winning_ratio + self.constant * visit_ratio
+    return best
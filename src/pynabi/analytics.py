@@ -0,0 +1,212 @@
+"""
+Replaying recorded games (see replay) and computing statistics about them.
+"""
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import fmean
+from typing import Iterable, Iterator, List, Tuple
+
+from .actions import action_to_move, create_move_from_id
+from .base import Action
+from .deck import HanabiDeck
+from .game import HanabiGame
+from .replay import Replay, ReplayReader
+from .simulation import create_game
+from .tokens import HanabiTokens
+
+
+def replay_game(replay: Replay) -> Iterator[Tuple[HanabiGame, int, tuple]]:
+    """
+    Replays a recorded game without engines or output.
+
+    Yields the game after every move along with the player, who made it,
+      and the move itself. The game is modified in place, so it must be
+      inspected (or cloned) before the next move is replayed.
+    """
+    game = create_game(replay.n_players, deck=HanabiDeck.from_ids(replay.deck))
+    game.start()
+
+    for action in replay.actions:
+        player_id = game.current_player.player_id
+        game.step(create_move_from_id(game, action))
+        yield game, player_id, action_to_move(replay.n_players, player_id, action)
+
+
+@dataclass(frozen=True)
+class TurnStats:
+    """
+    The state of a replayed game after a turn.
+    """
+
+    turn: int
+    player_id: int
+    action: Action
+    points: int
+    hint_tokens: int
+    fuse_tokens: int
+    misplay: bool
+    # The mean of KnowledgeBase.knowledge() over all players.
+    knowledge: float
+
+
+def turn_stats(replay: Replay) -> List[TurnStats]:
+    """
+    Replays a recorded game and collects the statistics of every turn.
+    """
+    stats = []
+    # A move lost a fuse token if, and only if, it was a misplay.
+    fuse_tokens = HanabiTokens().fuse_tokens
+
+    for game, player_id, move in replay_game(replay):
+        tokens = game.board.tokens
+
+        stats.append(
+            TurnStats(
+                turn=game.turns,
+                player_id=player_id,
+                action=move[0],
+                points=game.calculate_points(),
+                hint_tokens=tokens.hint_tokens,
+                fuse_tokens=tokens.fuse_tokens,
+                misplay=tokens.fuse_tokens < fuse_tokens,
+                knowledge=fmean(p.knowledgebase.knowledge() for p in game.players),
+            )
+        )
+        fuse_tokens = tokens.fuse_tokens
+
+    return stats
+
+
+class ReplayStats:
+    """
+    Statistics accumulated over any number of replays.
+
+    The per-turn statistics are sums indexed by turn (starting at 0),
+      such that statistics of different replays can be merged in any order.
+    """
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.won = 0
+        self.score_sum = 0
+        self.turns_sum = 0
+        self.actions = {action: 0 for action in Action}
+        self.misplays = 0
+
+        # Indexed by turn: the number of games, which lasted that long,
+        # and the sums of points, hint tokens and knowledge after the turn.
+        self.games_by_turn: List[int] = []
+        self.points_by_turn: List[int] = []
+        self.hints_by_turn: List[int] = []
+        self.knowledge_by_turn: List[float] = []
+
+    def add(self, replay: Replay) -> None:
+        stats = turn_stats(replay)
+
+        self.games += 1
+        self.won += replay.won
+        self.score_sum += replay.score
+        self.turns_sum += len(stats)
+
+        self._extend(len(stats))
+        for i, turn in enumerate(stats):
+            self.actions[turn.action] += 1
+            self.misplays += turn.misplay
+
+            self.games_by_turn[i] += 1
+            self.points_by_turn[i] += turn.points
+            self.hints_by_turn[i] += turn.hint_tokens
+            self.knowledge_by_turn[i] += turn.knowledge
+
+    def merge(self, other: "ReplayStats") -> None:
+        self.games += other.games
+        self.won += other.won
+        self.score_sum += other.score_sum
+        self.turns_sum += other.turns_sum
+        self.misplays += other.misplays
+        for action, n in other.actions.items():
+            self.actions[action] += n
+
+        self._extend(len(other.games_by_turn))
+        for i, n in enumerate(other.games_by_turn):
+            self.games_by_turn[i] += n
+            self.points_by_turn[i] += other.points_by_turn[i]
+            self.hints_by_turn[i] += other.hints_by_turn[i]
+            self.knowledge_by_turn[i] += other.knowledge_by_turn[i]
+
+    def mean_by_turn(self) -> List[Tuple[int, float, float, float]]:
+        """
+        The number of games and the mean points, hint tokens and knowledge
+          after each turn, over the games which lasted that long.
+        """
+        return [
+            (
+                n,
+                self.points_by_turn[i] / n,
+                self.hints_by_turn[i] / n,
+                self.knowledge_by_turn[i] / n,
+            )
+            for i, n in enumerate(self.games_by_turn)
+        ]
+
+    def _extend(self, n_turns: int) -> None:
+        missing = n_turns - len(self.games_by_turn)
+        if missing > 0:
+            self.games_by_turn += [0] * missing
+            self.points_by_turn += [0] * missing
+            self.hints_by_turn += [0] * missing
+            self.knowledge_by_turn += [0.0] * missing
+
+    def __str__(self) -> str:
+        n = self.games
+        if not n:
+            return "No games were replayed."
+
+        moves = self.turns_sum or 1
+        return (
+            f"Games: {n}\n"
+            f"Won: {self.won} ({self.won / n:.1%})\n"
+            f"Mean score: {self.score_sum / n:.2f}\n"
+            f"Mean turns: {self.turns_sum / n:.2f}\n"
+            f"Misplays per game: {self.misplays / n:.2f}\n"
+            + "\n".join(
+                f"{action.value.capitalize()} moves: {count / moves:.1%}"
+                for action, count in self.actions.items()
+            )
+        )
+
+
+def analyse_replays(replays: Iterable[Replay]) -> ReplayStats:
+    stats = ReplayStats()
+    for replay in replays:
+        stats.add(replay)
+
+    return stats
+
+
+def analyse_file(path: str) -> ReplayStats:
+    with ReplayReader(path) as reader:
+        return analyse_replays(reader)
+
+
+def analyse_directory(directory: str, workers: int | None = None) -> ReplayStats:
+    """
+    Analyses all replay files (*.replay) in a directory, where the files
+      are shared between a pool of worker processes.
+    """
+    paths = sorted(glob.glob(os.path.join(directory, "*.replay")))
+    stats = ReplayStats()
+
+    if workers == 1:
+        for path in paths:
+            stats.merge(analyse_file(path))
+        return stats
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for file_stats in executor.map(analyse_file, paths):
+            stats.merge(file_stats)
+
+    return stats
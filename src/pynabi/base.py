@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Iterator, List
 
@@ -15,18 +15,25 @@ class CardColour(Enum):
     Yellow = "Yellow"
     White = "White"
 
+    # Colours are singletons, so hashing by identity is consistent with
+    # equality and much cheaper than the default hashing of the name.
+    __hash__ = object.__hash__
+
     def __str__(self) -> str:
-        match self:
-            case CardColour.Red:
-                return "Red"
-            case CardColour.Blue:
-                return "Blue"
-            case CardColour.Green:
-                return "Green"
-            case CardColour.Yellow:
-                return "Yellow"
-            case CardColour.White:
-                return "White"
+        return self.value
+
+
+# The colours in the order used by the compact encoding of cards.
+COLOURS = tuple(CardColour)
+
+_COLOUR_INDICES = {colour: i for i, colour in enumerate(COLOURS)}
+
+
+def card_id(value: int, colour: CardColour) -> int:
+    """
+    Encodes a card as an integer between 0-24.
+    """
+    return 5 * _COLOUR_INDICES[colour] + value - 1
 
 
 @dataclass(frozen=True)
@@ -34,10 +41,38 @@ class Card:
     """
     A Hanabi card has a numerical value between 1-5,
       and a colour.
+
+    There are only 25 distinct cards, so each card is identified by a
+      compact integer id (see card_id). Equality and hashing use the id,
+      and the interned instances in CARDS can be used instead of creating
+      new cards.
     """
 
     value: int
     colour: CardColour
+    id: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.value not in range(1, 6):
+            raise ValueError(f"Invalid card value: {self.value}")
+
+        object.__setattr__(self, "id", card_id(self.value, self.colour))
+
+    @staticmethod
+    def from_id(index: int) -> "Card":
+        """
+        Gets the interned card with the given id.
+        """
+        return CARDS[index]
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not Card:
+            return NotImplemented
+
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return self.id
 
     def __str__(self) -> str:
         return f"({self.value},{self.colour})"
@@ -52,6 +87,15 @@ class Card:
         return f"({value},{colour})"
 
 
+# The maximum number of cards in a hand.
+HAND_SIZE = 5
+
+# The interned cards, indexed by their ids.
+CARDS = tuple(
+    Card(value=value, colour=colour) for colour in COLOURS for value in range(1, 6)
+)
+
+
 class HanabiGameState(Enum):
     """
     Representation of the game state.
@@ -109,6 +153,32 @@ class AbstractTokens(ABC):
         Getter for the number of fuse tokens.
         """
 
+    @abstractmethod
+    def clone(self) -> "AbstractTokens":
+        """
+        Creates a silent copy of these tokens.
+        """
+
+    @abstractmethod
+    def snapshot(self):
+        """
+        Creates a snapshot of the current state.
+        """
+
+    @abstractmethod
+    def restore(self, snapshot) -> None:
+        """
+        Restores the state captured by snapshot.
+        """
+
+    @property
+    @abstractmethod
+    def zobrist_hash(self) -> int:
+        """
+        A hash of the current state, which is kept up to date
+          as it changes (see zobrist).
+        """
+
 
 class AbstractBoard(ABC):
     """
@@ -149,6 +219,32 @@ class AbstractBoard(ABC):
         Calculates a score for playing a card on this board.
         """
 
+    @abstractmethod
+    def clone(self) -> "AbstractBoard":
+        """
+        Creates a silent copy of this board (including its tokens).
+        """
+
+    @abstractmethod
+    def snapshot(self):
+        """
+        Creates a snapshot of the current state (including the tokens).
+        """
+
+    @abstractmethod
+    def restore(self, snapshot) -> None:
+        """
+        Restores the state captured by snapshot.
+        """
+
+    @property
+    @abstractmethod
+    def zobrist_hash(self) -> int:
+        """
+        A hash of the current state, which is kept up to date
+          as it changes (see zobrist).
+        """
+
     @abstractmethod
     def __getitem__(self, colour: CardColour) -> int:
         pass
@@ -178,6 +274,19 @@ class AbstractDeck(ABC):
     def __len__(self) -> int:
         pass
 
+    @abstractmethod
+    def __iter__(self) -> Iterator[Card]:
+        """
+        Iterates over the cards left in the deck, the last of which
+          is drawn first.
+        """
+
+    @abstractmethod
+    def replace(self, cards: List[Card]) -> None:
+        """
+        Replaces the cards left in the deck, e.g. with a resampled order.
+        """
+
     @property
     @abstractmethod
     def discarded_pile(self) -> list:
@@ -185,12 +294,46 @@ class AbstractDeck(ABC):
         Gets all the cards in the discarded_pile
         """
 
+    @property
+    @abstractmethod
+    def counts(self):
+        """
+        Gets the number of cards of each kind left in the deck.
+        """
+
     @abstractmethod
     def create_deck(self) -> List[Card]:
         """
         Creates a (non-shuffled) standard deck of Hanabi Cards.
         """
 
+    @abstractmethod
+    def clone(self) -> "AbstractDeck":
+        """
+        Creates a copy of this deck.
+        """
+
+    @abstractmethod
+    def snapshot(self):
+        """
+        Creates a snapshot of the current state, which can be restored
+          as long as at most a single card has been drawn since.
+        """
+
+    @abstractmethod
+    def restore(self, snapshot) -> None:
+        """
+        Restores the state captured by snapshot.
+        """
+
+    @property
+    @abstractmethod
+    def zobrist_hash(self) -> int:
+        """
+        A hash of the current state, which is kept up to date
+          as it changes (see zobrist).
+        """
+
 
 class AbstractHand(ABC):
     """
@@ -206,10 +349,10 @@ class AbstractHand(ABC):
         """
 
     @abstractmethod
-    def discard(self, deck: AbstractDeck, n_cards: int):
+    def discard(self, deck: AbstractDeck, n_cards: int) -> Card:
         """
         Discards a cards with index 'n_cards' from this hand
-          and puts it in the deck pile.
+          and puts it in the deck pile, and returns it.
         """
 
     @abstractmethod
@@ -225,6 +368,32 @@ class AbstractHand(ABC):
           have obtained about it.
         """
 
+    @abstractmethod
+    def clone(self) -> "AbstractHand":
+        """
+        Creates a copy of this hand.
+        """
+
+    @abstractmethod
+    def snapshot(self):
+        """
+        Creates a snapshot of the current state.
+        """
+
+    @abstractmethod
+    def restore(self, snapshot) -> None:
+        """
+        Restores the state captured by snapshot.
+        """
+
+    @property
+    @abstractmethod
+    def zobrist_hash(self) -> int:
+        """
+        A hash of the current state, which is kept up to date
+          as it changes (see zobrist).
+        """
+
     @abstractmethod
     def __len__(self) -> int:
         pass
@@ -255,9 +424,10 @@ class AbstractKnowledgeBase(ABC):
         """
 
     @abstractmethod
-    def discard(self, deck: AbstractDeck, n_cards: int):
+    def discard(self, deck: AbstractDeck, n_cards: int) -> Card:
         """
-        Discards n cards from this hand into the deck pile.
+        Discards n cards from this hand into the deck pile,
+          and returns the card discarded.
         """
 
     @abstractmethod
@@ -270,6 +440,13 @@ class AbstractKnowledgeBase(ABC):
     def get_knowledge(self, index: int) -> dict:
         """ """
 
+    @abstractmethod
+    def get_mask(self, index: int) -> int:
+        """
+        Gets the set of cards, which the card at index may be,
+          as a 25-bit mask indexed by card ids.
+        """
+
     @abstractmethod
     def update_knowledge(self, index: int, **new_knowledge):
         """ """
@@ -300,6 +477,39 @@ class AbstractKnowledgeBase(ABC):
           current hand of cards.
         """
 
+    @abstractmethod
+    def remaining_counts(self, deck: AbstractDeck):
+        """
+        Counts the cards that the owner of this knowledge base
+          cannot see, i.e. the cards in the deck and in their hand.
+        """
+
+    @abstractmethod
+    def clone(self) -> "AbstractKnowledgeBase":
+        """
+        Creates a silent copy of this knowledge base (including its hand).
+        """
+
+    @abstractmethod
+    def snapshot(self):
+        """
+        Creates a snapshot of the current state (including the hand).
+        """
+
+    @abstractmethod
+    def restore(self, snapshot) -> None:
+        """
+        Restores the state captured by snapshot.
+        """
+
+    @property
+    @abstractmethod
+    def zobrist_hash(self) -> int:
+        """
+        A hash of the current state, which is kept up to date
+          as it changes (see zobrist).
+        """
+
     @abstractmethod
     def __len__(self) -> int:
         pass
@@ -317,6 +527,14 @@ class AbstractKnowledgeBase(ABC):
     def hand(self) -> AbstractHand:
         """"""
 
+    @property
+    @abstractmethod
+    def masks(self) -> List[int]:
+        """
+        The sets of possible cards of the hand, one 25-bit mask
+          per slot (read-only).
+        """
+
 
 class AbstractGame(ABC):
     """ """
@@ -328,6 +546,12 @@ class AbstractGame(ABC):
           thus affect the state of the game.
         """
 
+    @abstractmethod
+    def start(self) -> None:
+        """
+        Starts the game without playing it, i.e. deals the cards.
+        """
+
     @abstractmethod
     def calculate_points(self) -> int:
         """
@@ -375,6 +599,27 @@ class AbstractGame(ABC):
         Getter for players.
         """
 
+    @property
+    @abstractmethod
+    def rng(self):
+        """
+        The random number generator used by the AIs of the game.
+        """
+
+    @property
+    @abstractmethod
+    def profiler(self):
+        """
+        The profiler recording the phases of the game, if any.
+        """
+
+    @property
+    @abstractmethod
+    def events(self):
+        """
+        The sink of the events emitted by the game.
+        """
+
     @property
     @abstractmethod
     def is_last_round(self):
@@ -383,12 +628,79 @@ class AbstractGame(ABC):
         whether the game is in its last round.
         """
 
+    @property
+    @abstractmethod
+    def last_round_countdown(self) -> int:
+        """
+        The number of turns left after the current one, once the
+          last round has started (see is_last_round).
+        """
+
     @abstractmethod
     def print_game(self, player_id=None, board=True) -> None:
         """
         Pretty(-ish) prints the state of the game.
         """
 
+    @abstractmethod
+    def step(self, move) -> None:
+        """
+        Lets the current player make a move and ends their turn.
+        """
+
+    @abstractmethod
+    def clone(self) -> "AbstractGame":
+        """
+        Creates a silent copy of the game, which can be played
+          without affecting this game.
+        """
+
+    @abstractmethod
+    def apply_move(self, move: tuple) -> None:
+        """
+        Lets the current player make a move, such that it can be
+          undone by undo_move().
+        """
+
+    @abstractmethod
+    def undo_move(self) -> None:
+        """
+        Undoes the last move made by apply_move().
+        """
+
+    @property
+    @abstractmethod
+    def current_player(self):
+        """
+        The player whose turn it is.
+        """
+
+    @abstractmethod
+    def record_move(self, player_id: int, move: tuple | None) -> None:
+        """
+        Records the move a player is about to make.
+        """
+
+    @property
+    @abstractmethod
+    def history(self) -> list:
+        """
+        The moves made so far as pairs of the player id and the move.
+        """
+
+    @abstractmethod
+    def state_hash(self) -> int:
+        """
+        A hash of the full state of the game, e.g. for transposition tables.
+        """
+
+    @abstractmethod
+    def information_set_hash(self, player_id: int) -> int:
+        """
+        A hash of the state of the game as seen by a player, which
+          is equal for all states the player cannot tell apart.
+        """
+
 
 class AbstractPlayer(ABC):
     """
@@ -405,6 +717,12 @@ class AbstractPlayer(ABC):
           as to how to affect the state of the game.
         """
 
+    @abstractmethod
+    def clone(self) -> "AbstractPlayer":
+        """
+        Creates a copy of this player with a copy of their knowledge base.
+        """
+
     def play_card(self, board, card_index=1):
         self.knowledgebase.play_card(board, card_index)
 
@@ -435,10 +753,12 @@ class AbstractPlayer(ABC):
             for player_index in game.get_player_indices(exclude_id=self.player_id):
                 other_player_hand = game.players[player_index].knowledgebase.hand
 
-                for colour in set(card.colour for card in other_player_hand):
+                # Deduplicate in hand order, such that the order of the moves
+                # does not depend on the (per-process) hashing of colours.
+                for colour in dict.fromkeys(card.colour for card in other_player_hand):
                     yield (Action.INFO, player_index, colour)
 
-                for value in set(card.value for card in other_player_hand):
+                for value in dict.fromkeys(card.value for card in other_player_hand):
                     yield (Action.INFO, player_index, value)
 
     @property
@@ -461,12 +781,31 @@ class AbstractPlayer(ABC):
 PlayerMove = Callable[[AbstractGame, AbstractPlayer], None]
 
 
+@dataclass
+class EngineStats:
+    """
+    The work an AI engine did for its last move.
+    """
+
+    # The number of positions evaluated, e.g. moves scored by a heuristic
+    # or iterations of a search.
+    nodes: int = 0
+    # The seconds spent deciding on the move.
+    elapsed: float = 0.0
+    # Whether the deadline passed before the engine was done.
+    timed_out: bool = False
+
+
 class AbstractAIEngine(ABC):
     """
     The AI engine serves as a common strategy interface for
       various AI algorithms that can aid a consumer of the
       interface in selecting the next move based on its
       implementation of the strategy.
+
+    Engines are anytime algorithms: given a deadline (in terms of
+      time.perf_counter) or a budget of nodes, they stop early and
+      make the best move found so far.
     """
 
     @abstractmethod
@@ -478,25 +817,59 @@ class AbstractAIEngine(ABC):
         pass
 
     @abstractmethod
-    def make_move(self) -> PlayerMove:
+    def make_move(
+        self, deadline: float | None = None, max_nodes: int | None = None
+    ) -> PlayerMove:
         """
-        Runs the algorithm to decide the best possible move.
+        Runs the algorithm to decide the best possible move, until
+          the deadline passes or max_nodes positions are evaluated.
 
         :returns: A move function that updates the game.
         """
 
+    @abstractmethod
+    def best_move(self) -> tuple | None:
+        """
+        The best move found so far, which may be queried while
+          make_move() is running, e.g. from another thread.
+
+        :returns: The move, or None if no move has been found yet.
+        """
+
+    @property
+    @abstractmethod
+    def stats(self) -> EngineStats:
+        """
+        The work done for the last (or current) move.
+        """
+
     @abstractmethod
     def selection(self) -> tuple:
-        """ """
+        """
+        Descends the search tree to a node that is not fully expanded.
+
+        :returns: The selected node and the state of the game at that node.
+        """
 
     @abstractmethod
-    def expansion(self, parent, state: AbstractGame) -> bool:
-        """ """
+    def expansion(self, parent, state: AbstractGame):
+        """
+        Adds a child to parent for a move that has not been tried yet and
+          makes that move in state.
+
+        :returns: The new child, or None if parent cannot be expanded.
+        """
 
     @abstractmethod
-    def simulation(self, state: AbstractGame, node):
-        """ """
+    def simulation(self, state: AbstractGame, node) -> float:
+        """
+        Plays out the game from state until it is over.
+
+        :returns: The outcome of the game.
+        """
 
     @abstractmethod
-    def update(self, node, outcome: int):
-        """ """
+    def update(self, node, outcome: float):
+        """
+        Propagates the outcome of a simulation from node to the root.
+        """
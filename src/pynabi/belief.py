@@ -0,0 +1,130 @@
+"""
+Vectorized beliefs about the cards in a hand, backed by NumPy.
+
+NumPy is an optional dependency (install the 'numpy' extra). All functions
+  work on all slots of a hand at once: the beliefs of a hand are a
+  (slots x 25) matrix, where entry (i, j) is the probability that the card
+  in slot i is the card with id j.
+"""
+
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+from .base import COLOURS, AbstractBoard, AbstractGame, AbstractPlayer
+from .counting import CardCounts
+from .engine import ProbabilisticEngine
+
+# The value (1-5) and colour index (0-4) of each card id.
+_VALUES = None if np is None else np.tile(np.arange(1, 6), 5)
+_COLOUR_INDICES = None if np is None else np.repeat(np.arange(5), 5)
+_BITS = None if np is None else np.arange(25)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "The belief module requires NumPy - install pynabi with the 'numpy' extra."
+        )
+
+
+def remaining_vector(counts: CardCounts):
+    """
+    Converts card counts to a vector indexed by card id.
+    """
+    _require_numpy()
+    return np.array(counts.table, dtype=np.float64)
+
+
+def mask_matrix(masks: List[int]):
+    """
+    Unpacks the possibility masks of a hand into a (slots x 25) 0/1 matrix.
+    """
+    _require_numpy()
+    return (np.array(masks, dtype=np.int64)[:, None] >> _BITS) & 1
+
+
+def belief_matrix(remaining, masks: List[int]):
+    """
+    Calculates the probability of each card for each slot of a hand,
+      given the remaining counts and the possibility masks of the slots.
+    """
+    weights = mask_matrix(masks) * remaining
+    totals = weights.sum(axis=1, keepdims=True)
+    return np.divide(weights, totals, out=np.zeros_like(weights), where=totals > 0)
+
+
+def pile_vector(board: AbstractBoard):
+    """
+    The height of the pile of each card's colour, indexed by card id.
+    """
+    _require_numpy()
+    piles = np.array([board[colour] for colour in COLOURS])
+    return piles[_COLOUR_INDICES]
+
+
+def play_score_table(board: AbstractBoard):
+    """
+    Vectorized board.play_score for every card id.
+    """
+    piles = pile_vector(board)
+    penalty = board.tokens.fuse_tokens - 4
+    scores = np.where(_VALUES == 5, 5, 1)
+    return np.where(piles + 1 == _VALUES, scores, penalty)
+
+
+def potential_score_table(board: AbstractBoard, remaining):
+    """
+    Vectorized probability.potential_score for every card id.
+
+    The number of possible copies of a card is the same for all slots
+      that may hold it, namely its remaining count.
+    """
+    piles = pile_vector(board)
+    last_copy = np.where(_VALUES == 5, -2, -1)
+    scores = np.where((_VALUES > piles) & (remaining == 1), last_copy, 0)
+    return np.where(_VALUES < piles, 1, scores)
+
+
+def hand_beliefs(game: AbstractGame, player: AbstractPlayer):
+    """
+    Calculates the beliefs of a player about their own hand.
+    """
+    kb = player.knowledgebase
+    remaining = remaining_vector(kb.remaining_counts(game.deck))
+    return belief_matrix(remaining, kb.masks)
+
+
+class VectorizedProbabilisticEngine(ProbabilisticEngine):
+    """
+    The ProbabilisticEngine, where the heuristics for playing and
+    discarding are computed for all cards of the hand at once.
+
+    The heuristics are the means over all possible cards of a slot of
+    probability times score, i.e. the sum over the card ids of the
+    squared beliefs times the scores.
+    """
+
+    def make_move(self, deadline=None, max_nodes=None):
+        _require_numpy()
+
+        kb = self._player.knowledgebase
+        board = self._game.board
+
+        remaining = remaining_vector(kb.remaining_counts(self._game.deck))
+        squared = belief_matrix(remaining, kb.masks) ** 2
+
+        self._play_scores = squared @ play_score_table(board)
+        self._discard_scores = squared @ potential_score_table(board, remaining)
+
+        return super().make_move(deadline, max_nodes)
+
+    def _play_card_heuristic(self, card_index: int) -> float:
+        return float(self._play_scores[card_index])
+
+    def _discard_heuristic(self, card_index: int) -> float:
+        delta_t = 1 if self._game.board.tokens.hint_tokens < 8 else 0
+        return delta_t * float(self._discard_scores[card_index])
@@ -1,23 +1,40 @@
 from typing import List
 
-from .base import CardColour, Card, AbstractTokens, AbstractBoard
+from .base import COLOURS, CardColour, Card, AbstractTokens, AbstractBoard
+from .events import NULL_SINK, CardPlayed, EventSink
 from .exceptions import GameIsWon
+from .zobrist import MASK, PILES, PLAYED, hash_pile
+
+_PILE_KEYS = dict(zip(COLOURS, PILES))
 
 
 class HanabiBoard(AbstractBoard):
-    def __init__(self, tokens: AbstractTokens) -> None:
+    def __init__(self, tokens: AbstractTokens, events: EventSink = NULL_SINK) -> None:
         self._piles = {colour: 0 for colour in iter(CardColour)}
         self._tokens = tokens
+        self._events = events
         self._played_cards: List[Card] = []
+        # Whether the played cards are shared with a clone (copy-on-write).
+        self._shared = False
+        # The hashes of the piles and of the played cards (see zobrist).
+        self._piles_hash = self._hash_piles()
+        self._played_hash = 0
 
     def play_card(self, card: Card):
+        self._copy_on_write()
+
         match (self._piles[card.colour], card.value):
             case (current, new) if new == current + 1 and new <= 5:
                 self._piles[card.colour] = new
+                keys = _PILE_KEYS[card.colour]
+                self._piles_hash ^= keys[current] ^ keys[new]
+                self._events.emit(CardPlayed(card, is_valid=True))
             case _:
+                self._events.emit(CardPlayed(card, is_valid=False))
                 self._tokens.use_fuse_token()
 
         self._played_cards.append(card)
+        self._played_hash = self._played_hash + PLAYED[card.id] & MASK
 
         if self._is_board_complete():
             raise GameIsWon
@@ -45,6 +62,57 @@ class HanabiBoard(AbstractBoard):
 
         return -(3 - (self.tokens.fuse_tokens - 1))
 
+    def clone(self) -> "HanabiBoard":
+        """
+        Creates a silent copy of this board (including its tokens).
+
+        The played cards are only copied once either board plays a card.
+        """
+        board = HanabiBoard(self._tokens.clone())
+        board._piles = dict(self._piles)
+        board._played_cards = self._played_cards
+        board._shared = self._shared = True
+        board._piles_hash = self._piles_hash
+        board._played_hash = self._played_hash
+        return board
+
+    def snapshot(self) -> tuple:
+        return (
+            tuple(self._piles.values()),
+            len(self._played_cards),
+            self._tokens.snapshot(),
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        piles, n_played, tokens = snapshot
+
+        self._copy_on_write()
+        self._piles = dict(zip(self._piles, piles))
+        self._piles_hash = self._hash_piles()
+        removed = hash_pile(PLAYED, self._played_cards[n_played:])
+        self._played_hash = self._played_hash - removed & MASK
+        del self._played_cards[n_played:]
+        self._tokens.restore(tokens)
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        The hash of the piles, the played cards and the tokens.
+        """
+        return self._piles_hash ^ self._played_hash ^ self._tokens.zobrist_hash
+
+    def _hash_piles(self) -> int:
+        h = 0
+        for colour, height in self._piles.items():
+            h ^= _PILE_KEYS[colour][height]
+
+        return h
+
+    def _copy_on_write(self) -> None:
+        if self._shared:
+            self._played_cards = list(self._played_cards)
+            self._shared = False
+
     def _is_board_complete(self) -> bool:
         return all(v == 5 for v in self._piles.values())
 
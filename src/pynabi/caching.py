@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Dict, Hashable
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class HeuristicCache:
+    """
+    A bounded cache of heuristic values, which evicts the least
+      recently used value when it is full.
+
+    The key of a value must capture everything the value depends on,
+      e.g. the possible cards of a slot and the piles on the board,
+      such that it can be shared across turns and games.
+    """
+
+    def __init__(self, maxsize: int = 1 << 16) -> None:
+        if maxsize < 1:
+            raise ValueError(f"Invalid cache size: {maxsize}")
+
+        self._maxsize = maxsize
+        # Dictionaries keep the insertion order, so the first key is
+        # always the least recently used one.
+        self._values: Dict[Hashable, float] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> float | None:
+        """
+        Gets the value of the key, if it is cached.
+        """
+        values = self._values
+        value = values.pop(key, None)
+        if value is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        values[key] = value
+        return value
+
+    def put(self, key: Hashable, value: float) -> float:
+        """
+        Caches the value of the key, and returns the value.
+        """
+        values = self._values
+        values[key] = value
+        if len(values) > self._maxsize:
+            del values[next(iter(values))]
+
+        return value
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._hits = self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, len(self._values), self._maxsize)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+# The cache shared by all engines (of a process), which do not
+# bring their own.
+HEURISTIC_CACHE = HeuristicCache()
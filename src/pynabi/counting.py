@@ -0,0 +1,111 @@
+from typing import Iterable, Iterator, Tuple
+
+from .base import CARDS, COLOURS, Card, CardColour
+
+
+class CardCounts:
+    """
+    A table of the number of cards of each colour and value
+      in some collection of cards.
+
+    The table is indexed by the compact ids of the cards, so unlike
+      a list of cards, counting the cards of a kind and the total number
+      of cards are constant time operations.
+    """
+
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        self._counts = [0] * 25
+        self._total = 0
+
+        for card in cards:
+            self._counts[card.id] += 1
+            self._total += 1
+
+    def add(self, card: Card, n: int = 1) -> None:
+        self._counts[card.id] += n
+        self._total += n
+
+    def remove(self, card: Card, n: int = 1) -> None:
+        if self._counts[card.id] < n:
+            raise ValueError(f"Cannot remove {n} of {card} from the counts")
+
+        self._counts[card.id] -= n
+        self._total -= n
+
+    def count(self, card: Card) -> int:
+        return self._counts[card.id]
+
+    def matching(
+        self, colour: CardColour | None = None, value: int | None = None
+    ) -> "CardCounts":
+        """
+        Creates the counts of the cards with the given colour and/or value.
+        """
+        if colour is None:
+            colours = range(5)
+        else:
+            colours = range(COLOURS.index(colour), COLOURS.index(colour) + 1)
+
+        values = range(5) if value is None else range(value - 1, value)
+
+        counts = CardCounts()
+        for c in colours:
+            for v in values:
+                i = 5 * c + v
+                counts._counts[i] = n = self._counts[i]
+                counts._total += n
+
+        return counts
+
+    def masked(self, mask: int) -> "CardCounts":
+        """
+        Creates the counts of the cards in the given set (see masks).
+        """
+        counts = CardCounts()
+        for i, n in enumerate(self._counts):
+            if n and mask >> i & 1:
+                counts._counts[i] = n
+                counts._total += n
+
+        return counts
+
+    def items(self) -> Iterator[Tuple[Card, int]]:
+        """
+        Iterates over the distinct cards and their counts.
+        """
+        for i, n in enumerate(self._counts):
+            if n:
+                yield CARDS[i], n
+
+    def copy(self) -> "CardCounts":
+        counts = CardCounts()
+        counts._counts = list(self._counts)
+        counts._total = self._total
+        return counts
+
+    @property
+    def table(self) -> list:
+        """
+        The counts indexed by card id (read-only).
+        """
+        return self._counts
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __iter__(self) -> Iterator[Card]:
+        """
+        Iterates over all the cards, that is, with repetitions.
+        """
+        for card, n in self.items():
+            for _ in range(n):
+                yield card
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CardCounts):
+            return NotImplemented
+
+        return self._counts == other._counts
+
+    def __repr__(self) -> str:
+        return f"CardCounts({dict(self.items())})"
@@ -1,11 +1,13 @@
+import random
 from itertools import product
-from random import shuffle
-from typing import List
+from typing import List, Sequence
 
-from .base import Card, CardColour
+from .base import CARDS, AbstractDeck, Card, CardColour, card_id
+from .counting import CardCounts
+from .zobrist import DECK, DECK_SIZES, DISCARDED, MASK, hash_deck, hash_pile
 
 
-class HanabiDeck:
+class HanabiDeck(AbstractDeck):
     """
     A standard Hanabi Deck contains the following distribution of cards:
 
@@ -13,16 +15,40 @@ class HanabiDeck:
     - 1 x Value 5 for all five colors
 
     That is, there are 45 cards in total.
+
+    The deck is shuffled by the given random number generator, if any,
+      such that a deal can be reproduced from a seed. Alternatively, the
+      exact order of the cards may be given, where cards are drawn from
+      the end of the list.
     """
 
-    def __init__(self, do_shuffle=True):
-        cards = self.create_deck()
+    def __init__(
+        self,
+        do_shuffle=True,
+        rng: random.Random | None = None,
+        cards: List[Card] | None = None,
+    ):
+        if cards is None:
+            cards = self.create_deck()
 
-        if do_shuffle:
-            shuffle(cards)
+            if do_shuffle:
+                (rng or random).shuffle(cards)
 
         self._cards = list(cards)
-        self._discarded = []
+        self._counts = CardCounts(self._cards)
+        self._discarded: List[Card] = []
+        # Whether the lists of cards are shared with a clone (copy-on-write).
+        self._shared = False
+        # The hashes of the order of the cards and of the discarded cards.
+        self._cards_hash = hash_deck(self._cards)
+        self._discarded_hash = 0
+
+    @staticmethod
+    def from_ids(ids: Sequence[int]) -> "HanabiDeck":
+        """
+        Creates a deck with the cards in the given order (by card id).
+        """
+        return HanabiDeck(cards=[CARDS[i] for i in ids])
 
     def create_deck(self) -> List[Card]:
         """
@@ -31,7 +57,59 @@ class HanabiDeck:
         fives = list(product((5,), iter(CardColour)))
         ones_to_fours = list(product(range(1, 5), iter(CardColour)))
         all_cards = 2 * ones_to_fours + fives
-        return [Card(value=value, colour=colour) for value, colour in all_cards]
+        return [CARDS[card_id(value, colour)] for value, colour in all_cards]
+
+    def clone(self) -> "HanabiDeck":
+        """
+        Creates a copy of this deck. The cards themselves are immutable
+          and thus shared with the copy, while the lists of cards are
+          only copied once either deck changes.
+        """
+        deck = HanabiDeck.__new__(HanabiDeck)
+        deck._cards = self._cards
+        deck._counts = self._counts
+        deck._discarded = self._discarded
+        deck._shared = self._shared = True
+        deck._cards_hash = self._cards_hash
+        deck._discarded_hash = self._discarded_hash
+        return deck
+
+    def replace(self, cards: List[Card]) -> None:
+        """
+        Replaces the cards left in the deck, e.g. with a resampled order.
+        """
+        self._cards = list(cards)
+        self._counts = CardCounts(self._cards)
+        self._cards_hash = hash_deck(self._cards)
+
+    def snapshot(self) -> tuple:
+        """
+        Creates a snapshot, which the deck can be restored to, as long as
+          at most a single card has been drawn since.
+        """
+        top = self._cards[-1] if self._cards else None
+        return len(self._cards), top, len(self._discarded)
+
+    def restore(self, snapshot: tuple) -> None:
+        n_cards, top, n_discarded = snapshot
+
+        self._copy_on_write()
+
+        if len(self._cards) < n_cards:
+            self._cards_hash ^= DECK[len(self._cards)][top.id]
+            self._cards.append(top)
+            self._counts.add(top)
+
+        removed = hash_pile(DISCARDED, self._discarded[n_discarded:])
+        self._discarded_hash = self._discarded_hash - removed & MASK
+        del self._discarded[n_discarded:]
+
+    def _copy_on_write(self) -> None:
+        if self._shared:
+            self._cards = list(self._cards)
+            self._counts = self._counts.copy()
+            self._discarded = list(self._discarded)
+            self._shared = False
 
     def __iter__(self):
         yield from self._cards
@@ -43,11 +121,43 @@ class HanabiDeck:
         """
         Try drawing a card from the deck.
         """
-        return self._cards.pop() if self._cards else None
+        if not self._cards:
+            return None
+
+        self._copy_on_write()
+        card = self._cards.pop()
+        self._counts.remove(card)
+        self._cards_hash ^= DECK[len(self._cards)][card.id]
+        return card
 
     def discard(self, *cards):
+        self._copy_on_write()
         self._discarded += list(cards)
+        self._discarded_hash = self._discarded_hash + hash_pile(DISCARDED, cards) & MASK
+
+    @property
+    def counts(self) -> CardCounts:
+        """
+        The number of cards of each kind left in the deck.
+        """
+        return self._counts
 
     @property
     def discarded_pile(self) -> list:
         return self._discarded
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        The hash of the cards left in the deck (in order) and
+          the discarded cards.
+        """
+        return self._cards_hash ^ self._discarded_hash
+
+    @property
+    def public_hash(self) -> int:
+        """
+        The hash of what every player knows about the deck, i.e.
+          the number of cards left and the discarded cards.
+        """
+        return DECK_SIZES[len(self._cards)] ^ self._discarded_hash
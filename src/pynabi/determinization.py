@@ -0,0 +1,199 @@
+"""
+Sampling the hidden information of a player, i.e. their own hand and
+  the order of the deck, for searches over determinizations of a game.
+"""
+
+import random
+from typing import List, Tuple
+
+from .base import CARDS, AbstractGame, AbstractPlayer, Card
+
+
+def _falling_factorial(n: int, k: int) -> int:
+    result = 1
+    for i in range(k):
+        result *= n - i
+
+    return result
+
+
+class DeterminizationSampler:
+    """
+    Samples the hands, which a player may hold given their knowledge,
+      along with the order of the rest of the cards they cannot see.
+
+    Every copy of a card is equally likely to be in the hand, thus a hand
+      is sampled with a probability proportional to the number of ways to
+      pick its cards from the unseen cards (see KnowledgeBase.remaining_counts,
+      which are the cards not known from probability._get_known_cards).
+
+    The number of ways to complete a partial hand is counted once, by
+      assigning each kind of card to a set of slots at a time, such that
+      hands can be sampled slot by slot without ever being rejected.
+    """
+
+    def __init__(
+        self,
+        game: AbstractGame,
+        player: AbstractPlayer,
+        rng: random.Random | None = None,
+    ) -> None:
+        kb = game.players[player.player_id].knowledgebase
+
+        self._game = game
+        self._player_id = player.player_id
+        self._rng = rng or game.rng
+        self._remaining = kb.remaining_counts(game.deck).table
+        self._n_slots = len(kb.masks)
+
+        # The unseen cards sorted by id, where the copies of a card
+        # start at the offset of its id.
+        self._unseen = [
+            CARDS[i] for i, n in enumerate(self._remaining) for _ in range(n)
+        ]
+        self._offsets = [0] * 25
+        for i in range(1, 25):
+            self._offsets[i] = self._offsets[i - 1] + self._remaining[i - 1]
+
+        # The kinds of cards, which may be in the hand, along with the
+        # sets of slots that each kind may be assigned to at once (as
+        # bitsets over the slots), weighted by the ways to pick copies.
+        self._kinds: List[Tuple[int, int, List[Tuple[int, int]]]] = []
+        for i, n in enumerate(self._remaining):
+            slots = sum(1 << j for j, mask in enumerate(kb.masks) if mask >> i & 1)
+            if n and slots:
+                self._kinds.append((i, slots, self._assignments(slots, n)))
+
+        self._completions = self._count_completions()
+        if not self._completions[0][0]:
+            raise ValueError("The knowledge is inconsistent with the unseen cards")
+
+    @staticmethod
+    def _assignments(slots: int, n: int) -> List[Tuple[int, int]]:
+        """
+        The subsets of the slots with at most n slots, and the number
+          of ways to assign n copies of a card to them.
+        """
+        assignments = []
+        subset = slots
+        while subset:
+            k = subset.bit_count()
+            if k <= n:
+                assignments.append((subset, _falling_factorial(n, k)))
+            subset = (subset - 1) & slots
+
+        assignments.append((0, 1))
+        return assignments
+
+    def _count_completions(self) -> List[List[int]]:
+        """
+        Counts the ways to fill the rest of the hand with the kinds from
+          k onwards, indexed by k and the set of filled slots.
+        """
+        full = (1 << self._n_slots) - 1
+        last = [0] * (full + 1)
+        last[full] = 1
+        completions = [last]
+
+        for _, _, assignments in reversed(self._kinds):
+            counts = completions[-1]
+            completions.append(
+                [
+                    sum(
+                        w * counts[filled | subset]
+                        for subset, w in assignments
+                        if not filled & subset
+                    )
+                    for filled in range(full + 1)
+                ]
+            )
+
+        completions.reverse()
+        return completions
+
+    @property
+    def n_hands(self) -> int:
+        """
+        The number of hands the player may hold, where copies of
+          a card are told apart.
+        """
+        return self._completions[0][0]
+
+    def sample_hand(self) -> List[Card]:
+        """
+        Samples the cards of the hand, in the order of the slots.
+        """
+        full = (1 << self._n_slots) - 1
+        hand: list = [None] * self._n_slots
+        filled = 0
+
+        # A single random number picks the hand among all of them: at each
+        # kind, it picks the block of hands with the same assignment, and
+        # its offset within that block is carried on to the next kind.
+        r = self._rng.randrange(self.n_hands)
+
+        for k, (i, slots, assignments) in enumerate(self._kinds):
+            if filled == full:
+                break
+            if not slots & ~filled:
+                continue
+
+            counts = self._completions[k + 1]
+            for subset, w in assignments:
+                if filled & subset:
+                    continue
+
+                block = w * counts[filled | subset]
+                if r < block:
+                    r //= w
+                    break
+                r -= block
+
+            filled |= subset
+            while subset:
+                low = subset & -subset
+                hand[low.bit_length() - 1] = CARDS[i]
+                subset ^= low
+
+        return hand
+
+    def sample(self) -> Tuple[List[Card], List[Card]]:
+        """
+        Samples the cards of the hand and the order of the deck.
+        """
+        hand = self.sample_hand()
+
+        # Take a copy of each card of the hand out of the unseen cards, by
+        # moving the last card into its place (the deck is shuffled anyway).
+        # Copies of the same card are adjacent, thus positions are distinct.
+        offsets = self._offsets
+        taken: dict = {}
+        positions = []
+        for card in hand:
+            k = taken.get(card.id, 0)
+            taken[card.id] = k + 1
+            positions.append(offsets[card.id] + k)
+
+        positions.sort(reverse=True)
+
+        deck = list(self._unseen)
+        for position in positions:
+            deck[position] = deck[-1]
+            deck.pop()
+
+        self._rng.shuffle(deck)
+        return hand, deck
+
+    def determinize(self) -> AbstractGame:
+        """
+        Creates a copy of the game with a sampled hand and deck.
+        """
+        state = self._game.clone()
+        hand, deck = self.sample()
+
+        own_hand = state.players[self._player_id].knowledgebase.hand
+        for i, card in enumerate(hand):
+            own_hand[i] = card
+
+        state.deck.replace(deck)
+        return state
@@ -1,24 +1,33 @@
-from copy import deepcopy
+import math
 import random
-from statistics import fmean
 import time
-from typing import Type
+from typing import Callable, Type
 
 from .base import (
+    COLOURS,
     Action,
     CardColour,
     HanabiGameState,
     AbstractAIEngine,
     AbstractGame,
+    EngineStats,
+    AbstractKnowledgeBase,
     AbstractPlayer,
     PlayerMove,
 )
 
-from .algorithms import Node
+from .algorithms import Node, select_child
+from .caching import HEURISTIC_CACHE, HeuristicCache
+from .determinization import DeterminizationSampler
 from .exceptions import GameIsWon, GameIsOver
+from .parallel import evaluate_leaf, get_pool, search_root
+from .counting import CardCounts
+from .profiling import Profiler
+from .rollout import RolloutPolicy, RolloutState, default_policy, play_to_end
 from .probability import (
-    get_possible_cards,
+    get_possible_card_counts,
     card_probability,
+    mean_over,
     potential_score,
 )
 
@@ -26,40 +35,79 @@ from .probability import (
 AIEngineType = Type[AbstractAIEngine]
 
 
-def create_move(move: tuple | None) -> PlayerMove:
+def _draw(game: AbstractGame, player: AbstractPlayer) -> None:
+    player.draw(game.deck)
+
+
+def _safe_move(moves: list) -> tuple | None:
+    """
+    A move of the given legal moves, which cannot cost a fuse token,
+      i.e. a hint or else a discard, for an engine without a better one.
+    """
+    for action in (Action.INFO, Action.DISCARD):
+        for move in moves:
+            if move[0] == action:
+                return move
+
+    return moves[0] if moves else None
+
+
+class RecordedMove:
+    """
+    A player move, which keeps the move it makes as the 'move' attribute
+      (see create_move).
+    """
+
+    __slots__ = ("_make", "move")
+
+    def __init__(self, make: PlayerMove, move: tuple) -> None:
+        self._make = make
+        self.move = move
+
+    def __call__(self, game: AbstractGame, player: AbstractPlayer) -> None:
+        self._make(game, player)
+
+
+def create_move(move: tuple | None, profiler: Profiler | None = None) -> RecordedMove:
+    """
+    Creates the function, which makes the given move in a game.
+
+    If a profiler is given, the time spent drawing a new card is recorded.
+      The move itself is kept as the 'move' attribute of the result,
+      such that it can be recorded (see events.MoveMade).
+    """
+    draw = _draw if profiler is None else profiler.timed("draw", _draw)
+
     match move:
         case [Action.PLAY, card_index]:
 
             def _move(game, player):
                 player.play_card(game.board, card_index)
-                player.draw(game.deck)
+                draw(game, player)
 
-            return _move
         case [Action.DISCARD, card_index]:
 
             def _move(game, player):
                 player.discard(game, card_index)
-                player.draw(game.deck)
+                draw(game, player)
 
-            return _move
         case [Action.INFO, player_id, int(info)]:
 
             def _move(game, _):
                 game.players[player_id].knowledgebase.reveal_value(info)
                 game.board.tokens.use_hint_token()
 
-            return _move
-
         case [Action.INFO, player_id, CardColour() as info]:
 
             def _move(game, _):
                 game.players[player_id].knowledgebase.reveal_colour(info)
                 game.board.tokens.use_hint_token()
 
-            return _move
         case _:
             raise ValueError(f"Cannot construct move from {move}")
 
+    return RecordedMove(_move, move)
+
 
 class DummyAI(AbstractAIEngine):
     """
@@ -75,11 +123,15 @@ class DummyAI(AbstractAIEngine):
     ):
         self._game = game
         self._player = player
+        self._stats = EngineStats()
 
-    def make_move(self) -> PlayerMove:
+    def make_move(
+        self, deadline: float | None = None, max_nodes: int | None = None
+    ) -> PlayerMove:
         """
         Decides on the 'best' move. This AI always tries to discard a card.
         """
+        self._stats = EngineStats(nodes=1)
 
         def _move(game: AbstractGame, player: AbstractPlayer):
             player.discard(game.deck, n_cards=1)
@@ -87,6 +139,14 @@ class DummyAI(AbstractAIEngine):
 
         return _move
 
+    def best_move(self) -> tuple | None:
+        # The move is not a move of create_move.
+        return None
+
+    @property
+    def stats(self) -> EngineStats:
+        return self._stats
+
     def selection(self):
         """ """
 
@@ -115,26 +175,109 @@ class ProbabilisticEngine(AbstractAIEngine):
     knowledge it has about its own hand and observing the
     cards of the other players along with the discarded/played
     cards.
+
+    The heuristics for playing and discarding only depend on the
+    possible cards of a slot, the piles and the tokens, so their
+    values are memoized in a cache shared across turns and games,
+    unless the cache is None.
     """
 
     def __init__(
         self,
         game: AbstractGame,
         player: AbstractPlayer,
+        cache: HeuristicCache | None = HEURISTIC_CACHE,
     ):
         self._game = game
         self._player = player
-
-    def make_move(self) -> PlayerMove:
+        self._cache = cache
+        self._remaining: CardCounts | None = None
+        self._context: tuple = ()
+        self._best_move: tuple | None = None
+        self._stats = EngineStats()
+
+    def make_move(
+        self, deadline: float | None = None, max_nodes: int | None = None
+    ) -> PlayerMove:
         """
         Decides on the 'best' move.
 
-        This AI uses a probabilistic heuristic.
+        This AI uses a probabilistic heuristic. It scores the legal moves
+          one by one, so given a deadline or a budget, it picks the best
+          of the moves it managed to score (at least one).
         """
+        start = time.perf_counter()
+        self._best_move = None
+        self._stats = EngineStats()
+
+        # The unseen cards are the same for all moves, so count them once.
+        remaining = self._player.knowledgebase.remaining_counts(self._game.deck)
+        self._remaining = remaining
+        board = self._game.board
+        self._context = (
+            tuple(remaining.table),
+            tuple(board[colour] for colour in COLOURS),
+            board.tokens.fuse_tokens,
+        )
 
-        best_move = max(self._player.get_legal_moves(self._game), key=self._heurisitic)
+        profiler = self._game.profiler
+        if profiler is None:
+            moves = list(self._player.get_legal_moves(self._game))
+            self._choose(moves, self._heurisitic, deadline, max_nodes)
+        else:
+            with profiler.phase("legal_moves"):
+                moves = list(self._player.get_legal_moves(self._game))
+
+            with profiler.phase("heuristics"):
+                self._choose(moves, self._profiled_heuristic, deadline, max_nodes)
 
-        return create_move(best_move)
+        self._stats.elapsed = time.perf_counter() - start
+        return create_move(self._best_move, profiler)
+
+    def _choose(
+        self,
+        moves: list,
+        heuristic: Callable[[tuple], float],
+        deadline: float | None,
+        max_nodes: int | None,
+    ) -> None:
+        """
+        Scores the moves in order and keeps the first one of the highest
+          score, until either the deadline or the budget is exceeded.
+        """
+        stats = self._stats
+        best_value = -math.inf
+
+        for move in moves:
+            if stats.nodes:
+                if max_nodes is not None and stats.nodes >= max_nodes:
+                    break
+                if deadline is not None and time.perf_counter() > deadline:
+                    stats.timed_out = True
+                    break
+
+            value = heuristic(move)
+            stats.nodes += 1
+            if self._best_move is None or value > best_value:
+                self._best_move, best_value = move, value
+
+    def best_move(self) -> tuple | None:
+        """
+        The best move scored by the last make_move(), or a safe move
+          before any move has been scored.
+        """
+        if self._best_move is None:
+            return _safe_move(list(self._player.get_legal_moves(self._game)))
+
+        return self._best_move
+
+    @property
+    def stats(self) -> EngineStats:
+        return self._stats
+
+    def _profiled_heuristic(self, move: tuple) -> float:
+        with self._game.profiler.phase(f"heuristic.{move[0].value}"):
+            return self._heurisitic(move)
 
     def _heurisitic(self, move: tuple) -> float:
         match move:
@@ -151,14 +294,14 @@ class ProbabilisticEngine(AbstractAIEngine):
         """
         Calculates the heuristic for playing a card.
         """
-        possible_cards = get_possible_cards(self._game, self._player, card_index)
+        return self._cached(Action.PLAY, card_index, self._play_value)
+
+    def _play_value(self, card_index: int) -> float:
+        possible_cards = self._get_possible_cards(card_index)
         play_score = self._game.board.play_score
-        return fmean(
-            [
-                prob * play_score(card)
-                for card in possible_cards
-                if (prob := card_probability(card, possible_cards))
-            ]
+        return mean_over(
+            possible_cards,
+            lambda card: card_probability(card, possible_cards) * play_score(card),
         )
 
     def _discard_heuristic(self, card_index: int) -> float:
@@ -168,13 +311,41 @@ class ProbabilisticEngine(AbstractAIEngine):
         tokens = self._game.board.tokens.hint_tokens
         delta_t = 1 if tokens < 8 else 0
 
-        possible_cards = get_possible_cards(self._game, self._player, card_index)
-        return delta_t * fmean(
-            [
-                prob * potential_score(card, self._game, possible_cards)
-                for card in possible_cards
-                if (prob := card_probability(card, possible_cards))
-            ]
+        if not delta_t:
+            return 0.0
+
+        return self._cached(Action.DISCARD, card_index, self._discard_value)
+
+    def _discard_value(self, card_index: int) -> float:
+        possible_cards = self._get_possible_cards(card_index)
+        return mean_over(
+            possible_cards,
+            lambda card: card_probability(card, possible_cards)
+            * potential_score(card, self._game, possible_cards),
+        )
+
+    def _cached(
+        self, action: Action, card_index: int, value: Callable[[int], float]
+    ) -> float:
+        """
+        Looks up the value of a heuristic for a card in the cache.
+
+        The key is the possibility mask of the card along with the
+          remaining cards, the piles and the fuse tokens of this turn.
+        """
+        if self._cache is None:
+            return value(card_index)
+
+        key = (action, self._player.knowledgebase.get_mask(card_index), self._context)
+        cached = self._cache.get(key)
+        if cached is None:
+            return self._cache.put(key, value(card_index))
+
+        return cached
+
+    def _get_possible_cards(self, card_index: int) -> CardCounts:
+        return get_possible_card_counts(
+            self._game, self._player, card_index, self._remaining
         )
 
     def _info_heuristic(self, player_id: int, info: int | CardColour) -> float:
@@ -182,9 +353,22 @@ class ProbabilisticEngine(AbstractAIEngine):
         Calculates the heuristic for giving information to another player.
         """
         kb = self._game.players[player_id].knowledgebase
+        if self._cache is None:
+            return self._info_value(kb, info)
+
+        # The value only depends on the hand of the other player and
+        # on what they know about it.
+        key = (Action.INFO, tuple(kb.masks), tuple(card.id for card in kb.hand), info)
+        cached = self._cache.get(key)
+        if cached is None:
+            return self._cache.put(key, self._info_value(kb, info))
+
+        return cached
+
+    def _info_value(self, kb: AbstractKnowledgeBase, info: int | CardColour) -> float:
         old_knowledge = kb.knowledge()
 
-        kb = deepcopy(kb)
+        kb = kb.clone()
         if isinstance(info, CardColour):
             kb.reveal_colour(info)
         else:
@@ -203,3 +387,406 @@ class ProbabilisticEngine(AbstractAIEngine):
 
     def update(self, *_):
         """ """
+
+
+class MCTSEngine(AbstractAIEngine):
+    """
+    An AI that uses Monte Carlo Tree Search (MCTS) with UCB1 to select
+    the move, which leads to the highest expected score.
+
+    In order to respect partial observability, every iteration of the
+    search starts from a determinization of the game: a copy, in which
+    the cards of the player's own hand are resampled from the cards that
+    the player cannot see, such that they are consistent with the
+    knowledge the player has about their hand. The rest of the unseen
+    cards are shuffled to form the deck (see determinization).
+
+    The search stops when either the given number of iterations have been
+    run or the time limit (in seconds) has been exceeded. Simulations are
+    played out by a fast rule-based policy rather than by another engine,
+    on a compact copy of the game (see rollout). Subclasses may replace
+    the policy by setting rollout_policy.
+
+    A move can be searched on several cores (see parallel). Given a number
+    of workers, each worker process searches a tree of its own and the
+    visits at their roots are merged, which is a stronger search in the
+    same time. Given a leaf batch size as well, a single tree is searched,
+    where batches of leaves are played out by the workers at once.
+
+    The engine keeps its tree between moves: the subtree of the moves
+    made since its last search (its own and the other players', see
+    AbstractGame.history) becomes the root of its next search, while
+    the rest of the tree is dropped. Trees searched by several workers
+    from the root are not kept.
+
+    All random choices are made by the given random number generator,
+    which defaults to the one of the game, such that a search can be
+    reproduced from a seed.
+    """
+
+    rollout_policy: RolloutPolicy = staticmethod(default_policy)
+
+    def __init__(
+        self,
+        game: AbstractGame,
+        player: AbstractPlayer,
+        iterations: int = 1000,
+        time_limit: float | None = None,
+        exploration: float = 0.25,
+        rng: random.Random | None = None,
+        workers: int = 1,
+        leaf_batch: int = 1,
+    ):
+        self._game = game
+        self._player = player
+        self._rng = rng or game.rng
+        self._iterations = iterations
+        self._time_limit = time_limit
+        self._exploration = exploration
+        self._workers = workers
+        self._leaf_batch = leaf_batch
+        self._root = Node(move=None)
+        # The number of moves in the history of the game when the tree
+        # was searched, if it can be reused.
+        self._n_moves: int | None = None
+        self._stats = EngineStats()
+
+    def make_move(
+        self, deadline: float | None = None, max_nodes: int | None = None
+    ) -> PlayerMove:
+        """
+        Decides on the 'best' move.
+
+        This AI picks the most visited move at the root of the search tree.
+          The search stops at the earlier of the given deadline and its own
+          time limit, and runs at most max_nodes iterations.
+        """
+        if self._workers > 1 and self._leaf_batch <= 1:
+            self._search_in_parallel(deadline, max_nodes)
+        else:
+            iterations = self._iterations
+            if max_nodes is not None:
+                iterations = min(iterations, max_nodes)
+
+            self.search(deadline, iterations)
+
+        return create_move(self.best_move(), self._game.profiler)
+
+    def best_move(self) -> tuple | None:
+        """
+        The most visited (legal) move at the root of the search tree,
+          or a safe move if no legal move has been visited, e.g. when
+          the search ran out of time before its first iteration.
+        """
+        moves = list(self._player.get_legal_moves(self._game))
+
+        # A reused tree may contain moves, which are no longer legal.
+        children = self._root.children
+        visited = [children[move] for move in moves if move in children]
+        if not visited:
+            return _safe_move(moves)
+
+        return max(visited, key=lambda child: child.visits).move
+
+    @property
+    def stats(self) -> EngineStats:
+        return self._stats
+
+    def _deadline(self, deadline: float | None) -> float | None:
+        """
+        The earlier of the given deadline and the time limit of the engine.
+        """
+        if self._time_limit is None:
+            return deadline
+
+        own_deadline = time.perf_counter() + self._time_limit
+        return own_deadline if deadline is None else min(deadline, own_deadline)
+
+    def search(
+        self, deadline: float | None = None, iterations: int | None = None
+    ) -> None:
+        """
+        Searches the tree from the current state of the game, where the
+          tree of the last search is reused if possible.
+        """
+        start = time.perf_counter()
+        self._stats = stats = EngineStats()
+        deadline = self._deadline(deadline)
+        if iterations is None:
+            iterations = self._iterations
+
+        self._root = self._reuse_root() or Node(move=None)
+        self._n_moves = len(self._game.history)
+        self._sampler = DeterminizationSampler(self._game, self._player, self._rng)
+
+        selection, expansion = self.selection, self.expansion
+        simulation, update = self.simulation, self.update
+        play_out_leaves = self._play_out_leaves
+
+        profiler = self._game.profiler
+        if profiler is not None:
+            selection = profiler.timed("mcts.selection", selection)
+            expansion = profiler.timed("mcts.expansion", expansion)
+            simulation = profiler.timed("mcts.simulation", simulation)
+            play_out_leaves = profiler.timed("mcts.simulation", play_out_leaves)
+            update = profiler.timed("mcts.update", update)
+
+        if self._leaf_batch > 1:
+            self._search_in_batches(
+                deadline, iterations, selection, expansion, play_out_leaves
+            )
+        else:
+            for _ in range(iterations):
+                if deadline is not None and time.perf_counter() > deadline:
+                    stats.timed_out = True
+                    break
+
+                node, state = selection()
+                child = expansion(node, state)
+                if child is not None:
+                    node = child
+
+                update(node, simulation(state, node))
+                stats.nodes += 1
+
+        stats.elapsed = time.perf_counter() - start
+
+    def _reuse_root(self) -> Node | None:
+        """
+        Follows the moves made since the last search down the tree, and
+          detaches the node reached, if any, from the rest of the tree.
+        """
+        if self._n_moves is None:
+            return None
+
+        node = self._root
+        for _, move in self._game.history[self._n_moves :]:
+            child = node.children.get(move) if move is not None else None
+            if child is None:
+                return None
+            node = child
+
+        node.parent = None
+        return node
+
+    def _search_in_batches(
+        self,
+        deadline: float | None,
+        iterations: int,
+        selection: Callable,
+        expansion: Callable,
+        play_out_leaves: Callable,
+    ) -> None:
+        """
+        Runs the iterations in batches, where the leaves of a batch are
+          played out together.
+
+        A leaf is visited as soon as it is selected, as if the play out
+          was lost, such that the selections of a batch spread out over
+          the tree. The outcomes are added once the batch is played out.
+        """
+        stats = self._stats
+        while iterations > 0:
+            if deadline is not None and time.perf_counter() > deadline:
+                stats.timed_out = True
+                break
+
+            leaves = []
+            for _ in range(min(self._leaf_batch, iterations)):
+                node, state = selection()
+                child = expansion(node, state)
+                if child is not None:
+                    node = child
+
+                self.update(node, 0.0)
+                leaves.append((node, state))
+
+            iterations -= len(leaves)
+            stats.nodes += len(leaves)
+
+            outcomes = play_out_leaves([state for _, state in leaves])
+            for (node, _), outcome in zip(leaves, outcomes):
+                while node is not None:
+                    node.wins += outcome
+                    node = node.parent
+
+    def _play_out_leaves(self, states: list) -> list:
+        # Only the compact states are sent to the workers, which are far
+        # cheaper to pickle than the games.
+        rollouts = [RolloutState.from_game(state) for state in states]
+        if self._workers <= 1:
+            return [play_to_end(rollout, self.rollout_policy) for rollout in rollouts]
+
+        chunksize = -(-len(rollouts) // self._workers)
+        return list(
+            get_pool(self._workers).map(
+                evaluate_leaf,
+                [(type(self), rollout) for rollout in rollouts],
+                chunksize=chunksize,
+            )
+        )
+
+    def _search_in_parallel(
+        self, deadline: float | None, max_nodes: int | None
+    ) -> None:
+        """
+        Searches a tree in each worker process, where each worker samples
+          its own determinizations, and merges the visits at their roots.
+
+        Each worker runs the iterations of the engine until the deadline,
+          while a budget of nodes is split between them. The deadline is
+          passed on as is, as the workers share the clock of this process
+          (see time.perf_counter), thus the time spent starting the
+          workers counts as well.
+        """
+        start = time.perf_counter()
+        self._stats = stats = EngineStats()
+        deadline = self._deadline(deadline)
+        iterations = self._iterations
+        if max_nodes is not None:
+            iterations = min(iterations, -(-max_nodes // self._workers))
+
+        root = Node(move=None)
+        self._root = root
+        self._n_moves = None
+
+        # Do not start the workers at all, if there is no time left.
+        if deadline is not None and start > deadline:
+            stats.timed_out = True
+            stats.elapsed = time.perf_counter() - start
+            return
+
+        game = self._game.clone()
+        options = {"iterations": iterations, "exploration": self._exploration}
+        tasks = [
+            (
+                type(self),
+                game,
+                self._player.player_id,
+                options,
+                deadline,
+                self._rng.getrandbits(64),
+            )
+            for _ in range(self._workers)
+        ]
+
+        for children, worker_stats in get_pool(self._workers).map(search_root, tasks):
+            stats.nodes += worker_stats.nodes
+            stats.timed_out |= worker_stats.timed_out
+
+            for move, (visits, wins) in children.items():
+                child = root.children.get(move)
+                if child is None:
+                    child = Node(move=move, parent=root)
+                    root.add_children([child])
+
+                child.visits += visits
+                child.wins += wins
+                root.visits += visits
+                root.wins += wins
+
+        stats.elapsed = time.perf_counter() - start
+
+    @property
+    def root(self) -> Node:
+        """
+        The root of the last search tree.
+        """
+        return self._root
+
+    def selection(self) -> tuple:
+        node = self._root
+        state = self._determinize()
+
+        while state.state == HanabiGameState.Playing:
+            moves = list(state.current_player.get_legal_moves(state))
+            if any(move not in node.children for move in moves):
+                break
+
+            children = [node.children[move] for move in moves]
+            node = select_child(node, children, self._exploration)
+            state.step(create_move(node.move))
+
+        return node, state
+
+    def expansion(self, parent: Node, state: AbstractGame) -> Node | None:
+        if state.state != HanabiGameState.Playing:
+            return None
+
+        player = state.current_player
+        untried = [
+            move
+            for move in player.get_legal_moves(state)
+            if move not in parent.children
+        ]
+        if not untried:
+            return None
+
+        move = self._rng.choice(untried)
+        child = Node(move=move, parent=parent)
+        parent.add_children([child])
+
+        state.step(create_move(move))
+        return child
+
+    def simulation(self, state: AbstractGame, node: Node) -> float:
+        return self.play_out(state)
+
+    @classmethod
+    def play_out(cls, state: AbstractGame) -> float:
+        """
+        Plays out the game by the rollout policy on a compact copy
+          of it, and scores the outcome.
+        """
+        return play_to_end(RolloutState.from_game(state), cls.rollout_policy)
+
+    def update(self, node: Node | None, outcome: float):
+        while node is not None:
+            node.visits += 1
+            node.wins += outcome
+            node = node.parent
+
+    def _determinize(self) -> AbstractGame:
+        """
+        Creates a copy of the game, where the hidden information
+          (the player's own hand and the deck) is resampled.
+        """
+        return self._sampler.determinize()
+
+
+class ISMCTSEngine(MCTSEngine):
+    """
+    An AI that uses Information Set MCTS, i.e. a single search tree
+    shared by all determinizations of the game.
+
+    The legal moves of the other players depend on the sampled hand of
+    the player (as they may hint about it), thus a move is only compared
+    to the moves, which were legal alongside it: its exploration term is
+    based on the number of times it was available rather than on the
+    visits of its parent.
+    """
+
+    def selection(self) -> tuple:
+        node = self._root
+        state = self._determinize()
+
+        while state.state == HanabiGameState.Playing:
+            moves = list(state.current_player.get_legal_moves(state))
+            children = [node.children[move] for move in moves if move in node.children]
+            for child in children:
+                child.available += 1
+
+            if len(children) < len(moves):
+                break
+
+            node = select_child(node, children, self._exploration)
+            state.step(create_move(node.move))
+
+        return node, state
+
+    def expansion(self, parent: Node, state: AbstractGame) -> Node | None:
+        child = super().expansion(parent, state)
+        if child is not None:
+            child.available = 1
+
+        return child
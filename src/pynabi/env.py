@@ -0,0 +1,266 @@
+"""
+Environments for training agents against the rules of Hanabi, in the
+  style of Gym: reset() starts a game, and step() makes a move for the
+  current player and returns the next observation and the reward.
+
+NumPy is an optional dependency (install the 'numpy' extra).
+
+Actions are the integer action ids of the current player (see actions).
+
+Observations are fixed-size vectors from the perspective of the current
+  player (see observation).
+"""
+
+import random
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+from .actions import LegalActions, action_to_move, create_move_from_id, n_actions
+from .base import AbstractGame, HanabiGameState
+from .game import HanabiGame
+from .observation import ObservationBatch, ObservationEncoder, observation_size
+from .simulation import create_game
+
+
+def _legal_mask(game: HanabiGame, legal: LegalActions | None) -> int:
+    """
+    The legal actions of the current player as a bitset (see actions).
+    """
+    if legal is None or game.state != HanabiGameState.Playing:
+        return 0
+    return legal.mask()
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "The env module requires NumPy - install pynabi with the 'numpy' extra."
+        )
+
+
+class HanabiEnv:
+    """
+    A single game of Hanabi, played one move at a time.
+
+    The reward of a move is the number of points it adds to the board.
+      Since a lost game is worth nothing, the move losing the game takes
+      back all the points, such that the return of a game is its score.
+    """
+
+    def __init__(self, n_players: int = 3) -> None:
+        _require_numpy()
+
+        self._n_players = n_players
+        self._rng = random.Random()
+        self._game: HanabiGame | None = None
+        self._encoder = ObservationEncoder(n_players)
+        self._legal: LegalActions | None = None
+
+        self._observation = np.zeros(observation_size(n_players), dtype=np.float32)
+        self._legal_actions = np.zeros(n_actions(n_players), dtype=bool)
+        self._action_bits = np.arange(n_actions(n_players))
+
+    @property
+    def n_actions(self) -> int:
+        return len(self._legal_actions)
+
+    @property
+    def observation_size(self) -> int:
+        return len(self._observation)
+
+    @property
+    def game(self) -> AbstractGame:
+        return self._started_game()
+
+    def reset(self, seed: int | None = None) -> Tuple[object, dict]:
+        """
+        Starts a new game. A seed given reseeds the environment, such that
+          it plays the same sequence of games again.
+        """
+        self._reset(seed)
+        return self._observation.copy(), self._info()
+
+    def step(self, action: int) -> Tuple[object, int, bool, bool, dict]:
+        """
+        Makes a move for the current player and returns the observation
+          of the next player, the reward, and whether the game has ended.
+        """
+        reward, terminated = self._step(action)
+        return self._observation.copy(), reward, terminated, False, self._info()
+
+    @property
+    def score(self) -> int:
+        """
+        The score of the game so far, where a lost game is worth nothing.
+        """
+        game = self._started_game()
+        if game.state == HanabiGameState.Lost:
+            return 0
+        return game.calculate_points()
+
+    def _started_game(self) -> HanabiGame:
+        if self._game is None:
+            raise ValueError("The game has not started - call reset() first")
+        return self._game
+
+    def _reset(self, seed: int | None, observe: bool = True) -> None:
+        if seed is not None:
+            self._rng = random.Random(seed)
+
+        self._game = game = create_game(
+            self._n_players, rng=random.Random(self._rng.getrandbits(64))
+        )
+        game.start()
+        self._encoder.reset(game)
+        self._legal = legal = LegalActions(game)
+        if observe:
+            self._observe(game, legal)
+
+    def _step(self, action: int, observe: bool = True) -> Tuple[int, bool]:
+        game, legal = self._game, self._legal
+        if game is None or legal is None or game.state != HanabiGameState.Playing:
+            raise ValueError("The game has ended - call reset() to start a new one")
+
+        # Negative ids would otherwise index the mask from its end.
+        if not 0 <= action < self.n_actions or not self._legal_actions[action]:
+            raise ValueError(f"Illegal action: {action}")
+
+        player_id = game.current_player.player_id
+        action = int(action)
+        move = action_to_move(self._n_players, player_id, action)
+
+        points = game.calculate_points()
+        game.step(create_move_from_id(game, action))
+        self._encoder.update(game, player_id, move)
+        legal.update(player_id, move)
+
+        reward = game.calculate_points() - points
+        if game.state == HanabiGameState.Lost:
+            reward -= game.calculate_points()
+
+        if observe:
+            self._observe(game, legal)
+
+        return reward, game.state != HanabiGameState.Playing
+
+    def _observe(self, game: HanabiGame, legal: LegalActions) -> None:
+        self._encoder.observe(game.current_player.player_id, self._observation)
+        self._legal_actions[:] = _legal_mask(game, legal) >> self._action_bits & 1
+
+    def _info(self) -> dict:
+        return {
+            "legal_actions": self._legal_actions.copy(),
+            "current_player": self._started_game().current_player.player_id,
+            "score": self.score,
+        }
+
+
+class VectorHanabiEnv:
+    """
+    A batch of independent games, which are stepped in lockstep.
+
+    Observations, legal actions, rewards and terminations are returned
+      as arrays stacked along the first axis. A game, which has ended,
+      is reset by the next step, and its final score is reported in
+      info['final_score'].
+
+    The games are played one by one, but their observations and legal
+      actions are kept in stacked arrays, which the environments write
+      into, and which are encoded for all games at once.
+    """
+
+    def __init__(self, n_envs: int, n_players: int = 3) -> None:
+        _require_numpy()
+
+        self._envs: List[HanabiEnv] = [HanabiEnv(n_players) for _ in range(n_envs)]
+        self._done = np.zeros(n_envs, dtype=bool)
+
+        self._batch = ObservationBatch(n_envs, n_players)
+        self._observations = np.zeros(
+            (n_envs, observation_size(n_players)), dtype=np.float32
+        )
+        self._legal_actions = np.zeros((n_envs, n_actions(n_players)), dtype=bool)
+        self._action_bits = np.arange(n_actions(n_players))
+
+        # The environments share the arrays of the batch, i.e. each of
+        # them encodes into (and checks the actions against) its row.
+        for i, env in enumerate(self._envs):
+            env._encoder = self._batch.encoders[i]
+            env._observation = self._observations[i]
+            env._legal_actions = self._legal_actions[i]
+
+    @property
+    def n_envs(self) -> int:
+        return len(self._envs)
+
+    @property
+    def n_actions(self) -> int:
+        return self._legal_actions.shape[1]
+
+    @property
+    def observation_size(self) -> int:
+        return self._observations.shape[1]
+
+    def reset(self, seed: int | None = None) -> Tuple[object, dict]:
+        """
+        Starts a new game in every environment, where environment i is
+          seeded with 'seed + i'.
+        """
+        for i, env in enumerate(self._envs):
+            env._reset(None if seed is None else seed + i, observe=False)
+
+        self._done[:] = False
+        self._observe()
+
+        return self._observations.copy(), {"legal_actions": self._legal_actions.copy()}
+
+    def step(
+        self, actions: Sequence[int]
+    ) -> Tuple[object, object, object, object, dict]:
+        """
+        Makes one move in every game. The actions of games, which ended
+          in the previous step, are ignored, since those games are reset.
+        """
+        n_envs = len(self._envs)
+        rewards = np.zeros(n_envs, dtype=np.float32)
+        terminated = np.zeros(n_envs, dtype=bool)
+        final_score = np.zeros(n_envs, dtype=np.int64)
+
+        for i, env in enumerate(self._envs):
+            if self._done[i]:
+                env._reset(None, observe=False)
+            else:
+                rewards[i], terminated[i] = env._step(actions[i], observe=False)
+                final_score[i] = env.score
+
+        self._done = terminated
+        self._observe()
+
+        info = {
+            "legal_actions": self._legal_actions.copy(),
+            "final_score": np.where(terminated, final_score, 0),
+        }
+
+        return (
+            self._observations.copy(),
+            rewards,
+            terminated,
+            np.zeros(n_envs, dtype=bool),
+            info,
+        )
+
+    def _observe(self) -> None:
+        player_ids, masks = [], []
+        for env in self._envs:
+            game = env._started_game()
+            player_ids.append(game.current_player.player_id)
+            masks.append(_legal_mask(game, env._legal))
+
+        self._batch.observe(player_ids, self._observations)
+        self._legal_actions[:] = (
+            np.array(masks, dtype=np.int64)[:, None] >> self._action_bits & 1
+        )
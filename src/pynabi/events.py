@@ -0,0 +1,158 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, List
+
+from .base import Card, HanabiGameState
+
+
+class GameEvent:
+    """
+    Something that happened in a game.
+    """
+
+
+@dataclass(frozen=True)
+class GameStarted(GameEvent):
+    """
+    Emitted before the cards are dealt, i.e. the deck is still complete.
+    """
+
+    game: Any
+
+
+@dataclass(frozen=True)
+class TurnStarted(GameEvent):
+    game: Any
+    player_id: int
+
+
+@dataclass(frozen=True)
+class MoveMade(GameEvent):
+    """
+    Emitted before a move (see engine.create_move) of a player is made.
+    """
+
+    player_id: int
+    move: tuple | None
+
+
+@dataclass(frozen=True)
+class CardPlayed(GameEvent):
+    card: Card
+    is_valid: bool
+
+
+@dataclass(frozen=True)
+class CardDiscarded(GameEvent):
+    card: Card
+
+
+@dataclass(frozen=True)
+class HintUsed(GameEvent):
+    hint_tokens: int
+
+
+@dataclass(frozen=True)
+class HintReclaimed(GameEvent):
+    hint_tokens: int
+    is_reclaimed: bool
+
+
+@dataclass(frozen=True)
+class FuseLit(GameEvent):
+    fuse_tokens: int
+
+
+@dataclass(frozen=True)
+class GameEnded(GameEvent):
+    game: Any
+    state: HanabiGameState
+    points: int
+
+
+class EventSink(ABC):
+    """
+    An event sink receives the events emitted by a game and its components.
+    """
+
+    @abstractmethod
+    def emit(self, event: GameEvent) -> None:
+        """
+        Handles an event.
+        """
+
+
+class NullSink(EventSink):
+    """
+    Ignores all events. This is the default, such that games
+      played by AIs alone do not spend any time on output.
+    """
+
+    def emit(self, event: GameEvent) -> None:
+        pass
+
+
+# Stateless, thus it can be shared by all games.
+NULL_SINK = NullSink()
+
+
+class EventBus(EventSink):
+    """
+    Passes on events to all of its subscribers.
+    """
+
+    def __init__(self, *subscribers: EventSink) -> None:
+        self._subscribers: List[EventSink] = list(subscribers)
+
+    def subscribe(self, subscriber: EventSink) -> None:
+        self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: EventSink) -> None:
+        self._subscribers.remove(subscriber)
+
+    def emit(self, event: GameEvent) -> None:
+        for subscriber in self._subscribers:
+            subscriber.emit(event)
+
+
+class EventCollector(EventSink):
+    """
+    Collects all events, e.g. for statistics or testing.
+    """
+
+    def __init__(self) -> None:
+        self.events: List[GameEvent] = []
+
+    def emit(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+
+class ConsoleRenderer(EventSink):
+    """
+    Renders the events of an interactive game to the console.
+    """
+
+    def emit(self, event: GameEvent) -> None:
+        match event:
+            case TurnStarted(game=game, player_id=player_id):
+                game.print_game(player_id=player_id)
+            case CardDiscarded(card=card):
+                print(f"You have discarded: {card}")
+            case HintUsed():
+                print("Hint token was used!")
+            case HintReclaimed(is_reclaimed=True):
+                print("Hint token was reclaimed!")
+            case HintReclaimed(is_reclaimed=False):
+                print(
+                    "You already have the maximum amount of hint tokens. No hint token was added."
+                )
+            case FuseLit(fuse_tokens=fuse_tokens):
+                print("The fuse is lit and it is getting shorter!")
+                if fuse_tokens <= 0:
+                    print("KABOOM!!!")
+            case GameEnded(game=game, state=HanabiGameState.Won, points=points):
+                game.print_game()
+                print(f"Hurray, you won the game - You got {points} points")
+            case GameEnded(game=game, state=HanabiGameState.Lost):
+                game.print_game()
+                print("You lost - 0 points for you!")
@@ -1,13 +1,28 @@
 import os
-from itertools import cycle
+import random
+from typing import Callable
 
+from .engine import create_move
+from .events import (
+    NULL_SINK,
+    EventSink,
+    GameEnded,
+    GameStarted,
+    MoveMade,
+    TurnStarted,
+)
 from .exceptions import GameIsOver, GameIsWon
+from .profiling import Profiler
+from .zobrist import COUNTDOWN, CURRENT_PLAYER, GAME_STATES, seat
 
 from .base import (
+    Action,
     HanabiGameState,
     AbstractDeck,
     AbstractGame,
     AbstractBoard,
+    AbstractPlayer,
+    PlayerMove,
 )
 
 
@@ -16,17 +31,54 @@ class InvalidGameState(BaseException):
 
 
 class HanabiGame(AbstractGame):
-    def __init__(self, players: list, board, deck):
+    def __init__(
+        self,
+        players: list,
+        board,
+        deck,
+        events: EventSink = NULL_SINK,
+        rng: random.Random | None = None,
+        profiler: Profiler | None = None,
+    ):
         self._players = list(players)
         self._state = HanabiGameState.Starting
         self._board = board
         self._deck = deck
+        self._events = events
+        self._rng = rng or random.Random()
+        self._profiler = profiler
+        self._turns = 0
+        self._current = 0
+        self._last_round_countdown = len(self._players)
+        self._undo_stack: list = []
+        self._history: list = []
 
     def play(self) -> None:
         """
         Starts the game.
         """
+        self.start()
+
+        # Play the game
+        while self.state == HanabiGameState.Playing:
+            player = self.current_player
+
+            self._events.emit(TurnStarted(self, player.player_id))
+
+            if self._profiler is None:
+                self._play_turn(player.take_turn)
+            else:
+                with self._profiler.phase("turn"):
+                    self._play_turn(player.take_turn)
+
+        if self.state not in (HanabiGameState.Won, HanabiGameState.Lost):
+            raise InvalidGameState("Invalid game state")
 
+    def start(self) -> None:
+        """
+        Deals the cards, such that the game can be played move by move
+          with step() rather than by play().
+        """
         if self.state != HanabiGameState.Starting:
             raise InvalidGameState(
                 f"Invalid game state - Expected 'Starting' state, got: {self.state}"
@@ -34,38 +86,177 @@ class HanabiGame(AbstractGame):
 
         self.state = HanabiGameState.Playing
 
+        self._events.emit(GameStarted(self))
+
         self._deal_at_startup()
 
-        # Play the game
-        last_round_countdown = len(self._players)
-        try:
-            for player in cycle(self._players):
-                self.print_game(player_id=player.player_id)
-                player.take_turn(self)
+    def step(self, move: PlayerMove) -> None:
+        """
+        Lets the current player make a move and ends their turn.
+        """
+        if self.state != HanabiGameState.Playing:
+            raise InvalidGameState(
+                f"Invalid game state - Expected 'Playing' state, got: {self.state}"
+            )
+
+        player = self.current_player
+        self.record_move(player.player_id, getattr(move, "move", None))
+        self._play_turn(lambda game: move(game, player))
 
-                if self.is_last_round:
-                    if last_round_countdown:
-                        last_round_countdown -= 1
-                    else:
-                        self.state = HanabiGameState.Won
-                        break
+    def record_move(self, player_id: int, move: tuple | None) -> None:
+        """
+        Records the move a player is about to make, where moves not
+          made by create_move are recorded as None.
+        """
+        self._history.append((player_id, move))
+        self._events.emit(MoveMade(player_id, move))
 
+    def apply_move(self, move: tuple) -> None:
+        """
+        Lets the current player make a move, such that it can be
+          undone by undo_move().
+
+        Only the parts of the game that the move may affect are
+          captured, i.e. the board, the deck and the knowledge base
+          of either the current player or the player receiving a hint.
+        """
+        match move:
+            case [Action.INFO, player_id, _]:
+                kb = self._players[player_id].knowledgebase
+            case _:
+                kb = self.current_player.knowledgebase
+
+        self._undo_stack.append(
+            (
+                self._state,
+                self._turns,
+                self._current,
+                self._last_round_countdown,
+                len(self._history),
+                self._board.snapshot(),
+                self._deck.snapshot(),
+                kb,
+                kb.snapshot(),
+            )
+        )
+
+        self.step(create_move(move))
+
+    def undo_move(self) -> None:
+        """
+        Undoes the last move made by apply_move().
+        """
+        if not self._undo_stack:
+            raise InvalidGameState("There are no moves to undo")
+
+        (
+            self._state,
+            self._turns,
+            self._current,
+            self._last_round_countdown,
+            n_moves,
+            board,
+            deck,
+            kb,
+            knowledge,
+        ) = self._undo_stack.pop()
+
+        del self._history[n_moves:]
+
+        self._board.restore(board)
+        self._deck.restore(deck)
+        kb.restore(knowledge)
+
+    def _play_turn(self, turn: Callable[[AbstractGame], None]) -> None:
+        """
+        Plays a single turn and updates the state of the game accordingly.
+        """
+        self._turns += 1
+        player_id = self.current_player.player_id
+
+        try:
+            turn(self)
         except GameIsWon:
-            self.state = HanabiGameState.Won
+            self._end(HanabiGameState.Won)
+            return
         except GameIsOver:
-            self.state = HanabiGameState.Lost
-
-        match self.state:
-            case HanabiGameState.Won:
-                self.print_game()
-                print(
-                    f"Hurray, you won the game - You got {self.calculate_points()} points"
-                )
-            case HanabiGameState.Lost:
-                self.print_game()
-                print("You lost - 0 points for you!")
-            case _:
-                raise InvalidGameState("Invalid game state")
+            self._end(HanabiGameState.Lost)
+            return
+        finally:
+            # Players, who do not record their moves, e.g. humans.
+            if len(self._history) < self._turns:
+                self._history.append((player_id, None))
+
+        if self.is_last_round:
+            if self._last_round_countdown:
+                self._last_round_countdown -= 1
+            else:
+                self._end(HanabiGameState.Won)
+                return
+
+        self._current = (self._current + 1) % len(self._players)
+
+    def _end(self, state: HanabiGameState) -> None:
+        self.state = state
+        self._events.emit(GameEnded(self, state, self.calculate_points()))
+
+    def clone(self) -> "HanabiGame":
+        """
+        Creates a silent copy of the game, which can be played
+          without affecting this game.
+        """
+        board = self._board.clone()
+        game = HanabiGame(
+            players=[player.clone() for player in self._players],
+            board=board,
+            deck=self._deck.clone(),
+            rng=self._rng,
+        )
+        game._state = self._state
+        game._turns = self._turns
+        game._current = self._current
+        game._last_round_countdown = self._last_round_countdown
+        game._history = list(self._history)
+        return game
+
+    def state_hash(self) -> int:
+        """
+        A hash of the full state of the game, i.e. including the hands
+          of all players and the order of the deck.
+
+        The hash is combined from the hashes, which the parts of the
+          game keep up to date, thus it is cheap to compute.
+        """
+        h = self._hash_turn() ^ self._board.zobrist_hash ^ self._deck.zobrist_hash
+        for i, player in enumerate(self._players):
+            kb = player.knowledgebase
+            h ^= seat(i, kb.zobrist_hash ^ kb.hand.zobrist_hash)
+
+        return h
+
+    def information_set_hash(self, player_id: int) -> int:
+        """
+        A hash of the state of the game as seen by a player, i.e.
+          without their own hand and the order of the deck.
+
+        States, which the player cannot tell apart, have the same hash.
+        """
+        h = self._hash_turn() ^ self._board.zobrist_hash ^ self._deck.public_hash
+        for i, player in enumerate(self._players):
+            kb = player.knowledgebase
+            if player.player_id == player_id:
+                h ^= seat(i, kb.zobrist_hash)
+            else:
+                h ^= seat(i, kb.zobrist_hash ^ kb.hand.zobrist_hash)
+
+        return h
+
+    def _hash_turn(self) -> int:
+        return (
+            GAME_STATES[self._state]
+            ^ CURRENT_PLAYER[self._current]
+            ^ COUNTDOWN[self._last_round_countdown]
+        )
 
     def _deal_at_startup(self) -> None:
         """
@@ -81,6 +272,57 @@ class HanabiGame(AbstractGame):
         """
         return len(self.deck) == 0
 
+    @property
+    def last_round_countdown(self) -> int:
+        """
+        The number of turns left after the current one, once the
+          last round has started (see is_last_round).
+        """
+        return self._last_round_countdown
+
+    @property
+    def current_player(self) -> AbstractPlayer:
+        """
+        The player whose turn it is.
+        """
+        return self._players[self._current]
+
+    @property
+    def rng(self) -> random.Random:
+        """
+        The random number generator used by the AIs of the game.
+        """
+        return self._rng
+
+    @property
+    def profiler(self) -> Profiler | None:
+        """
+        The profiler recording the phases of the game, if any.
+        """
+        return self._profiler
+
+    @property
+    def events(self) -> EventSink:
+        """
+        The sink of the events emitted by the game.
+        """
+        return self._events
+
+    @property
+    def history(self) -> list:
+        """
+        The moves made so far as pairs of the player id and the move,
+          which is None if the move is not known (read-only).
+        """
+        return self._history
+
+    @property
+    def turns(self) -> int:
+        """
+        The number of turns taken so far.
+        """
+        return self._turns
+
     @property
     def state(self) -> HanabiGameState:
         return self._state
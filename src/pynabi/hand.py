@@ -6,6 +6,7 @@ from .base import (
     AbstractHand,
     AbstractKnowledgeBase,
 )
+from .zobrist import HAND, hash_hand
 
 
 class PlayerHand(AbstractHand):
@@ -16,6 +17,7 @@ class PlayerHand(AbstractHand):
 
     def __init__(self):
         self._hand = []
+        self._hash = 0
 
     def draw(self, deck: AbstractDeck, n_cards=1) -> bool:
         """
@@ -25,18 +27,23 @@ class PlayerHand(AbstractHand):
             raise ValueError("Cannot have more than 5 cards at a time!")
 
         new_cards = [card for _ in range(n_cards) if (card := deck.draw())]
-        self._hand += new_cards
+        for card in new_cards:
+            self._hash ^= HAND[len(self._hand)][card.id]
+            self._hand.append(card)
 
         return bool(new_cards)
 
-    def discard(self, deck: AbstractDeck, n_cards: int) -> None:
+    def discard(self, deck: AbstractDeck, n_cards: int) -> Card:
         """
         Discard card with index n from the hand.
         """
         if n_cards > len(self):
             raise ValueError("Cannot discard more cards than in ones hand!")
 
-        deck.discard(self._hand.pop(n_cards))
+        card = self._hand[n_cards]
+        del self[n_cards]
+        deck.discard(card)
+        return card
 
     def play_card(self, board: AbstractBoard, card_index: int):
         """
@@ -60,6 +67,26 @@ class PlayerHand(AbstractHand):
 
         return ", ".join(format_card(*x) for x in zip(knowledgebase, self._hand))
 
+    def clone(self) -> "PlayerHand":
+        hand = PlayerHand()
+        hand._hand = list(self._hand)
+        hand._hash = self._hash
+        return hand
+
+    def snapshot(self) -> list:
+        return list(self._hand)
+
+    def restore(self, snapshot: list) -> None:
+        self._hand = list(snapshot)
+        self._hash = hash_hand(self._hand)
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        The hash of the cards in each slot of the hand.
+        """
+        return self._hash
+
     def __iter__(self):
         yield from self._hand
 
@@ -69,8 +96,16 @@ class PlayerHand(AbstractHand):
     def __getitem__(self, index: int) -> Card:
         return self._hand[index]
 
+    def __setitem__(self, index: int, card: Card):
+        slot = HAND[index]
+        self._hash ^= slot[self._hand[index].id] ^ slot[card.id]
+        self._hand[index] = card
+
     def __delitem__(self, index: int):
+        # The cards after the index move one slot to the left.
+        self._hash ^= hash_hand(self._hand, index)
         del self._hand[index]
+        self._hash ^= hash_hand(self._hand, index)
 
     def __str__(self):
         return ", ".join(str(card) for card in self._hand)
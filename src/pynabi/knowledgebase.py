@@ -1,34 +1,59 @@
 from .base import (
+    Card,
     CardColour,
     AbstractKnowledgeBase,
     AbstractHand,
     AbstractDeck,
     AbstractBoard,
 )
+from .counting import CardCounts
+from .events import NULL_SINK, CardDiscarded, EventSink
+from .masks import (
+    ALL_CARDS,
+    colour_mask,
+    count_colours,
+    count_values,
+    value_mask,
+)
+from .zobrist import hash_mask, hash_masks
 
 
 class KnowledgeBase(AbstractKnowledgeBase):
-    def __init__(self, hand: AbstractHand):
+    """
+    The knowledge about each card in the hand is a set of the cards,
+      which it may be, represented as a 25-bit mask (see masks). Hints
+      narrow down the set of every card in the hand: both the cards
+      that match the hint and the ones that do not.
+    """
+
+    def __init__(self, hand: AbstractHand, events: EventSink = NULL_SINK):
         self._hand = hand
-        self._cards: list = [{"colour": False, "value": False} for _ in hand]
+        self._events = events
+        self._masks: list = [ALL_CARDS for _ in hand]
+        self._hash = hash_masks(self._masks)
 
     def draw(self, deck: AbstractDeck, n_cards: int) -> bool:
         """
         Draws n cards from a deck.
         """
-        for _ in range(n_cards):
-            self._cards.append({"colour": False, "value": False})
+        n_before = len(self._hand)
+        has_drawn = self._hand.draw(deck, n_cards)
+
+        # The deck may run out, so only track the cards actually drawn.
+        for _ in range(len(self._hand) - n_before):
+            self._hash ^= hash_mask(len(self._masks), ALL_CARDS)
+            self._masks.append(ALL_CARDS)
 
-        return self._hand.draw(deck, n_cards)
+        return has_drawn
 
-    def discard(self, deck: AbstractDeck, n_card: int):
+    def discard(self, deck: AbstractDeck, n_card: int) -> Card:
         """
         Discards card with the index n from this hand into the deck pile.
         """
         discarded_card = self._hand.discard(deck, n_card)
-        del self._cards[n_card]
+        self._remove_mask(n_card)
         # Optionally, reveal the discarded card to the player
-        print(f"You have discarded: {discarded_card}")
+        self._events.emit(CardDiscarded(discarded_card))
         return discarded_card
 
     def play_card(self, board: AbstractBoard, card_index: int):
@@ -36,41 +61,104 @@ class KnowledgeBase(AbstractKnowledgeBase):
         Plays a card on the board.
         """
         self._hand.play_card(board, card_index)
-        del self._cards[card_index]
+        self._remove_mask(card_index)
 
     def get_knowledge(self, index: int) -> dict:
-        if index not in range(len(self._cards)):
+        """
+        Gets whether the colour and value of a card are known.
+        """
+        mask = self.get_mask(index)
+        return {"colour": count_colours(mask) == 1, "value": count_values(mask) == 1}
+
+    def get_mask(self, index: int) -> int:
+        """
+        Gets the set of cards, which the card at index may be.
+        """
+        if index not in range(len(self._masks)):
             raise ValueError("Invalid index - out of bounds.")
 
-        return self._cards[index]
+        return self._masks[index]
 
     def update_knowledge(self, index: int, **new_knowledge):
-        if index not in range(len(self._cards)):
+        if index not in range(len(self._masks)):
             raise ValueError("Invalid index - out of bounds.")
 
-        self._cards[index] |= new_knowledge
+        card = self._hand[index]
+        if new_knowledge.get("colour", False):
+            self._narrow(index, colour_mask(card.colour))
+        if new_knowledge.get("value", False):
+            self._narrow(index, value_mask(card.value))
 
     def remove_knowledge(self, index: int):
-        if index not in range(len(self._cards)):
+        if index not in range(len(self._masks)):
             raise ValueError("Invalid index - out of bounds.")
 
-        del self._cards[index]
+        self._remove_mask(index)
 
     def reveal_colour(self, colour: CardColour):
+        mask = colour_mask(colour)
         for i, card in enumerate(self._hand):
-            if card.colour == colour:
-                self.update_knowledge(i, colour=True)
+            self._narrow(i, mask if card.colour == colour else ~mask)
 
     def reveal_value(self, value: int):
+        mask = value_mask(value)
         for i, card in enumerate(self._hand):
-            if card.value == value:
-                self.update_knowledge(i, value=True)
+            self._narrow(i, mask if card.value == value else ~mask)
+
+    def _narrow(self, index: int, mask: int) -> None:
+        old = self._masks[index]
+        new = old & mask
+        if new != old:
+            self._hash ^= hash_mask(index, old) ^ hash_mask(index, new)
+            self._masks[index] = new
 
     def knowledge(self) -> float:
-        def _acc(k: dict) -> int:
-            return int(k.get("colour", 0)) + int(k.get("value", 0))
+        """
+        Each card contributes between 0 (nothing is known) and 2 (both
+          colour and value are known), with partial credit for every
+          colour or value that has been ruled out.
+        """
+
+        def _acc(mask: int) -> float:
+            return (10 - count_colours(mask) - count_values(mask)) / 4
+
+        return sum(map(_acc, self._masks)) / len(self)
+
+    def remaining_counts(self, deck: AbstractDeck) -> CardCounts:
+        """
+        Counts the cards that the owner of this knowledge base cannot see.
 
-        return sum(map(_acc, self)) / len(self)
+        All other cards have either been played, discarded or are in the
+          hands of the other players. The deck keeps its counts up to date
+          as cards are drawn, so this only adds the (at most five) cards
+          of the hand to a copy of those.
+        """
+        counts = deck.counts.copy()
+        for card in self._hand:
+            counts.add(card)
+
+        return counts
+
+    def clone(self) -> "KnowledgeBase":
+        kb = KnowledgeBase(self._hand.clone())
+        kb._masks = list(self._masks)
+        kb._hash = self._hash
+        return kb
+
+    def snapshot(self) -> tuple:
+        return list(self._masks), self._hand.snapshot()
+
+    def restore(self, snapshot: tuple) -> None:
+        masks, hand = snapshot
+        self._masks = list(masks)
+        self._hash = hash_masks(self._masks)
+        self._hand.restore(hand)
+
+    def _remove_mask(self, index: int) -> None:
+        # The knowledge after the index moves one slot to the left.
+        self._hash ^= hash_masks(self._masks, index)
+        del self._masks[index]
+        self._hash ^= hash_masks(self._masks, index)
 
     def get_hand(self):
         """
@@ -79,14 +167,30 @@ class KnowledgeBase(AbstractKnowledgeBase):
         """
         return self._hand.get_hand(self)
 
+    @property
+    def masks(self) -> list:
+        """
+        The sets of possible cards of the hand (read-only).
+        """
+        return self._masks
+
     def __len__(self) -> int:
-        return len(self._cards)
+        return len(self._masks)
 
     def __getitem__(self, index: int) -> dict:
-        return self._cards[index]
+        return self.get_knowledge(index)
 
     def __iter__(self):
-        yield from self._cards
+        for i in range(len(self._masks)):
+            yield self.get_knowledge(i)
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        The hash of the knowledge about each slot of the hand, which
+          does not include the cards of the hand itself.
+        """
+        return self._hash
 
     @property
     def hand(self) -> AbstractHand:
@@ -0,0 +1,85 @@
+"""
+Sets of cards represented as 25-bit integers, where bit i is set
+  if the card with id i is in the set (see base.card_id).
+"""
+
+from typing import Iterator, List
+
+from .base import CARDS, COLOURS, Card, CardColour
+
+# All 25 distinct cards.
+ALL_CARDS = (1 << 25) - 1
+
+# The cards of each colour, in the order of COLOURS.
+COLOUR_MASKS = tuple(0b11111 << (5 * c) for c in range(5))
+
+# The cards of each value, indexed by value - 1.
+VALUE_MASKS = tuple(sum(1 << (5 * c + v) for c in range(5)) for v in range(5))
+
+_COLOUR_MASK_OF = dict(zip(COLOURS, COLOUR_MASKS))
+
+
+def colour_mask(colour: CardColour) -> int:
+    return _COLOUR_MASK_OF[colour]
+
+
+def value_mask(value: int) -> int:
+    return VALUE_MASKS[value - 1]
+
+
+def card_mask(card: Card) -> int:
+    return 1 << card.id
+
+
+def has_card(mask: int, card: Card) -> bool:
+    return bool(mask >> card.id & 1)
+
+
+def playable_cards(board) -> int:
+    """
+    Gets the set of cards, which can be played on the board right now.
+    """
+    mask = 0
+    for c, colour in enumerate(COLOURS):
+        pile = board[colour]
+        if pile < 5:
+            mask |= 1 << (5 * c + pile)
+
+    return mask
+
+
+def possible_colours(mask: int) -> List[CardColour]:
+    return [colour for colour, m in zip(COLOURS, COLOUR_MASKS) if mask & m]
+
+
+def possible_values(mask: int) -> List[int]:
+    return [v + 1 for v, m in enumerate(VALUE_MASKS) if mask & m]
+
+
+def count_colours(mask: int) -> int:
+    """
+    Counts the colours, which some card in the set has.
+    """
+    return (
+        bool(mask & 0x1F)
+        + bool(mask & 0x3E0)
+        + bool(mask & 0x7C00)
+        + bool(mask & 0xF8000)
+        + bool(mask & 0x1F00000)
+    )
+
+
+def count_values(mask: int) -> int:
+    """
+    Counts the values, which some card in the set has.
+    """
+    # Fold the five colours onto each other, leaving a 5-bit set of values.
+    values = (mask | mask >> 5 | mask >> 10 | mask >> 15 | mask >> 20) & 0x1F
+    return values.bit_count()
+
+
+def cards_in(mask: int) -> Iterator[Card]:
+    while mask:
+        low = mask & -mask
+        yield CARDS[low.bit_length() - 1]
+        mask ^= low
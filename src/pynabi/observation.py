@@ -0,0 +1,243 @@
+"""
+Fixed-size observations of a game as NumPy arrays.
+
+NumPy is an optional dependency (install the 'numpy' extra).
+
+The observation of a player is a float32 vector consisting of:
+
+    [0, 5)      the height of each pile (/ 5), in the order of COLOURS
+    [5, 8)      the hint tokens (/ 8), the fuse tokens (/ 3) and the
+                number of cards in the deck (/ 45)
+    [8, 33)     the discarded copies of each card id (/ its copies)
+    [33, ...)   a one-hot card id for each slot of the hands of the
+                other players, starting from the next player
+    last 125    the possibility mask (see masks) of each slot of the
+                player's own hand
+"""
+
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+from .base import COLOURS, HAND_SIZE, Action, AbstractGame
+from .deck import HanabiDeck
+
+# The number of copies of each card id in a full deck, and its size.
+_COPIES = tuple(HanabiDeck(do_shuffle=False).counts.table)
+_DECK_SIZE = sum(_COPIES)
+
+_HEADER_SIZE = 33
+_SLOTS_SIZE = 25 * HAND_SIZE
+
+_BITS = None if np is None else np.arange(25)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "The observation module requires NumPy - install pynabi with the 'numpy' extra."
+        )
+
+
+def observation_size(n_players: int) -> int:
+    return _HEADER_SIZE + _SLOTS_SIZE * n_players
+
+
+def _encode_header(game: AbstractGame, out) -> None:
+    board = game.board
+    for c, colour in enumerate(COLOURS):
+        out[c] = board[colour] / 5
+
+    out[5] = board.tokens.hint_tokens / 8
+    out[6] = board.tokens.fuse_tokens / 3
+    out[7] = len(game.deck) / _DECK_SIZE
+
+
+def encode_observation(game: AbstractGame, player_id: int, out) -> None:
+    """
+    Encodes the observation of a player from scratch.
+    """
+    out[:] = 0.0
+    _encode_header(game, out)
+
+    for card in game.deck.discarded_pile:
+        out[8 + card.id] += 1 / _COPIES[card.id]
+
+    n_players = len(game.players)
+    base = _HEADER_SIZE
+
+    for offset in range(1, n_players):
+        other = game.players[(player_id + offset) % n_players]
+        for slot, card in enumerate(other.knowledgebase.hand):
+            out[base + 25 * slot + card.id] = 1.0
+
+        base += _SLOTS_SIZE
+
+    for slot, mask in enumerate(game.players[player_id].knowledgebase.masks):
+        for i in range(25):
+            if mask >> i & 1:
+                out[base + 25 * slot + i] = 1.0
+
+
+def _others(n_players: int):
+    """
+    The other players of each player in the order they appear in its
+      observation, i.e. starting from the next player.
+    """
+    return np.array(
+        [
+            [(p + offset) % n_players for offset in range(1, n_players)]
+            for p in range(n_players)
+        ]
+    )
+
+
+class ObservationEncoder:
+    """
+    Encodes the observations of all players of a game, where only the
+      parts changed by a move are encoded again.
+
+    The state is kept in preallocated arrays indexed by player, i.e. the
+      header, the one-hot hands and the knowledge of each player. The
+      observation of a player is assembled from these by copying blocks
+      of the arrays into the output.
+    """
+
+    def __init__(self, n_players: int, header=None, hands=None, knowledge=None) -> None:
+        _require_numpy()
+
+        self._n_players = n_players
+        # The arrays may be given, e.g. as views of the arrays of a batch
+        # (see ObservationBatch).
+        if header is None:
+            header = np.zeros(_HEADER_SIZE, dtype=np.float32)
+        if hands is None:
+            hands = np.zeros((n_players, HAND_SIZE, 25), dtype=np.float32)
+        if knowledge is None:
+            knowledge = np.zeros((n_players, HAND_SIZE, 25), dtype=np.float32)
+
+        self._header = header
+        self._hands = hands
+        self._knowledge = knowledge
+        self._n_discarded = 0
+
+        self._others = _others(n_players)
+
+    @property
+    def size(self) -> int:
+        return observation_size(self._n_players)
+
+    def reset(self, game: AbstractGame) -> None:
+        """
+        Encodes a game from scratch.
+        """
+        self._header[:] = 0.0
+        self._n_discarded = 0
+        self._update_header(game)
+
+        for player_id in range(self._n_players):
+            self._update_hand(game, player_id)
+            self._update_knowledge(game, player_id)
+
+    def update(self, game: AbstractGame, player_id: int, move: tuple) -> None:
+        """
+        Encodes the parts of the game changed by the given move of a player.
+        """
+        self._update_header(game)
+
+        match move:
+            case [Action.INFO, target_id, _]:
+                self._update_knowledge(game, target_id)
+            case _:
+                self._update_hand(game, player_id)
+                self._update_knowledge(game, player_id)
+
+    def observe(self, player_id: int, out=None):
+        """
+        Writes the observation of a player into out, which is allocated
+          if it is not given.
+        """
+        if out is None:
+            out = np.empty(self.size, dtype=np.float32)
+
+        out[:_HEADER_SIZE] = self._header
+        out[_HEADER_SIZE:-_SLOTS_SIZE] = self._hands[self._others[player_id]].reshape(
+            -1
+        )
+        out[-_SLOTS_SIZE:] = self._knowledge[player_id].reshape(-1)
+        return out
+
+    def _update_header(self, game: AbstractGame) -> None:
+        _encode_header(game, self._header)
+
+        discarded = game.deck.discarded_pile
+        for card in discarded[self._n_discarded :]:
+            self._header[8 + card.id] += 1 / _COPIES[card.id]
+
+        self._n_discarded = len(discarded)
+
+    def _update_hand(self, game: AbstractGame, player_id: int) -> None:
+        hand = self._hands[player_id]
+        hand[:] = 0.0
+        ids = [card.id for card in game.players[player_id].knowledgebase.hand]
+        hand[np.arange(len(ids)), ids] = 1.0
+
+    def _update_knowledge(self, game: AbstractGame, player_id: int) -> None:
+        knowledge = self._knowledge[player_id]
+        knowledge[:] = 0.0
+        masks: Sequence[int] = game.players[player_id].knowledgebase.masks
+        if masks:
+            knowledge[: len(masks)] = (np.array(masks)[:, None] >> _BITS) & 1
+
+
+class ObservationBatch:
+    """
+    The observation encoders of a batch of games, which keep their state
+      in arrays stacked along a first axis, such that the observations of
+      all games are assembled at once.
+    """
+
+    def __init__(self, n_games: int, n_players: int) -> None:
+        _require_numpy()
+
+        self._n_players = n_players
+        self._headers = np.zeros((n_games, _HEADER_SIZE), dtype=np.float32)
+        self._hands = np.zeros((n_games, n_players, HAND_SIZE, 25), dtype=np.float32)
+        self._knowledge = np.zeros(
+            (n_games, n_players, HAND_SIZE, 25), dtype=np.float32
+        )
+        self._others = _others(n_players)
+        self._games = np.arange(n_games)
+
+        self.encoders = [
+            ObservationEncoder(
+                n_players, self._headers[i], self._hands[i], self._knowledge[i]
+            )
+            for i in range(n_games)
+        ]
+
+    @property
+    def size(self) -> int:
+        return observation_size(self._n_players)
+
+    def observe(self, player_ids: Sequence[int], out=None):
+        """
+        Writes the observation of the given player of each game into
+          the rows of out, which is allocated if it is not given.
+        """
+        n_games = len(self._games)
+        if out is None:
+            out = np.empty((n_games, self.size), dtype=np.float32)
+
+        players = np.asarray(player_ids)
+        others = self._hands[self._games[:, None], self._others[players]]
+
+        out[:, :_HEADER_SIZE] = self._headers
+        out[:, _HEADER_SIZE:-_SLOTS_SIZE] = others.reshape(n_games, -1)
+        out[:, -_SLOTS_SIZE:] = self._knowledge[self._games, players].reshape(
+            n_games, -1
+        )
+        return out
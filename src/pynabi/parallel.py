@@ -0,0 +1,72 @@
+"""
+Worker processes for searching a single move on several cores (see
+  MCTSEngine), either by independent searches from the root or by
+  evaluating batches of leaves of a single search.
+
+The pools are kept alive between moves, as starting the processes takes
+  far longer than a move is allowed to, e.g. at an interactive table.
+"""
+
+import atexit
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+
+from .base import EngineStats
+from .rollout import play_to_end
+
+# The pools of worker processes by their number of workers.
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+
+def get_pool(workers: int | None = None) -> ProcessPoolExecutor:
+    """
+    Gets the shared pool with the given number of worker processes,
+      which defaults to the number of cores.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+
+    return pool
+
+
+@atexit.register
+def shutdown_pools() -> None:
+    """
+    Shuts down all shared pools. They are started again when needed.
+    """
+    for pool in _pools.values():
+        pool.shutdown(cancel_futures=True)
+
+    _pools.clear()
+
+
+def search_root(args: tuple) -> Tuple[Dict[tuple, Tuple[int, float]], EngineStats]:
+    """
+    Searches a move from the root in a worker process, and returns the
+      visits and wins of every move at the root along with the work done.
+    """
+    engine_type, game, player_id, options, deadline, seed = args
+
+    engine = engine_type(
+        game, game.players[player_id], rng=random.Random(seed), **options
+    )
+    engine.search(deadline)
+
+    children = {
+        move: (child.visits, child.wins) for move, child in engine.root.children.items()
+    }
+    return children, engine.stats
+
+
+def evaluate_leaf(args: tuple) -> float:
+    """
+    Plays out the compact state of a leaf of a search (see rollout)
+      in a worker process, by the rollout policy of the engine.
+    """
+    engine_type, state = args
+    return play_to_end(state, engine_type.rollout_policy)
@@ -1,5 +1,8 @@
+import time
+
 from .base import (
     HanabiGameState,
+    AbstractAIEngine,
     AbstractGame,
     AbstractKnowledgeBase,
     AbstractHand,
@@ -112,6 +115,9 @@ class HumanPlayer(AbstractPlayer):
     def get_hand(self):
         return self.knowledgebase.get_hand()
 
+    def clone(self) -> "HumanPlayer":
+        return HumanPlayer(self._player_id, self._knowledgebase.clone())
+
     def _read_choice(
         self,
         prompt: str,
@@ -155,30 +161,78 @@ class HumanPlayer(AbstractPlayer):
 
 
 class AIPlayer(AbstractPlayer):
+    """
+    A player, whose moves are decided by an AI engine.
+
+    The engine is kept for the rest of the game, such that it may keep
+      its search between turns (see MCTSEngine).
+
+    The time (in seconds) and the number of nodes an engine may spend on
+      a move can be limited, whichever engine is used.
+    """
+
     def __init__(
         self,
         player_id: int,
         knowledgebase: AbstractKnowledgeBase,
         ai_engine_type: AIEngineType = ProbabilisticEngine,
+        ai_engine_options: dict | None = None,
+        time_limit: float | None = None,
+        max_nodes: int | None = None,
     ) -> None:
         self._player_id = int(player_id)
         self._knowledgebase = knowledgebase
         self._ai_engine_type = ai_engine_type
+        self._ai_engine_options = dict(ai_engine_options or {})
+        self._time_limit = time_limit
+        self._max_nodes = max_nodes
+        # The engine and the game it was built for.
+        self._ai_engine: AbstractAIEngine | None = None
+        self._ai_engine_game: AbstractGame | None = None
 
     def take_turn(self, game: AbstractGame) -> None:
-        print(f"Player: {self.player_id} - It's your turn!")
+        deadline = None
+        if self._time_limit is not None:
+            deadline = time.perf_counter() + self._time_limit
 
-        self.get_hand()
+        profiler = game.profiler
+        if profiler is None:
+            move = self._get_ai_engine(game).make_move(deadline, self._max_nodes)
 
-        # This is where we build the AI engine.
-        ai_engine = self._ai_engine_type(game, self)
-        move = ai_engine.make_move()
+            game.record_move(self._player_id, getattr(move, "move", None))
+            move(game, self)
+            return
 
-        move(game, self)
+        with profiler.phase("decide"):
+            move = self._get_ai_engine(game).make_move(deadline, self._max_nodes)
+
+        game.record_move(self._player_id, getattr(move, "move", None))
+        with profiler.phase("apply"):
+            move(game, self)
+
+    def _get_ai_engine(self, game: AbstractGame):
+        # This is where we build the AI engine, once per game.
+        if self._ai_engine is None or self._ai_engine_game is not game:
+            self._ai_engine = self._ai_engine_type(
+                game, self, **self._ai_engine_options
+            )
+            self._ai_engine_game = game
+
+        return self._ai_engine
 
     def get_hand(self):
         return self.knowledgebase.get_hand()
 
+    def clone(self) -> "AIPlayer":
+        return AIPlayer(
+            self._player_id,
+            self._knowledgebase.clone(),
+            self._ai_engine_type,
+            self._ai_engine_options,
+            self._time_limit,
+            self._max_nodes,
+        )
+
     @property
     def player_id(self) -> int:
         return self._player_id
@@ -1,5 +1,7 @@
-from typing import List
+from typing import Callable, List
+
 from .base import AbstractGame, AbstractPlayer, Card
+from .counting import CardCounts
 
 
 def _get_known_cards(
@@ -26,48 +28,49 @@ def _get_known_cards(
     return played_cards + discarded_cards + other_players_cards
 
 
-def get_possible_cards(
+def get_possible_card_counts(
     game: AbstractGame,
     player: AbstractPlayer,
     card_index: int,
-):
-    knowledge = player.knowledgebase.get_knowledge(card_index)
-
-    knows_colour = knowledge.get("colour", False)
-    knows_value = knowledge.get("value", False)
+    remaining: CardCounts | None = None,
+) -> CardCounts:
+    """
+    Counts the cards, which the card at card_index may be, given the
+      knowledge of the player. This does not peek at the card itself.
 
-    if knows_colour and knows_value:
-        return [player.knowledgebase.hand[card_index]]
+    The remaining (unseen) cards of the player may be passed in,
+      when they are shared between several queries.
+    """
+    if remaining is None:
+        remaining = player.knowledgebase.remaining_counts(game.deck)
 
-    if knows_colour:
-        condition = (
-            lambda card: card.colour == player.knowledgebase.hand[card_index].colour
-        )
-    elif knows_value:
-        condition = (
-            lambda card: card.value == player.knowledgebase.hand[card_index].value
-        )
-    else:
-        condition = lambda _: True
+    return remaining.masked(player.knowledgebase.get_mask(card_index))
 
-    possible_cards = [card for card in game.deck.create_deck() if condition(card)]
 
-    known_cards = _get_known_cards(game, player, condition)
+def get_possible_cards(
+    game: AbstractGame,
+    player: AbstractPlayer,
+    card_index: int,
+) -> List[Card]:
+    return list(get_possible_card_counts(game, player, card_index))
 
-    for card in known_cards:
-        possible_cards.remove(card)
 
-    return possible_cards
+def card_probability(card: Card, possible_cards: List[Card] | CardCounts) -> float:
+    return possible_cards.count(card) / len(possible_cards)
 
 
-def card_probability(card: Card, possible_cards: List[Card]) -> float:
-    return possible_cards.count(card) / len(possible_cards)
+def mean_over(possible_cards: CardCounts, f: Callable[[Card], float]) -> float:
+    """
+    Calculates the mean of f over all possible cards (with repetitions),
+      evaluating f only once per distinct card.
+    """
+    return sum(n * f(card) for card, n in possible_cards.items()) / len(possible_cards)
 
 
 def potential_score(
     card: Card,
     game: AbstractGame,
-    possible_cards: List[Card],
+    possible_cards: List[Card] | CardCounts,
 ) -> int:
     if card.value < game.board[card.colour]:
         return 1
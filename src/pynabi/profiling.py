@@ -0,0 +1,90 @@
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+
+class Profiler:
+    """
+    Records the time spent in, and the number of calls of, the phases
+      of a game, e.g. move generation, heuristic evaluation and drawing.
+
+    Profiling is opt-in: a game without a profiler takes the same code
+      paths as before, and the instrumented paths are only taken when
+      a profiler is attached to the game.
+
+    Phases may be nested, so the time of a phase includes the time of
+      the phases within it.
+    """
+
+    def __init__(self) -> None:
+        self._seconds: Dict[str, float] = defaultdict(float)
+        self._calls: Dict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Times the body of a with-statement as (one call of) the named phase.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._seconds[name] += time.perf_counter() - start
+            self._calls[name] += 1
+
+    def timed(self, name: str, f: Callable) -> Callable:
+        """
+        Wraps a function, such that every call is timed as the named phase.
+        """
+
+        def _timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                self._seconds[name] += time.perf_counter() - start
+                self._calls[name] += 1
+
+        return _timed
+
+    def count(self, name: str, n: int = 1) -> None:
+        """
+        Counts an event without timing it.
+        """
+        self._calls[name] += n
+
+    def reset(self) -> None:
+        self._seconds.clear()
+        self._calls.clear()
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        The number of calls and the total and mean time of each phase,
+          sorted by name.
+        """
+        return {
+            name: {
+                "calls": calls,
+                "total": self._seconds.get(name, 0.0),
+                "mean": self._seconds.get(name, 0.0) / calls if calls else 0.0,
+            }
+            for name, calls in sorted(self._calls.items())
+        }
+
+    def format_table(self) -> str:
+        """
+        Formats the summary as a table with the times in milliseconds.
+        """
+        lines = [f"{'phase':<24} {'calls':>10} {'total ms':>12} {'mean us':>10}"]
+        for name, stats in self.summary().items():
+            lines.append(
+                f"{name:<24} {stats['calls']:>10} "
+                f"{stats['total'] * 1e3:>12.2f} {stats['mean'] * 1e6:>10.2f}"
+            )
+
+        return "\n".join(lines)
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.summary(), **kwargs)
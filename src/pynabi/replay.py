@@ -0,0 +1,219 @@
+"""
+A compact binary format for recording games.
+
+A replay file starts with the magic bytes MAGIC and is followed by any
+  number of records, one per game, which can be appended to the file at
+  any time. A record consists of a fixed-size header (see _RECORD), the
+  card ids of the deck before the cards were dealt (one byte each) and
+  the action ids of the moves of the game (one byte each, see actions).
+
+A game is fully determined by its number of players, its deck and its
+  actions, so the engines are not needed to replay it.
+"""
+
+import mmap
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator
+
+from .actions import move_to_action
+from .base import HanabiGameState
+from .events import EventSink, GameEnded, GameEvent, GameStarted, MoveMade
+
+MAGIC = b"PYNABI\x00\x01"
+
+# The size of the rest of the record, the seed, the number of players,
+# the flags, the points, the number of cards in the deck and the number
+# of actions. Seeds are signed, as any int may seed a game.
+_RECORD = struct.Struct("<IqBBBBH")
+
+_SEEDS = range(-(1 << 63), 1 << 63)
+
+_HAS_SEED = 1
+_WON = 2
+
+
+@dataclass(frozen=True)
+class Replay:
+    """
+    A recorded game.
+    """
+
+    n_players: int
+    # The card ids in the order of the deck, where cards are drawn from the end.
+    deck: bytes
+    # The action ids of the moves, in the order they were made.
+    actions: bytes
+    points: int
+    won: bool
+    seed: int | None = None
+
+    @property
+    def score(self) -> int:
+        """
+        The score of the game, where a lost game is worth nothing.
+        """
+        return self.points if self.won else 0
+
+
+class ReplayWriter:
+    """
+    Appends replays to a file. Writes are buffered, thus the writer
+      should be closed (or used as a context manager) when done.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file: BinaryIO = open(path, "ab")
+
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+
+    def write(self, replay: Replay) -> None:
+        if replay.seed is not None and replay.seed not in _SEEDS:
+            raise ValueError(f"The seed does not fit in 64 bits: {replay.seed}")
+
+        flags = (_HAS_SEED if replay.seed is not None else 0) | (
+            _WON if replay.won else 0
+        )
+        n_cards, n_actions = len(replay.deck), len(replay.actions)
+
+        self._file.write(
+            _RECORD.pack(
+                _RECORD.size - 4 + n_cards + n_actions,
+                replay.seed or 0,
+                replay.n_players,
+                flags,
+                replay.points,
+                n_cards,
+                n_actions,
+            )
+        )
+        self._file.write(replay.deck)
+        self._file.write(replay.actions)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ReplayWriter":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class ReplayReader:
+    """
+    Reads the replays of a file, which is memory-mapped, such that only
+      the replays being iterated over are loaded into memory.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file cannot be mapped.
+            self._file.close()
+            raise ValueError(f"Not a replay file: {path}")
+
+        if self._map[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a replay file: {path}")
+
+    def __iter__(self) -> Iterator[Replay]:
+        data = self._map
+        offset = len(MAGIC)
+        end = len(data)
+
+        while offset < end:
+            (
+                size,
+                seed,
+                n_players,
+                flags,
+                points,
+                n_cards,
+                n_actions,
+            ) = _RECORD.unpack_from(data, offset)
+            cards = offset + _RECORD.size
+            actions = cards + n_cards
+
+            yield Replay(
+                n_players=n_players,
+                deck=data[cards:actions],
+                actions=data[actions : actions + n_actions],
+                points=points,
+                won=bool(flags & _WON),
+                seed=seed if flags & _HAS_SEED else None,
+            )
+
+            offset += 4 + size
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "ReplayReader":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class ReplayRecorder(EventSink):
+    """
+    Records the games it receives the events of to a replay writer.
+
+    Only moves created by engine.create_move can be recorded, i.e.
+      games of AI players or games played by step(). A game with any
+      other move (e.g. of a human player) is played on as usual, but it
+      is not written at all and is counted as skipped instead, such that
+      the file only ever holds whole games.
+    """
+
+    def __init__(self, writer: ReplayWriter, seed: int | None = None) -> None:
+        self._writer = writer
+        self._seed = seed
+        self._n_players = 0
+        self._deck = b""
+        self._actions = bytearray()
+        self._skipped = 0
+
+    @property
+    def skipped(self) -> int:
+        """
+        The number of games, which were not recorded.
+        """
+        return self._skipped
+
+    def emit(self, event: GameEvent) -> None:
+        match event:
+            case MoveMade(player_id=player_id, move=move):
+                if move is not None:
+                    self._actions.append(
+                        move_to_action(self._n_players, player_id, move)
+                    )
+            case GameStarted(game=game):
+                self._n_players = len(game.players)
+                self._deck = bytes(card.id for card in game.deck)
+                self._actions = bytearray()
+            case GameEnded(game=game, state=state, points=points):
+                # Other moves are either announced without their tuple,
+                # or not at all (see HanabiGame.record_move).
+                if len(self._actions) != game.turns:
+                    self._skipped += 1
+                    return
+
+                self._writer.write(
+                    Replay(
+                        n_players=self._n_players,
+                        deck=self._deck,
+                        actions=bytes(self._actions),
+                        points=points,
+                        won=state == HanabiGameState.Won,
+                        seed=self._seed,
+                    )
+                )
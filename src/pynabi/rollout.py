@@ -0,0 +1,198 @@
+"""
+Playing out games to their end for the simulations of a search, on a
+  compact copy of a game rather than on the game itself.
+
+A rollout state holds the piles and tokens as ints, and the deck, the
+  hands and the knowledge of the players as lists of card ids and masks
+  (see masks). Neither events, hashes nor undo information are kept up
+  to date, thus a move is a handful of list operations.
+
+A rollout policy picks the move of the current player of a state, where
+  a hint is given as the set of cards it is about (a colour or a value
+  mask), e.g. (Action.INFO, player_id, COLOUR_MASKS[c]).
+"""
+
+from typing import Callable, List
+
+from .base import COLOURS, Action, AbstractGame, HanabiGameState
+from .masks import ALL_CARDS, COLOUR_MASKS, VALUE_MASKS, count_values
+
+RolloutPolicy = Callable[["RolloutState"], tuple]
+
+# The points a won game is worth less for each fuse token lost.
+MISPLAY_PENALTY = 2.5
+
+# The fuse tokens a game starts with (see tokens.HanabiTokens).
+_FUSE_TOKENS = 3
+
+
+class RolloutState:
+    """
+    The state of a game as needed to play it out, where the cards are
+      their ids (see base.card_id) and the deck is drawn from its end.
+    """
+
+    __slots__ = (
+        "piles",
+        "points",
+        "playable",
+        "hint_tokens",
+        "fuse_tokens",
+        "deck",
+        "hands",
+        "masks",
+        "current",
+        "countdown",
+    )
+
+    def __init__(
+        self,
+        piles: List[int],
+        hint_tokens: int,
+        fuse_tokens: int,
+        deck: List[int],
+        hands: List[List[int]],
+        masks: List[List[int]],
+        current: int = 0,
+        countdown: int | None = None,
+    ) -> None:
+        self.piles = piles
+        self.points = sum(piles)
+        # The set of cards, which can be played right now.
+        self.playable = 0
+        for c, pile in enumerate(piles):
+            if pile < 5:
+                self.playable |= 1 << (5 * c + pile)
+        self.hint_tokens = hint_tokens
+        self.fuse_tokens = fuse_tokens
+        self.deck = deck
+        self.hands = hands
+        self.masks = masks
+        self.current = current
+        self.countdown = len(hands) if countdown is None else countdown
+
+    @staticmethod
+    def from_game(game: AbstractGame) -> "RolloutState":
+        """
+        Copies the state of a game, which is being played.
+        """
+        board = game.board
+        knowledgebases = [player.knowledgebase for player in game.players]
+
+        return RolloutState(
+            piles=[board[colour] for colour in COLOURS],
+            hint_tokens=board.tokens.hint_tokens,
+            fuse_tokens=board.tokens.fuse_tokens,
+            deck=[card.id for card in game.deck],
+            hands=[[card.id for card in kb.hand] for kb in knowledgebases],
+            masks=[list(kb.masks) for kb in knowledgebases],
+            current=game.current_player.player_id,
+            countdown=game.last_round_countdown,
+        )
+
+    def apply(self, move: tuple) -> HanabiGameState:
+        """
+        Lets the current player make a move and ends their turn, by
+          the same rules as HanabiGame, and returns the resulting state
+          of the game.
+        """
+        player = self.current
+        hand = self.hands[player]
+        action = move[0]
+
+        if action is Action.INFO:
+            _, target, hint = move
+            masks = self.masks[target]
+            for i, card in enumerate(self.hands[target]):
+                masks[i] &= hint if hint >> card & 1 else ~hint
+            self.hint_tokens -= 1
+        else:
+            card = hand.pop(move[1])
+            del self.masks[player][move[1]]
+
+            if action is Action.PLAY:
+                colour, value = divmod(card, 5)
+                if self.piles[colour] == value:
+                    self.piles[colour] = value + 1
+                    self.points += 1
+                    # The next card of the colour becomes playable.
+                    self.playable ^= 1 << card | (value < 4) << card + 1
+                    if self.points == 25:
+                        return HanabiGameState.Won
+                else:
+                    self.fuse_tokens -= 1
+                    if self.fuse_tokens <= 0:
+                        return HanabiGameState.Lost
+            elif self.hint_tokens < 8:
+                self.hint_tokens += 1
+
+            if self.deck:
+                hand.append(self.deck.pop())
+                self.masks[player].append(ALL_CARDS)
+
+        if not self.deck:
+            if not self.countdown:
+                return HanabiGameState.Won
+            self.countdown -= 1
+
+        self.current = (player + 1) % len(self.hands)
+        return HanabiGameState.Playing
+
+
+def default_policy(state: RolloutState) -> tuple:
+    """
+    A simple policy for playing out the game:
+
+    - Play a card that is known to be playable.
+    - Give a hint about a playable card of another player.
+    - Discard the oldest card, unless all hint tokens are left,
+        in which case any hint is given.
+    """
+    player = state.current
+    playable = state.playable
+
+    for i, mask in enumerate(state.masks[player]):
+        if not mask & ~playable:
+            return (Action.PLAY, i)
+
+    tokens = state.hint_tokens
+    if tokens:
+        for other, hand in enumerate(state.hands):
+            if other == player:
+                continue
+
+            for mask, card in zip(state.masks[other], hand):
+                if not playable >> card & 1 or not mask & ~playable:
+                    continue
+                if count_values(mask) > 1:
+                    return (Action.INFO, other, VALUE_MASKS[card % 5])
+                return (Action.INFO, other, COLOUR_MASKS[card // 5])
+
+    if tokens < 8 and state.hands[player]:
+        return (Action.DISCARD, 0)
+
+    return next(
+        (Action.INFO, other, COLOUR_MASKS[hand[0] // 5])
+        for other, hand in enumerate(state.hands)
+        if other != player and hand
+    )
+
+
+def play_to_end(state: RolloutState, policy: RolloutPolicy = default_policy) -> float:
+    """
+    Plays out the game by the policy, and scores the outcome as the
+      points of a won game out of 25, or 0 if the game is lost.
+
+    Every fuse token lost (in the game so far as well) costs a won game
+      MISPLAY_PENALTY points, such that a misplay is never a free guess.
+    """
+    apply = state.apply
+    result = HanabiGameState.Playing
+    while result is HanabiGameState.Playing:
+        result = apply(policy(state))
+
+    if result is not HanabiGameState.Won:
+        return 0.0
+
+    lost_fuses = _FUSE_TOKENS - state.fuse_tokens
+    return max(0.0, state.points - MISPLAY_PENALTY * lost_fuses) / 25
@@ -0,0 +1,148 @@
+import random
+from dataclasses import dataclass
+from statistics import fmean
+from typing import List
+
+from .base import HanabiGameState
+from .board import HanabiBoard
+from .deck import HanabiDeck
+from .engine import AIEngineType, ProbabilisticEngine
+from .events import NULL_SINK, EventSink
+from .game import HanabiGame
+from .hand import PlayerHand
+from .knowledgebase import KnowledgeBase
+from .player import AIPlayer
+from .profiling import Profiler
+from .replay import ReplayRecorder, ReplayWriter
+from .tokens import HanabiTokens
+
+
+@dataclass(frozen=True)
+class GameResult:
+    """
+    The outcome of a single headless game.
+    """
+
+    score: int
+    turns: int
+    state: HanabiGameState
+
+
+def create_game(
+    n_players: int = 3,
+    ai_engine_type: AIEngineType = ProbabilisticEngine,
+    events: EventSink = NULL_SINK,
+    rng: random.Random | None = None,
+    profiler: Profiler | None = None,
+    deck: HanabiDeck | None = None,
+) -> HanabiGame:
+    """
+    Creates a game where every seat is controlled by an AI. No events
+      are rendered, unless an event sink is given.
+
+    The deck is shuffled and the AIs make their random choices with
+      the given random number generator. If a profiler is given,
+      the phases of the game are recorded by it. If a deck is given,
+      the game is played with it rather than a newly shuffled deck.
+    """
+    if n_players < 3 or n_players > 5:
+        raise ValueError(f"Invalid number of players: {n_players} (expected 3-5)")
+
+    players = [
+        AIPlayer(player_id, KnowledgeBase(PlayerHand(), events), ai_engine_type)
+        for player_id in range(n_players)
+    ]
+
+    tokens = HanabiTokens(events)
+    board = HanabiBoard(tokens, events)
+    rng = rng or random.Random()
+    if deck is None:
+        deck = HanabiDeck(rng=rng)
+
+    return HanabiGame(
+        players=players,
+        board=board,
+        deck=deck,
+        events=events,
+        rng=rng,
+        profiler=profiler,
+    )
+
+
+def play_game(
+    n_players: int = 3,
+    seed: int | None = None,
+    ai_engine_type: AIEngineType = ProbabilisticEngine,
+    profiler: Profiler | None = None,
+    replays: ReplayWriter | None = None,
+) -> GameResult:
+    """
+    Plays a single AI-only game to completion without any console I/O.
+
+    The game is played with its own random number generator, thus the
+      global random state is left untouched and a game is fully
+      determined by its seed. If a replay writer is given, the game is
+      recorded to it.
+    """
+    events = NULL_SINK if replays is None else ReplayRecorder(replays, seed)
+
+    game = create_game(
+        n_players,
+        ai_engine_type,
+        events=events,
+        rng=random.Random(seed),
+        profiler=profiler,
+    )
+    game.play()
+
+    # A lost game is worth nothing.
+    score = game.calculate_points() if game.state == HanabiGameState.Won else 0
+
+    return GameResult(score=score, turns=game.turns, state=game.state)
+
+
+def simulate(
+    n_games: int,
+    players: int = 3,
+    seed: int | None = None,
+    ai_engine_type: AIEngineType = ProbabilisticEngine,
+    profiler: Profiler | None = None,
+    replays: ReplayWriter | None = None,
+) -> List[GameResult]:
+    """
+    Plays n_games AI-only games headlessly and returns their results.
+
+    When a seed is given, game i is played with the seed 'seed + i',
+      such that any single game of a batch can be reproduced.
+      A profiler given records the phases of all the games, and a
+      replay writer given records the games themselves.
+    """
+    return [
+        play_game(
+            n_players=players,
+            seed=None if seed is None else seed + i,
+            ai_engine_type=ai_engine_type,
+            profiler=profiler,
+            replays=replays,
+        )
+        for i in range(n_games)
+    ]
+
+
+def format_summary(results: List[GameResult], elapsed: float) -> str:
+    """
+    Formats a short summary of a batch of simulated games.
+    """
+    n_games = len(results)
+    if not n_games:
+        return "No games were played."
+
+    won = sum(1 for r in results if r.state == HanabiGameState.Won)
+
+    return (
+        f"Games: {n_games}\n"
+        f"Won: {won} ({won / n_games:.1%})\n"
+        f"Mean score: {fmean(r.score for r in results):.2f}\n"
+        f"Mean turns: {fmean(r.turns for r in results):.2f}\n"
+        f"Elapsed: {elapsed:.2f}s ({n_games / elapsed if elapsed else 0:.1f} games/s)"
+    )
@@ -1,11 +1,15 @@
 from .base import AbstractTokens
+from .events import NULL_SINK, EventSink, FuseLit, HintReclaimed, HintUsed
 from .exceptions import GameIsOver
+from .zobrist import FUSE_TOKENS, HINT_TOKENS
 
 
 class HanabiTokens(AbstractTokens):
-    def __init__(self) -> None:
+    def __init__(self, events: EventSink = NULL_SINK) -> None:
         self._hint_tokens = 8
         self._fuse_tokens = 3
+        self._events = events
+        self._hash = HINT_TOKENS[8] ^ FUSE_TOKENS[3]
 
     def use_hint_token(self):
         """
@@ -14,32 +18,52 @@ class HanabiTokens(AbstractTokens):
         if self._hint_tokens <= 0:
             return False
 
-        print("Hint token was used!")
+        self._hash ^= (
+            HINT_TOKENS[self._hint_tokens] ^ HINT_TOKENS[self._hint_tokens - 1]
+        )
         self._hint_tokens -= 1
+        self._events.emit(HintUsed(self._hint_tokens))
         return True
 
     def reclaim_hint_token(self):
         """
         Reclaims a hint token after having discarded a card.
         """
-        if self._hint_tokens < 8:
-            print("Hint token was reclaimed!")
-            self._hint_tokens += 1
-        else:
-            print(
-                "You already have the maximum amount of hint tokens. No hint token was added."
+        is_reclaimed = self._hint_tokens < 8
+        if is_reclaimed:
+            self._hash ^= (
+                HINT_TOKENS[self._hint_tokens] ^ HINT_TOKENS[self._hint_tokens + 1]
             )
+            self._hint_tokens += 1
+
+        self._events.emit(HintReclaimed(self._hint_tokens, is_reclaimed))
 
     def use_fuse_token(self):
         """
         Uses a fuse token if a mistake is made.
         """
-        print("The fuse is lit and it is getting shorter!")
+        self._hash ^= (
+            FUSE_TOKENS[self._fuse_tokens] ^ FUSE_TOKENS[self._fuse_tokens - 1]
+        )
         self._fuse_tokens -= 1
+        self._events.emit(FuseLit(self._fuse_tokens))
         if self._fuse_tokens <= 0:
-            print("KABOOM!!!")
             raise GameIsOver
 
+    def clone(self) -> "HanabiTokens":
+        tokens = HanabiTokens()
+        tokens._hint_tokens = self._hint_tokens
+        tokens._fuse_tokens = self._fuse_tokens
+        tokens._hash = self._hash
+        return tokens
+
+    def snapshot(self) -> tuple:
+        return self._hint_tokens, self._fuse_tokens
+
+    def restore(self, snapshot: tuple) -> None:
+        self._hint_tokens, self._fuse_tokens = snapshot
+        self._hash = HINT_TOKENS[self._hint_tokens] ^ FUSE_TOKENS[self._fuse_tokens]
+
     @property
     def hint_tokens(self) -> int:
         return self._hint_tokens
@@ -47,3 +71,7 @@ class HanabiTokens(AbstractTokens):
     @property
     def fuse_tokens(self) -> int:
         return self._fuse_tokens
+
+    @property
+    def zobrist_hash(self) -> int:
+        return self._hash
@@ -0,0 +1,159 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+from .base import HanabiGameState
+from .engine import AIEngineType, ProbabilisticEngine
+from .replay import ReplayWriter
+from .simulation import GameResult, play_game
+
+
+@dataclass(frozen=True)
+class TournamentStats:
+    """
+    A snapshot of the results of a tournament in progress.
+    """
+
+    games: int
+    total_games: int
+    mean_score: float
+    win_rate: float
+    standard_error: float
+
+    @property
+    def is_complete(self) -> bool:
+        return self.games == self.total_games
+
+    def __str__(self) -> str:
+        return (
+            f"[{self.games}/{self.total_games}] "
+            f"mean score: {self.mean_score:.3f} +/- {self.standard_error:.3f}, "
+            f"win rate: {self.win_rate:.1%}"
+        )
+
+
+class RunningStats:
+    """
+    Accumulates game results in any order.
+
+    Only integer sums are kept, such that the final statistics are
+      identical regardless of the order in which the results arrive.
+    """
+
+    def __init__(self, total_games: int) -> None:
+        self._total_games = total_games
+        self._games = 0
+        self._won = 0
+        self._score_sum = 0
+        self._score_square_sum = 0
+
+    def add(self, result: GameResult) -> None:
+        self._games += 1
+        self._won += result.state == HanabiGameState.Won
+        self._score_sum += result.score
+        self._score_square_sum += result.score * result.score
+
+    def snapshot(self) -> TournamentStats:
+        n = self._games
+        if not n:
+            return TournamentStats(0, self._total_games, 0.0, 0.0, 0.0)
+
+        total, square_total = self._score_sum, self._score_square_sum
+        mean = total / n
+        if n > 1:
+            variance = (n * square_total - total * total) / (n * (n - 1))
+            standard_error = math.sqrt(variance / n)
+        else:
+            standard_error = 0.0
+
+        return TournamentStats(
+            games=n,
+            total_games=self._total_games,
+            mean_score=mean,
+            win_rate=self._won / n,
+            standard_error=standard_error,
+        )
+
+
+# The configuration of a worker process. It is set once per worker by
+# '_init_worker', such that only seeds have to be sent along with each chunk.
+_worker_config: Tuple[int, AIEngineType, str | None] = (3, ProbabilisticEngine, None)
+
+
+def _init_worker(
+    n_players: int, ai_engine_type: AIEngineType, record_dir: str | None = None
+) -> None:
+    global _worker_config
+    _worker_config = (n_players, ai_engine_type, record_dir)
+
+
+def _play_chunk(seeds: range) -> List[GameResult]:
+    # Every game is created anew rather than reset, as dealing a game is
+    # well below 1% of playing it (0.2ms out of 60ms with 3 players).
+    n_players, ai_engine_type, record_dir = _worker_config
+    if record_dir is None:
+        return [play_game(n_players, seed, ai_engine_type) for seed in seeds]
+
+    # Every chunk is recorded to a file of its own, named by its first seed.
+    path = os.path.join(record_dir, f"{seeds.start:012d}.replay")
+    with ReplayWriter(path) as replays:
+        return [
+            play_game(n_players, seed, ai_engine_type, replays=replays)
+            for seed in seeds
+        ]
+
+
+def _chunks(n_games: int, seed: int, chunk_size: int) -> Iterator[range]:
+    for start in range(0, n_games, chunk_size):
+        yield range(seed + start, seed + min(start + chunk_size, n_games))
+
+
+def run_tournament(
+    n_games: int,
+    players: int = 3,
+    workers: int | None = None,
+    seed: int = 0,
+    chunk_size: int = 16,
+    ai_engine_type: AIEngineType = ProbabilisticEngine,
+    record_dir: str | None = None,
+) -> Iterator[TournamentStats]:
+    """
+    Plays n_games AI-only games sharded across a pool of worker processes.
+
+    Game i is always played with the seed 'seed + i', thus the results
+      do not depend on the number of workers. A snapshot of the
+      statistics is yielded every time a chunk of games is completed,
+      the last one covering all games.
+
+    If a directory is given, the games are recorded to replay files in it.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+    if record_dir is not None:
+        os.makedirs(record_dir, exist_ok=True)
+
+    stats = RunningStats(n_games)
+    chunks = _chunks(n_games, seed, chunk_size)
+
+    if workers == 1:
+        _init_worker(players, ai_engine_type, record_dir)
+        for chunk in chunks:
+            for result in _play_chunk(chunk):
+                stats.add(result)
+            yield stats.snapshot()
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(players, ai_engine_type, record_dir),
+    ) as executor:
+        futures = [executor.submit(_play_chunk, chunk) for chunk in chunks]
+
+        for future in as_completed(futures):
+            for result in future.result():
+                stats.add(result)
+            yield stats.snapshot()
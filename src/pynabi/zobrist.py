@@ -0,0 +1,112 @@
+"""
+Zobrist hashing of the parts of a game, such that states can be stored
+  in transposition tables.
+
+Every part of a game (board, tokens, deck, hands and knowledge bases)
+  keeps a 64-bit hash of itself up to date as it changes, by XOR-ing
+  random keys in and out. The keys are drawn from a fixed seed, thus
+  hashes are equal across processes and runs.
+
+Unordered collections of cards, i.e. the played and the discarded
+  cards, are hashed as the sum of the keys of their cards (modulo 2^64),
+  such that copies of a card do not cancel each other out.
+"""
+
+import random
+from typing import Iterable, Sequence, Tuple
+
+from .base import HAND_SIZE, Card, HanabiGameState
+
+MASK = (1 << 64) - 1
+
+# More cards than a (standard) deck holds.
+_DECK_SIZE = 50
+
+_rng = random.Random(0x5EED_4A5B1)
+
+
+def _keys(n: int) -> Tuple[int, ...]:
+    return tuple(_rng.getrandbits(64) for _ in range(n))
+
+
+# The height of each pile, indexed by colour (see base.COLOURS) and height.
+PILES = tuple(_keys(6) for _ in range(5))
+
+HINT_TOKENS = _keys(9)
+FUSE_TOKENS = _keys(4)
+
+# The card at each position of the deck, indexed by position and card id.
+DECK = tuple(_keys(25) for _ in range(_DECK_SIZE))
+DECK_SIZES = _keys(_DECK_SIZE + 1)
+
+PLAYED = _keys(25)
+DISCARDED = _keys(25)
+
+# The card in each slot of a hand, indexed by slot and card id.
+HAND = tuple(_keys(25) for _ in range(HAND_SIZE))
+
+# The knowledge about each slot of a hand, indexed by slot, colour and
+# the 5-bit set of values of that colour, which the card may be.
+KNOWLEDGE = tuple(tuple(_keys(32) for _ in range(5)) for _ in range(HAND_SIZE))
+
+CURRENT_PLAYER = _keys(5)
+COUNTDOWN = _keys(6)
+GAME_STATES = dict(zip(HanabiGameState, _keys(len(HanabiGameState))))
+
+# Odd multipliers, which tell the hands (and knowledge) of the seats apart.
+SEATS = tuple(key | 1 for key in _keys(5))
+
+
+def seat(player_id: int, h: int) -> int:
+    """
+    Scrambles the hash of a hand (or knowledge base) by the seat of its owner.
+    """
+    return h * SEATS[player_id] & MASK
+
+
+def hash_hand(cards: Sequence[Card], start: int = 0) -> int:
+    """
+    Hashes the cards in the slots of a hand from the start slot onwards.
+    """
+    h = 0
+    for slot in range(start, len(cards)):
+        h ^= HAND[slot][cards[slot].id]
+
+    return h
+
+
+def hash_mask(slot: int, mask: int) -> int:
+    keys = KNOWLEDGE[slot]
+    return (
+        keys[0][mask & 0x1F]
+        ^ keys[1][mask >> 5 & 0x1F]
+        ^ keys[2][mask >> 10 & 0x1F]
+        ^ keys[3][mask >> 15 & 0x1F]
+        ^ keys[4][mask >> 20 & 0x1F]
+    )
+
+
+def hash_masks(masks: Sequence[int], start: int = 0) -> int:
+    """
+    Hashes the knowledge about the slots of a hand from the start slot onwards.
+    """
+    h = 0
+    for slot in range(start, len(masks)):
+        h ^= hash_mask(slot, masks[slot])
+
+    return h
+
+
+def hash_deck(cards: Iterable[Card]) -> int:
+    h = 0
+    for position, card in enumerate(cards):
+        h ^= DECK[position][card.id]
+
+    return h
+
+
+def hash_pile(keys: Tuple[int, ...], cards: Iterable[Card]) -> int:
+    """
+    Hashes an unordered pile of cards, e.g. the discarded cards.
+    """
+    return sum(keys[card.id] for card in cards) & MASK
@@ -0,0 +1,57 @@
+import random
+import unittest
+
+from pynabi.actions import (
+    LegalActions,
+    action_to_move,
+    create_move_from_id,
+    iter_actions,
+    move_to_action,
+    n_actions,
+)
+from pynabi.base import HanabiGameState
+from pynabi.simulation import create_game
+
+
+class TestActions(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(4, rng=random.Random(0))
+        self.game.start()
+        self.legal = LegalActions(self.game)
+
+    def legal_moves(self) -> set:
+        player = self.game.current_player
+        return set(player.get_legal_moves(self.game))
+
+    def test_action_ids_round_trip(self):
+        # Act & Assert
+        for player_id in range(4):
+            for action in range(n_actions(4)):
+                move = action_to_move(4, player_id, action)
+                self.assertEqual(action, move_to_action(4, player_id, move))
+
+    def test_mask_matches_legal_moves(self):
+        # Arrange
+        rng = random.Random(2)
+
+        # Act & Assert
+        while self.game.state == HanabiGameState.Playing:
+            player_id = self.game.current_player.player_id
+            actions = set(iter_actions(self.legal.mask()))
+            expected = self.legal_moves()
+            self.assertEqual(
+                expected, {action_to_move(4, player_id, a) for a in actions}
+            )
+
+            action = rng.choice(sorted(actions))
+            move = action_to_move(4, player_id, action)
+            self.game.step(create_move_from_id(self.game, action))
+            self.legal.update(player_id, move)
+
+    def test_moves_are_shared(self):
+        # Act
+        expected = create_move_from_id(self.game, 3)
+        actual = create_move_from_id(self.game, 3)
+
+        # Assert
+        self.assertIs(expected, actual)
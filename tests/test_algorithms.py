@@ -0,0 +1,52 @@
+import math
+import unittest
+
+from pynabi.algorithms import Node, select_child
+
+
+class TestNode(unittest.TestCase):
+    def test_leaves_do_not_own_a_dict_of_children(self):
+        # Arrange
+        parent = Node(move=None)
+        leaf = Node(move=(0,), parent=parent)
+
+        # Act
+        parent.add_children([leaf])
+
+        # Assert
+        self.assertIs(leaf, parent.children[(0,)])
+        self.assertIs(Node(move=None).children, leaf.children)
+        with self.assertRaises(TypeError):
+            leaf.children[(1,)] = parent
+
+    def test_select_child_picks_the_highest_ucb_value(self):
+        # Arrange
+        parent = Node(move=None, visits=30)
+        children = [
+            Node(move=(i,), parent=parent, visits=visits, wins=wins)
+            for i, (visits, wins) in enumerate([(10, 5.0), (15, 9.0), (5, 2.0)])
+        ]
+
+        def ucb(child):
+            return child.wins / child.visits + 0.5 * math.sqrt(
+                math.log(parent.visits) / child.visits
+            )
+
+        # Act
+        selected = select_child(parent, children, 0.5)
+
+        # Assert
+        self.assertIs(max(children, key=ucb), selected)
+
+    def test_select_child_explores_by_availability(self):
+        # Arrange
+        parent = Node(move=None, visits=1000)
+        rare = Node(move=(0,), parent=parent, visits=2, wins=1.0)
+        common = Node(move=(1,), parent=parent, visits=2, wins=1.0)
+        rare.available, common.available = 2, 900
+
+        # Act
+        selected = select_child(parent, [rare, common], 1.0)
+
+        # Assert
+        self.assertIs(common, selected)
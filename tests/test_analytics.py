@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from pynabi.analytics import (
+    analyse_directory,
+    analyse_file,
+    replay_game,
+    turn_stats,
+)
+from pynabi.base import HanabiGameState
+from pynabi.replay import ReplayReader, ReplayWriter
+from pynabi.simulation import simulate
+
+
+class TestAnalytics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.replay")
+
+        with ReplayWriter(self.path) as writer:
+            self.results = simulate(4, players=3, seed=3, replays=writer)
+
+        with ReplayReader(self.path) as reader:
+            self.replays = list(reader)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_replay_reproduces_the_game(self):
+        # Act & Assert
+        for result, replay in zip(self.results, self.replays):
+            for game, _, _ in replay_game(replay):
+                pass
+
+            self.assertEqual(result.state, game.state)
+            self.assertEqual(result.turns, game.turns)
+            if game.state == HanabiGameState.Won:
+                self.assertEqual(result.score, game.calculate_points())
+
+    def test_misplays_are_counted(self):
+        # Act
+        stats = turn_stats(self.replays[0])
+
+        # Assert
+        self.assertEqual(len(self.replays[0].actions), len(stats))
+        self.assertEqual(3 - stats[-1].fuse_tokens, sum(t.misplay for t in stats))
+
+    def test_directory_statistics_match_file_statistics(self):
+        # Arrange
+        expected = analyse_file(self.path)
+
+        # Act
+        actual = analyse_directory(self.directory.name, workers=1)
+
+        # Assert
+        self.assertEqual(4, actual.games)
+        self.assertEqual(sum(r.score for r in self.results), actual.score_sum)
+        self.assertEqual(expected.points_by_turn, actual.points_by_turn)
+        self.assertEqual(expected.turns_sum, actual.turns_sum)
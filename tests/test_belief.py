@@ -0,0 +1,52 @@
+import unittest
+
+from pynabi.simulation import create_game
+
+try:
+    import numpy as np
+
+    from pynabi.belief import VectorizedProbabilisticEngine, hand_beliefs
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+@unittest.skipUnless(np, "NumPy is not installed")
+class TestBelief(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(3)
+        self.game.start()
+        self.player = self.game.current_player
+
+    def test_beliefs_are_distributions(self):
+        # Act
+        beliefs = hand_beliefs(self.game, self.player)
+
+        # Assert
+        self.assertEqual((5, 25), beliefs.shape)
+        np.testing.assert_allclose(beliefs.sum(axis=1), np.ones(5))
+
+    def test_beliefs_respect_hints(self):
+        # Arrange
+        card = self.player.knowledgebase.hand[0]
+        self.player.knowledgebase.reveal_colour(card.colour)
+        self.player.knowledgebase.reveal_value(card.value)
+
+        # Act
+        beliefs = hand_beliefs(self.game, self.player)
+
+        # Assert
+        self.assertEqual(1.0, beliefs[0, card.id])
+
+    def test_heuristics_match_probabilistic_engine(self):
+        # Arrange
+        engine = VectorizedProbabilisticEngine(self.game, self.player)
+
+        # Act
+        engine.make_move()
+
+        # Assert
+        for i in range(5):
+            self.assertAlmostEqual(
+                super(VectorizedProbabilisticEngine, engine)._play_card_heuristic(i),
+                engine._play_card_heuristic(i),
+            )
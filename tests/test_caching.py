@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from pynabi.caching import HeuristicCache
+from pynabi.engine import ProbabilisticEngine
+from pynabi.simulation import create_game
+
+
+class TestHeuristicCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = HeuristicCache(maxsize=2)
+
+    def test_miss_then_hit(self):
+        # Act
+        miss = self.cache.get("a")
+        self.cache.put("a", 1.0)
+        hit = self.cache.get("a")
+
+        # Assert
+        self.assertIsNone(miss)
+        self.assertEqual(1.0, hit)
+        self.assertEqual(
+            (1, 1), (self.cache.cache_info().hits, self.cache.cache_info().misses)
+        )
+
+    def test_least_recently_used_value_is_evicted(self):
+        # Arrange
+        self.cache.put("a", 1.0)
+        self.cache.put("b", 2.0)
+        self.cache.get("a")
+
+        # Act
+        self.cache.put("c", 3.0)
+
+        # Assert
+        self.assertEqual(2, len(self.cache))
+        self.assertEqual(1.0, self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+
+    def test_cached_engine_makes_the_same_moves(self):
+        # Arrange
+        cache = HeuristicCache()
+        games = [create_game(3, rng=random.Random(4)) for _ in range(2)]
+        for game in games:
+            game.start()
+
+        # Act & Assert
+        for _ in range(30):
+            expected = ProbabilisticEngine(
+                games[0], games[0].current_player, cache=None
+            )
+            actual = ProbabilisticEngine(games[1], games[1].current_player, cache=cache)
+
+            expected_move, actual_move = expected.make_move(), actual.make_move()
+            self.assertEqual(expected_move.move, actual_move.move)
+
+            games[0].step(expected_move)
+            games[1].step(actual_move)
+
+        self.assertGreater(cache.cache_info().hits, 0)
@@ -0,0 +1,69 @@
+import unittest
+
+from pynabi.base import Card, CardColour
+from pynabi.counting import CardCounts
+from pynabi.deck import HanabiDeck
+from pynabi.probability import _get_known_cards
+from pynabi.simulation import create_game
+
+
+class TestCardCounts(unittest.TestCase):
+    def setUp(self) -> None:
+        self.counts = CardCounts(HanabiDeck(do_shuffle=False))
+
+    def test_full_deck_counts(self):
+        # Assert
+        self.assertEqual(45, len(self.counts))
+        self.assertEqual(2, self.counts.count(Card(value=1, colour=CardColour.Red)))
+        self.assertEqual(1, self.counts.count(Card(value=5, colour=CardColour.Red)))
+
+    def test_remove_updates_counts(self):
+        # Arrange
+        card = Card(value=5, colour=CardColour.Blue)
+
+        # Act
+        self.counts.remove(card)
+
+        # Assert
+        self.assertEqual(0, self.counts.count(card))
+        self.assertEqual(44, len(self.counts))
+
+    def test_remove_missing_card_raises_error(self):
+        # Arrange
+        card = Card(value=5, colour=CardColour.Blue)
+        self.counts.remove(card)
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            self.counts.remove(card)
+
+    def test_matching_filters_by_colour_and_value(self):
+        # Act
+        reds = self.counts.matching(colour=CardColour.Red)
+        twos = self.counts.matching(value=2)
+
+        # Assert
+        self.assertEqual(9, len(reds))
+        self.assertEqual(10, len(twos))
+        self.assertTrue(all(card.colour == CardColour.Red for card in reds))
+
+
+class TestRemainingCounts(unittest.TestCase):
+    def test_remaining_counts_match_unseen_cards(self):
+        # Arrange
+        game = create_game(3)
+        game.start()
+        for _ in range(12):
+            *_, move = game.current_player.get_legal_moves(game)
+            game.apply_move(move)
+
+        player = game.current_player
+        expected = CardCounts(HanabiDeck(do_shuffle=False))
+        for card in _get_known_cards(game, player):
+            expected.remove(card)
+
+        # Act
+        actual = player.knowledgebase.remaining_counts(game.deck)
+
+        # Assert
+        self.assertEqual(expected, actual)
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from pynabi.base import Card
@@ -42,3 +43,43 @@ class TestHanabiDeck(unittest.TestCase):
         # Assert
         self.assertIsNone(actual)
         self.assertEqual(0, new_len)
+
+    def test_deck_uses_interned_cards(self):
+        # Act
+        cards = list(self.deck)
+
+        # Assert
+        for card in cards:
+            self.assertIs(Card.from_id(card.id), card)
+
+    def test_card_ids_are_unique(self):
+        # Arrange
+        cards = set(self.deck)
+
+        # Act
+        ids = set(card.id for card in cards)
+
+        # Assert
+        self.assertEqual(25, len(cards))
+        self.assertEqual(set(range(25)), ids)
+
+    def test_same_seed_gives_same_deal(self):
+        # Arrange
+        expected = list(HanabiDeck(rng=random.Random(7)))
+
+        # Act
+        actual = list(HanabiDeck(rng=random.Random(7)))
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test_deck_from_ids_draws_from_the_end(self):
+        # Arrange
+        deck = HanabiDeck.from_ids([0, 24, 5])
+
+        # Act
+        drawn = [deck.draw(), deck.draw(), deck.draw()]
+
+        # Assert
+        self.assertEqual([Card.from_id(i) for i in (5, 24, 0)], drawn)
+        self.assertIsNone(deck.draw())
@@ -0,0 +1,82 @@
+import itertools
+import random
+import unittest
+
+from pynabi.base import HanabiGameState
+from pynabi.counting import CardCounts
+from pynabi.determinization import DeterminizationSampler
+from pynabi.simulation import create_game
+
+
+class TestDeterminizationSampler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(3, rng=random.Random(4))
+        self.game.start()
+
+        # Give some hints, such that the hand is partially known.
+        rng = random.Random(8)
+        for _ in range(15):
+            moves = list(self.game.current_player.get_legal_moves(self.game))
+            self.game.apply_move(rng.choice(moves))
+
+        self.player = self.game.players[0]
+        self.kb = self.player.knowledgebase
+        self.sampler = DeterminizationSampler(self.game, self.player, random.Random(0))
+
+    def test_hands_are_consistent_with_knowledge(self):
+        # Act
+        hands = [self.sampler.sample_hand() for _ in range(200)]
+
+        # Assert
+        for hand in hands:
+            self.assertEqual(len(self.kb), len(hand))
+            for mask, card in zip(self.kb.masks, hand):
+                self.assertTrue(mask >> card.id & 1)
+
+    def test_hand_and_deck_are_the_unseen_cards(self):
+        # Arrange
+        expected = self.kb.remaining_counts(self.game.deck)
+
+        # Act
+        hand, deck = self.sampler.sample()
+
+        # Assert
+        self.assertEqual(len(self.game.deck), len(deck))
+        self.assertEqual(expected, CardCounts(hand + deck))
+
+    def test_number_of_hands_matches_enumeration(self):
+        # Arrange
+        remaining = self.kb.remaining_counts(self.game.deck)
+        candidates = [
+            [card for card, _ in remaining.items() if mask >> card.id & 1]
+            for mask in self.kb.masks
+        ]
+
+        # Act
+        expected = 0
+        for hand in itertools.product(*candidates):
+            ways = 1
+            for i, card in enumerate(hand):
+                # Pick one of the copies not yet in the hand.
+                ways *= max(remaining.count(card) - hand[:i].count(card), 0)
+            expected += ways
+
+        # Assert
+        self.assertEqual(expected, self.sampler.n_hands)
+
+    def test_determinize_does_not_modify_the_game(self):
+        # Arrange
+        hand = list(self.kb.hand)
+        deck = list(self.game.deck)
+
+        # Act
+        state = self.sampler.determinize()
+
+        # Assert
+        self.assertEqual(hand, list(self.kb.hand))
+        self.assertEqual(deck, list(self.game.deck))
+        self.assertEqual(HanabiGameState.Playing, state.state)
+        self.assertEqual(
+            self.game.information_set_hash(self.player.player_id),
+            state.information_set_hash(self.player.player_id),
+        )
@@ -0,0 +1,348 @@
+import random
+import time
+import unittest
+
+from pynabi.algorithms import Node
+from pynabi.base import Action
+from pynabi.engine import ISMCTSEngine, MCTSEngine, ProbabilisticEngine, create_move
+from pynabi.simulation import create_game
+
+
+class TestMCTSEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(3, rng=random.Random(2))
+        self.game.start()
+        self.player = self.game.current_player
+
+    def test_search_visits_legal_moves_only(self):
+        # Arrange
+        legal_moves = set(self.player.get_legal_moves(self.game))
+        engine = MCTSEngine(self.game, self.player, iterations=50)
+
+        # Act
+        engine.make_move()
+
+        # Assert
+        self.assertTrue(engine._root.children)
+        self.assertLessEqual(set(engine._root.children), legal_moves)
+        self.assertEqual(50, engine._root.visits)
+
+    def test_search_does_not_modify_the_game(self):
+        # Arrange
+        hand = list(self.player.knowledgebase.hand)
+        deck = list(self.game.deck)
+        engine = MCTSEngine(self.game, self.player, iterations=20)
+
+        # Act
+        engine.make_move()
+
+        # Assert
+        self.assertEqual(hand, list(self.player.knowledgebase.hand))
+        self.assertEqual(deck, list(self.game.deck))
+        self.assertEqual(8, self.game.board.tokens.hint_tokens)
+
+    def test_move_can_be_applied(self):
+        # Arrange
+        engine = MCTSEngine(self.game, self.player, iterations=20)
+
+        # Act
+        self.game.step(engine.make_move())
+
+        # Assert
+        self.assertEqual(1, self.game.turns)
+        self.assertIsNot(self.player, self.game.current_player)
+
+    def test_search_is_reproducible_with_seed(self):
+        # Arrange
+        expected = MCTSEngine(
+            self.game, self.player, iterations=30, rng=random.Random(3)
+        )
+        expected.make_move()
+
+        # Act
+        actual = MCTSEngine(self.game, self.player, iterations=30, rng=random.Random(3))
+        actual.make_move()
+
+        # Assert
+        self.assertEqual(
+            {move: child.visits for move, child in expected._root.children.items()},
+            {move: child.visits for move, child in actual._root.children.items()},
+        )
+
+    def test_unknown_card_is_not_played_blindly(self):
+        # Arrange
+        engine = MCTSEngine(
+            self.game, self.player, iterations=200, rng=random.Random(2)
+        )
+
+        # Act
+        move = engine.make_move()
+
+        # Assert
+        self.assertNotEqual(Action.PLAY, move.move[0])
+
+    def test_root_parallel_search_merges_the_roots(self):
+        # Arrange
+        engine = MCTSEngine(
+            self.game, self.player, iterations=20, rng=random.Random(3), workers=2
+        )
+
+        # Act
+        self.game.step(engine.make_move())
+
+        # Assert
+        self.assertEqual(40, engine.root.visits)
+        self.assertEqual(
+            40, sum(child.visits for child in engine.root.children.values())
+        )
+
+    def test_leaf_batches_are_played_out_alike_by_workers(self):
+        # Arrange
+        expected = MCTSEngine(
+            self.game, self.player, iterations=24, rng=random.Random(3), leaf_batch=8
+        )
+        expected.make_move()
+
+        # Act
+        actual = MCTSEngine(
+            self.game,
+            self.player,
+            iterations=24,
+            rng=random.Random(3),
+            workers=2,
+            leaf_batch=8,
+        )
+        actual.make_move()
+
+        # Assert
+        self.assertEqual(24, actual.root.visits)
+        self.assertEqual(
+            {move: child.wins for move, child in expected.root.children.items()},
+            {move: child.wins for move, child in actual.root.children.items()},
+        )
+
+    def _play_along_the_tree(self, engine):
+        self.game.step(engine.make_move())
+        node = engine.root.children[self.game.history[-1][1]]
+
+        # Let the other players give hints, which are (made to be) in the tree,
+        # such that the game goes on.
+        while self.game.current_player is not self.player:
+            player = self.game.current_player
+            move = next(
+                move
+                for move in player.get_legal_moves(self.game)
+                if move[0] == Action.INFO
+            )
+            if move not in node.children:
+                node.add_children([Node(move=move, parent=node)])
+
+            node = node.children[move]
+            node.visits += 7
+            self.game.step(create_move(move))
+
+        return node
+
+    def test_tree_is_reused_along_the_moves_made(self):
+        # Arrange
+        engine = MCTSEngine(
+            self.game,
+            self.player,
+            iterations=100,
+            exploration=0.0,
+            rng=random.Random(3),
+        )
+        node = self._play_along_the_tree(engine)
+        reused = node.visits
+
+        # Act
+        engine.make_move()
+
+        # Assert
+        self.assertIs(node, engine.root)
+        self.assertIsNone(engine.root.parent)
+        self.assertEqual(reused + 100, engine.root.visits)
+
+    def test_tree_is_not_reused_after_unknown_moves(self):
+        # Arrange
+        engine = MCTSEngine(
+            self.game,
+            self.player,
+            iterations=100,
+            exploration=0.0,
+            rng=random.Random(3),
+        )
+        self._play_along_the_tree(engine)
+        self.game.history[-1] = (self.game.history[-1][0], None)
+
+        # Act
+        engine.make_move()
+
+        # Assert
+        self.assertEqual(100, engine.root.visits)
+
+    def test_search_stops_at_node_budget(self):
+        # Arrange
+        engine = MCTSEngine(self.game, self.player, iterations=100)
+
+        # Act
+        engine.make_move(max_nodes=10)
+
+        # Assert
+        self.assertEqual(10, engine.stats.nodes)
+        self.assertEqual(10, engine.root.visits)
+        self.assertFalse(engine.stats.timed_out)
+
+    def test_search_stops_at_deadline(self):
+        # Arrange
+        legal_moves = list(self.player.get_legal_moves(self.game))
+        engine = MCTSEngine(self.game, self.player, iterations=10**6)
+
+        # Act
+        move = engine.make_move(deadline=time.perf_counter() + 0.05)
+
+        # Assert
+        self.assertTrue(engine.stats.timed_out)
+        self.assertLess(engine.stats.elapsed, 1.0)
+        self.assertIn(move.move, legal_moves)
+        self.assertEqual(move.move, engine.best_move())
+
+    def test_search_on_workers_stops_at_deadline(self):
+        # Arrange
+        engine = MCTSEngine(self.game, self.player, iterations=400, workers=2)
+
+        # Act
+        move = engine.make_move(deadline=time.perf_counter() - 0.001)
+
+        # Assert
+        self.assertTrue(engine.stats.timed_out)
+        self.assertEqual(0, engine.stats.nodes)
+        self.assertEqual(Action.INFO, move.move[0])
+
+    def test_engine_without_time_left_does_not_search(self):
+        # Arrange
+        engine = MCTSEngine(self.game, self.player, iterations=400, time_limit=0.0)
+
+        # Act
+        move = engine.make_move()
+
+        # Assert
+        self.assertTrue(engine.stats.timed_out)
+        self.assertEqual(0, engine.stats.nodes)
+        # Rather than a blind play of the first card.
+        self.assertEqual(Action.INFO, move.move[0])
+
+
+class TestProbabilisticEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(3, rng=random.Random(6))
+        self.game.start()
+        self.player = self.game.current_player
+        self.legal_moves = list(self.player.get_legal_moves(self.game))
+
+    def test_all_moves_are_scored_without_limits(self):
+        # Arrange
+        engine = ProbabilisticEngine(self.game, self.player)
+
+        # Act
+        move = engine.make_move()
+
+        # Assert
+        self.assertEqual(len(self.legal_moves), engine.stats.nodes)
+        self.assertEqual(move.move, engine.best_move())
+
+    def test_best_scored_move_is_made_within_budget(self):
+        # Arrange
+        engine = ProbabilisticEngine(self.game, self.player)
+
+        # Act
+        move = engine.make_move(max_nodes=1)
+
+        # Assert
+        self.assertEqual(1, engine.stats.nodes)
+        self.assertEqual(self.legal_moves[0], move.move)
+
+    def test_best_move_before_any_move_is_scored_is_safe(self):
+        # Arrange
+        engine = ProbabilisticEngine(self.game, self.player)
+
+        # Act
+        move = engine.best_move()
+
+        # Assert
+        self.assertIsNotNone(move)
+        self.assertEqual(Action.INFO, move[0])
+
+    def test_a_move_is_made_after_the_deadline(self):
+        # Arrange
+        engine = ProbabilisticEngine(self.game, self.player)
+
+        # Act
+        move = engine.make_move(deadline=time.perf_counter() - 1)
+
+        # Assert
+        self.assertTrue(engine.stats.timed_out)
+        self.assertEqual(1, engine.stats.nodes)
+        self.assertEqual(self.legal_moves[0], move.move)
+
+
+class TestISMCTSEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(3, rng=random.Random(2))
+        self.game.start()
+        self.player = self.game.current_player
+
+    def test_search_visits_legal_moves_only(self):
+        # Arrange
+        legal_moves = set(self.player.get_legal_moves(self.game))
+        engine = ISMCTSEngine(self.game, self.player, iterations=50)
+
+        # Act
+        engine.make_move()
+
+        # Assert
+        self.assertLessEqual(set(engine._root.children), legal_moves)
+        self.assertEqual(50, engine._root.visits)
+
+    def test_moves_are_available_at_least_as_often_as_visited(self):
+        # Arrange
+        engine = ISMCTSEngine(self.game, self.player, iterations=100)
+
+        # Act
+        engine.make_move()
+
+        # Assert
+        nodes = list(engine._root.children.values())
+        while nodes:
+            node = nodes.pop()
+            self.assertGreaterEqual(node.available, node.visits)
+            nodes += node.children.values()
+
+    def test_move_can_be_applied(self):
+        # Arrange
+        engine = ISMCTSEngine(self.game, self.player, iterations=20)
+
+        # Act
+        self.game.step(engine.make_move())
+
+        # Assert
+        self.assertEqual(1, self.game.turns)
+
+    def test_unknown_card_is_not_played_blindly(self):
+        # Arrange
+        engine = ISMCTSEngine(
+            self.game, self.player, iterations=200, rng=random.Random(2)
+        )
+
+        # Act
+        move = engine.make_move()
+
+        # Assert
+        self.assertNotEqual(Action.PLAY, move.move[0])
+
+
+class TestCreateMove(unittest.TestCase):
+    def test_invalid_move_raises_error(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            create_move(("fold",))
@@ -0,0 +1,100 @@
+import unittest
+
+try:
+    import numpy as np
+
+    from pynabi.env import HanabiEnv, VectorHanabiEnv
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+def _first_legal(legal_actions) -> int:
+    return int(np.flatnonzero(legal_actions)[0])
+
+
+@unittest.skipUnless(np, "NumPy is not installed")
+class TestHanabiEnv(unittest.TestCase):
+    def setUp(self) -> None:
+        self.env = HanabiEnv(3)
+
+    def test_reset_returns_fixed_size_observation(self):
+        # Act
+        observation, info = self.env.reset(seed=0)
+
+        # Assert
+        self.assertEqual((self.env.observation_size,), observation.shape)
+        self.assertEqual((self.env.n_actions,), info["legal_actions"].shape)
+        self.assertTrue(info["legal_actions"].any())
+
+    def test_same_seed_gives_same_observation(self):
+        # Arrange
+        expected, _ = self.env.reset(seed=3)
+
+        # Act
+        actual, _ = HanabiEnv(3).reset(seed=3)
+
+        # Assert
+        np.testing.assert_array_equal(expected, actual)
+
+    def test_return_is_the_score(self):
+        # Arrange
+        _, info = self.env.reset(seed=1)
+        total, terminated = 0, False
+
+        # Act
+        while not terminated:
+            _, reward, terminated, _, info = self.env.step(
+                _first_legal(info["legal_actions"])
+            )
+            total += reward
+
+        # Assert
+        self.assertEqual(info["score"], total)
+        self.assertFalse(info["legal_actions"].any())
+
+    def test_illegal_action_raises_error(self):
+        # Arrange
+        _, info = self.env.reset(seed=0)
+        action = int(np.flatnonzero(~info["legal_actions"])[0])
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            self.env.step(action)
+
+    def test_negative_action_raises_error(self):
+        # Arrange
+        _, info = self.env.reset(seed=0)
+        legal = int(np.flatnonzero(info["legal_actions"])[0])
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            self.env.step(legal - self.env.n_actions)
+
+
+@unittest.skipUnless(np, "NumPy is not installed")
+class TestVectorHanabiEnv(unittest.TestCase):
+    def test_step_returns_stacked_arrays(self):
+        # Arrange
+        env = VectorHanabiEnv(4, n_players=4)
+        _, info = env.reset(seed=0)
+
+        # Act
+        actions = [_first_legal(mask) for mask in info["legal_actions"]]
+        observations, rewards, terminated, truncated, info = env.step(actions)
+
+        # Assert
+        self.assertEqual((4, env.observation_size), observations.shape)
+        self.assertEqual((4,), rewards.shape)
+        self.assertEqual((4,), terminated.shape)
+        self.assertEqual((4, env.n_actions), info["legal_actions"].shape)
+
+    def test_games_match_single_environments(self):
+        # Arrange
+        env = VectorHanabiEnv(2)
+        observations, _ = env.reset(seed=10)
+
+        # Act
+        expected, _ = HanabiEnv().reset(seed=11)
+
+        # Assert
+        np.testing.assert_array_equal(expected, observations[1])
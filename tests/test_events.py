@@ -0,0 +1,57 @@
+import unittest
+
+from pynabi.events import (
+    CardPlayed,
+    EventBus,
+    EventCollector,
+    FuseLit,
+    GameEnded,
+    HintReclaimed,
+    HintUsed,
+    TurnStarted,
+)
+from pynabi.simulation import create_game
+from pynabi.tokens import HanabiTokens
+
+
+class TestTokenEvents(unittest.TestCase):
+    def setUp(self) -> None:
+        self.collector = EventCollector()
+        self.tokens = HanabiTokens(EventBus(self.collector))
+
+    def test_use_hint_token_emits_event(self):
+        # Act
+        self.tokens.use_hint_token()
+
+        # Assert
+        self.assertEqual([HintUsed(7)], self.collector.events)
+
+    def test_reclaim_with_all_tokens_emits_event(self):
+        # Act
+        self.tokens.reclaim_hint_token()
+
+        # Assert
+        self.assertEqual([HintReclaimed(8, is_reclaimed=False)], self.collector.events)
+
+    def test_use_fuse_token_emits_event(self):
+        # Act
+        self.tokens.use_fuse_token()
+
+        # Assert
+        self.assertEqual([FuseLit(2)], self.collector.events)
+
+
+class TestGameEvents(unittest.TestCase):
+    def test_game_emits_turns_and_end(self):
+        # Arrange
+        collector = EventCollector()
+        game = create_game(3, events=collector)
+
+        # Act
+        game.play()
+
+        # Assert
+        turns = [e for e in collector.events if isinstance(e, TurnStarted)]
+        self.assertEqual(game.turns, len(turns))
+        self.assertIsInstance(collector.events[-1], GameEnded)
+        self.assertTrue(any(isinstance(e, CardPlayed) for e in collector.events))
@@ -0,0 +1,136 @@
+import time
+import unittest
+
+from pynabi.base import Action, HanabiGameState
+from pynabi.engine import MCTSEngine, create_move
+from pynabi.player import AIPlayer
+from pynabi.simulation import create_game
+
+
+class TestHanabiGame(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(3)
+        self.game.start()
+
+    def test_step_passes_the_turn(self):
+        # Arrange
+        expected = self.game.players[1]
+
+        # Act
+        self.game.step(create_move((Action.DISCARD, 0)))
+
+        # Assert
+        self.assertIs(expected, self.game.current_player)
+        self.assertEqual(1, len(self.game.deck.discarded_pile))
+
+    def test_history_records_the_moves(self):
+        # Arrange
+        expected = [(0, (Action.DISCARD, 0)), (1, None)]
+
+        # Act
+        self.game.step(create_move((Action.DISCARD, 0)))
+        self.game.step(lambda game, player: player.discard(game, 1))
+
+        # Assert
+        self.assertEqual(expected, self.game.history)
+        self.assertEqual(self.game.turns, len(self.game.history))
+
+    def test_ai_player_keeps_its_engine_during_the_game(self):
+        # Arrange
+        player = self.game.current_player
+
+        # Act
+        player.take_turn(self.game)
+        engine = player._ai_engine
+        player.take_turn(self.game)
+
+        # Assert
+        self.assertIs(engine, player._ai_engine)
+        self.assertEqual([0, 0], [player_id for player_id, _ in self.game.history])
+
+    def test_ai_player_limits_the_time_of_its_engine(self):
+        # Arrange
+        player = AIPlayer(
+            0,
+            self.game.players[0].knowledgebase,
+            MCTSEngine,
+            {"iterations": 10**6},
+            time_limit=0.05,
+        )
+        start = time.perf_counter()
+
+        # Act
+        player.take_turn(self.game)
+
+        # Assert
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertTrue(player._ai_engine.stats.timed_out)
+
+    def test_clone_is_independent(self):
+        # Arrange
+        clone = self.game.clone()
+
+        # Act
+        clone.step(create_move((Action.DISCARD, 0)))
+
+        # Assert
+        self.assertEqual(0, self.game.turns)
+        self.assertEqual(0, len(self.game.deck.discarded_pile))
+        self.assertEqual(30, len(self.game.deck))
+        self.assertEqual(29, len(clone.deck))
+
+    def test_clone_has_the_same_cards(self):
+        # Act
+        clone = self.game.clone()
+
+        # Assert
+        for player, other in zip(self.game.players, clone.players):
+            self.assertEqual(
+                list(player.knowledgebase.hand), list(other.knowledgebase.hand)
+            )
+        self.assertEqual(list(self.game.deck), list(clone.deck))
+
+    def _fingerprint(self):
+        return (
+            self.game.state,
+            self.game.turns,
+            self.game.current_player.player_id,
+            self.game.board.calculate_points(),
+            self.game.board.tokens.hint_tokens,
+            self.game.board.tokens.fuse_tokens,
+            list(self.game.board.played_cards),
+            list(self.game.deck),
+            list(self.game.deck.discarded_pile),
+            [list(p.knowledgebase.hand) for p in self.game.players],
+            [list(p.knowledgebase) for p in self.game.players],
+        )
+
+    def _undo_game(self, pick_move):
+        expected = self._fingerprint()
+        n_moves = 0
+
+        while self.game.state == HanabiGameState.Playing:
+            moves = list(self.game.current_player.get_legal_moves(self.game))
+            self.game.apply_move(pick_move(moves))
+            n_moves += 1
+
+        for _ in range(n_moves):
+            self.game.undo_move()
+
+        return expected, self._fingerprint()
+
+    def test_undo_restores_the_game_after_hints_and_discards(self):
+        # Act
+        expected, actual = self._undo_game(lambda moves: moves[-1])
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test_undo_restores_the_game_after_plays(self):
+        # Act
+        expected, actual = self._undo_game(lambda moves: moves[0])
+
+        # Assert
+        self.assertEqual(HanabiGameState.Playing, self.game.state)
+        self.assertEqual(expected, actual)
+        self.assertEqual([], self.game.history)
@@ -0,0 +1,81 @@
+import unittest
+
+from pynabi.base import Card, CardColour
+from pynabi.deck import HanabiDeck
+from pynabi.hand import PlayerHand
+from pynabi.knowledgebase import KnowledgeBase
+from pynabi.masks import ALL_CARDS, cards_in, colour_mask
+
+
+class TestKnowledgeBase(unittest.TestCase):
+    def setUp(self) -> None:
+        # The unshuffled deck is drawn from the end: (5,White), (5,Yellow), ...
+        self.deck = HanabiDeck(do_shuffle=False)
+        self.kb = KnowledgeBase(PlayerHand())
+        self.kb.draw(self.deck, n_cards=5)
+
+    def test_nothing_is_known_initially(self):
+        # Assert
+        self.assertEqual([ALL_CARDS] * 5, self.kb.masks)
+        self.assertEqual(0, self.kb.knowledge())
+
+    def test_reveal_colour_gives_positive_information(self):
+        # Act
+        self.kb.reveal_colour(CardColour.White)
+
+        # Assert
+        self.assertEqual(colour_mask(CardColour.White), self.kb.get_mask(0))
+        self.assertTrue(self.kb.get_knowledge(0)["colour"])
+        self.assertFalse(self.kb.get_knowledge(0)["value"])
+
+    def test_reveal_colour_gives_negative_information(self):
+        # Act
+        self.kb.reveal_colour(CardColour.White)
+
+        # Assert
+        for card in cards_in(self.kb.get_mask(1)):
+            self.assertNotEqual(CardColour.White, card.colour)
+
+    def test_reveal_colour_and_value_identifies_card(self):
+        # Act
+        self.kb.reveal_colour(CardColour.White)
+        self.kb.reveal_value(5)
+
+        # Assert
+        self.assertEqual(
+            [Card(value=5, colour=CardColour.White)],
+            list(cards_in(self.kb.get_mask(0))),
+        )
+        self.assertEqual({"colour": True, "value": True}, self.kb.get_knowledge(0))
+
+    def test_ruling_out_colours_reveals_the_last_one(self):
+        # Act
+        for colour in (CardColour.Red, CardColour.Blue, CardColour.Green):
+            self.kb.reveal_colour(colour)
+        self.assertFalse(self.kb.get_knowledge(0)["colour"])
+        self.kb.reveal_colour(CardColour.Yellow)
+
+        # Assert
+        self.assertTrue(self.kb.get_knowledge(0)["colour"])
+
+    def test_knowledge_increases_with_hints(self):
+        # Arrange
+        before = self.kb.knowledge()
+
+        # Act
+        self.kb.reveal_value(5)
+
+        # Assert
+        self.assertGreater(self.kb.knowledge(), before)
+
+    def test_drawing_from_empty_deck_adds_no_knowledge(self):
+        # Arrange
+        self.kb.discard(self.deck, 0)
+        self.deck._cards = []
+
+        # Act
+        self.kb.draw(self.deck, n_cards=1)
+
+        # Assert
+        self.assertEqual(4, len(self.kb))
+        self.assertEqual(4, len(self.kb.hand))
@@ -0,0 +1,92 @@
+import random
+import unittest
+
+from pynabi.base import CARDS, HanabiGameState
+from pynabi.engine import create_move
+from pynabi.simulation import create_game
+
+try:
+    import numpy as np
+
+    from pynabi.observation import (
+        ObservationBatch,
+        ObservationEncoder,
+        encode_observation,
+        observation_size,
+    )
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+@unittest.skipUnless(np, "NumPy is not installed")
+class TestObservationEncoder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(4, rng=random.Random(0))
+        self.game.start()
+        self.encoder = ObservationEncoder(4)
+        self.encoder.reset(self.game)
+
+    def assert_matches_full_encoding(self):
+        expected = np.zeros(observation_size(4), dtype=np.float32)
+        for player_id in range(4):
+            encode_observation(self.game, player_id, expected)
+            np.testing.assert_allclose(expected, self.encoder.observe(player_id))
+
+    def test_reset_matches_full_encoding(self):
+        # Assert
+        self.assert_matches_full_encoding()
+
+    def test_updates_match_full_encoding(self):
+        # Arrange
+        rng = random.Random(1)
+
+        # Act & Assert
+        while self.game.state == HanabiGameState.Playing:
+            player = self.game.current_player
+            move = rng.choice(list(player.get_legal_moves(self.game)))
+            self.game.step(create_move(move))
+            self.encoder.update(self.game, player.player_id, move)
+
+            self.assert_matches_full_encoding()
+
+    def test_observe_writes_into_given_buffer(self):
+        # Arrange
+        out = np.zeros(self.encoder.size, dtype=np.float32)
+
+        # Act
+        actual = self.encoder.observe(0, out)
+
+        # Assert
+        self.assertIs(out, actual)
+        self.assertTrue(out.any())
+
+    def test_discarding_all_copies_of_a_card_is_encoded_as_one(self):
+        # Arrange
+        out = np.zeros(observation_size(4), dtype=np.float32)
+        red_one = CARDS[0]
+
+        # Act
+        self.game.deck.discard(red_one, red_one)
+        encode_observation(self.game, 0, out)
+
+        # Assert
+        self.assertEqual(1.0, out[8 + red_one.id])
+
+    def test_batch_matches_full_encoding(self):
+        # Arrange
+        games = [create_game(4, rng=random.Random(seed)) for seed in range(3)]
+        batch = ObservationBatch(3, 4)
+        for game, encoder in zip(games, batch.encoders):
+            game.start()
+            encoder.reset(game)
+
+        player_ids = [0, 2, 3]
+
+        # Act
+        actual = batch.observe(player_ids)
+
+        # Assert
+        expected = np.zeros(observation_size(4), dtype=np.float32)
+        for game, player_id, observation in zip(games, player_ids, actual):
+            encode_observation(game, player_id, expected)
+            np.testing.assert_allclose(expected, observation)
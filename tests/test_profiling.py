@@ -0,0 +1,60 @@
+import json
+import unittest
+
+from pynabi.profiling import Profiler
+from pynabi.simulation import play_game
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.profiler = Profiler()
+
+    def test_phase_counts_calls(self):
+        # Act
+        for _ in range(3):
+            with self.profiler.phase("draw"):
+                pass
+
+        # Assert
+        self.assertEqual(3, self.profiler.summary()["draw"]["calls"])
+
+    def test_timed_function_returns_result(self):
+        # Arrange
+        timed = self.profiler.timed("add", lambda a, b: a + b)
+
+        # Act
+        actual = timed(1, 2)
+
+        # Assert
+        self.assertEqual(3, actual)
+        self.assertEqual(1, self.profiler.summary()["add"]["calls"])
+
+    def test_summary_is_exported_as_json(self):
+        # Arrange
+        self.profiler.count("heuristic.play", 5)
+
+        # Act
+        actual = json.loads(self.profiler.to_json())
+
+        # Assert
+        self.assertEqual(5, actual["heuristic.play"]["calls"])
+
+    def test_game_records_phases(self):
+        # Act
+        result = play_game(3, seed=0, profiler=self.profiler)
+        summary = self.profiler.summary()
+
+        # Assert
+        self.assertEqual(result.turns, summary["turn"]["calls"])
+        for phase in ("decide", "apply", "legal_moves", "heuristic.play"):
+            self.assertIn(phase, summary)
+
+    def test_profiling_does_not_change_the_game(self):
+        # Arrange
+        expected = play_game(3, seed=5)
+
+        # Act
+        actual = play_game(3, seed=5, profiler=self.profiler)
+
+        # Assert
+        self.assertEqual(expected, actual)
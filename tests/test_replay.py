@@ -0,0 +1,107 @@
+import os
+import random
+import tempfile
+import unittest
+
+from pynabi.base import HanabiGameState
+from pynabi.engine import ProbabilisticEngine
+from pynabi.replay import Replay, ReplayReader, ReplayRecorder, ReplayWriter
+from pynabi.simulation import create_game, simulate
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.replay")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_replays_round_trip(self):
+        # Arrange
+        expected = [
+            Replay(3, bytes(range(25)), bytes([0, 12, 5]), 7, False, seed=42),
+            Replay(5, b"", b"", 25, True),
+            Replay(4, b"", b"", 0, False, seed=-3),
+        ]
+
+        # Act
+        with ReplayWriter(self.path) as writer:
+            for replay in expected:
+                writer.write(replay)
+
+        with ReplayReader(self.path) as reader:
+            actual = list(reader)
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test_writer_rejects_seeds_beyond_64_bits(self):
+        # Arrange
+        replay = Replay(3, b"", b"", 0, False, seed=1 << 63)
+
+        # Act & Assert
+        with ReplayWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.write(replay)
+
+    def test_writer_appends_to_file(self):
+        # Arrange
+        replay = Replay(4, bytes([1, 2]), bytes([3]), 0, False)
+
+        # Act
+        for _ in range(2):
+            with ReplayWriter(self.path) as writer:
+                writer.write(replay)
+
+        with ReplayReader(self.path) as reader:
+            actual = list(reader)
+
+        # Assert
+        self.assertEqual([replay, replay], actual)
+
+    def test_simulated_games_are_recorded(self):
+        # Arrange
+        with ReplayWriter(self.path) as writer:
+            results = simulate(3, players=4, seed=7, replays=writer)
+
+        # Act
+        with ReplayReader(self.path) as reader:
+            replays = list(reader)
+
+        # Assert
+        self.assertEqual([7, 8, 9], [replay.seed for replay in replays])
+        for result, replay in zip(results, replays):
+            self.assertEqual(result.score, replay.score)
+            self.assertEqual(result.turns, len(replay.actions))
+            self.assertEqual(45, len(replay.deck))
+
+    def test_games_with_unrecorded_moves_are_skipped(self):
+        # Arrange
+        with ReplayWriter(self.path) as writer:
+            recorder = ReplayRecorder(writer)
+            game = create_game(3, events=recorder, rng=random.Random(1))
+            game.start()
+
+            # Act
+            game.step(lambda game, player: player.discard(game, 0))
+            while game.state == HanabiGameState.Playing:
+                game.step(ProbabilisticEngine(game, game.current_player).make_move())
+
+            create_game(3, events=recorder, rng=random.Random(2)).play()
+
+        with ReplayReader(self.path) as reader:
+            replays = list(reader)
+
+        # Assert
+        self.assertEqual(1, recorder.skipped)
+        self.assertEqual(1, len(replays))
+
+    def test_reader_rejects_other_files(self):
+        # Arrange
+        with open(self.path, "wb") as f:
+            f.write(b"not a replay")
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            ReplayReader(self.path)
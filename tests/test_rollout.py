@@ -0,0 +1,103 @@
+import random
+import unittest
+
+from pynabi.base import COLOURS, Action, HanabiGameState
+from pynabi.engine import MCTSEngine, create_move
+from pynabi.masks import COLOUR_MASKS, VALUE_MASKS
+from pynabi.rollout import MISPLAY_PENALTY, RolloutState, default_policy, play_to_end
+from pynabi.simulation import create_game
+
+
+def _game_move(move: tuple) -> tuple:
+    """
+    Translates a move of a rollout into a move of a game.
+    """
+    if move[0] is not Action.INFO:
+        return move
+
+    _, player_id, hint = move
+    if hint in COLOUR_MASKS:
+        return (Action.INFO, player_id, COLOURS[COLOUR_MASKS.index(hint)])
+    return (Action.INFO, player_id, VALUE_MASKS.index(hint) + 1)
+
+
+def _discard_oldest(state: RolloutState) -> tuple:
+    return (Action.DISCARD, 0)
+
+
+class TestRolloutState(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(3, rng=random.Random(6))
+        self.game.start()
+
+    def _assert_state_matches_game(self, state: RolloutState):
+        expected = RolloutState.from_game(self.game)
+        for name in RolloutState.__slots__:
+            self.assertEqual(getattr(expected, name), getattr(state, name), name)
+
+    def test_moves_follow_the_rules_of_the_game(self):
+        # Arrange
+        state = RolloutState.from_game(self.game)
+        result = HanabiGameState.Playing
+
+        # Act & Assert
+        while result == HanabiGameState.Playing:
+            move = default_policy(state)
+            result = state.apply(move)
+            self.game.step(create_move(_game_move(move)))
+
+            self.assertEqual(self.game.state, result)
+            if result == HanabiGameState.Playing:
+                self._assert_state_matches_game(state)
+
+        self.assertEqual(self.game.calculate_points(), state.points)
+
+    def test_play_to_end_scores_won_games(self):
+        # Arrange
+        state = RolloutState.from_game(self.game)
+        state.piles = [5, 5, 5, 5, 4]
+        state.points = 24
+
+        # Act
+        score = play_to_end(state, _discard_oldest)
+
+        # Assert
+        self.assertEqual(24 / 25, score)
+        self.assertFalse(state.deck)
+
+    def test_play_to_end_charges_won_games_for_lost_fuses(self):
+        # Arrange
+        state = RolloutState.from_game(self.game)
+        state.piles = [5, 5, 5, 5, 4]
+        state.points = 24
+        state.fuse_tokens = 2
+
+        # Act
+        score = play_to_end(state, _discard_oldest)
+
+        # Assert
+        self.assertEqual((24 - MISPLAY_PENALTY) / 25, score)
+
+    def test_play_to_end_scores_lost_games_as_zero(self):
+        # Arrange
+        state = RolloutState.from_game(self.game)
+        state.fuse_tokens = 1
+
+        # Act
+        score = play_to_end(state, lambda _: (Action.PLAY, 0))
+
+        # Assert
+        self.assertEqual(0.0, score)
+
+    def test_engine_plays_out_by_its_policy(self):
+        # Arrange
+        class DiscardingEngine(MCTSEngine):
+            rollout_policy = staticmethod(_discard_oldest)
+
+        expected = play_to_end(RolloutState.from_game(self.game), _discard_oldest)
+
+        # Act
+        score = DiscardingEngine.play_out(self.game.clone())
+
+        # Assert
+        self.assertEqual(expected, score)
@@ -0,0 +1,45 @@
+import random
+import unittest
+
+from pynabi.base import HanabiGameState
+from pynabi.simulation import play_game, simulate
+
+
+class TestSimulation(unittest.TestCase):
+    def test_simulate_plays_all_games(self):
+        # Arrange
+        expected = 3
+
+        # Act
+        results = simulate(expected, players=3, seed=0)
+
+        # Assert
+        self.assertEqual(expected, len(results))
+        for result in results:
+            self.assertIn(result.state, (HanabiGameState.Won, HanabiGameState.Lost))
+            self.assertGreater(result.turns, 0)
+
+    def test_simulate_is_reproducible_with_seed(self):
+        # Arrange
+        expected = simulate(2, players=4, seed=42)
+
+        # Act
+        actual = simulate(2, players=4, seed=42)
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test_simulate_rejects_invalid_number_of_players(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            simulate(1, players=2)
+
+    def test_play_game_leaves_global_random_state_untouched(self):
+        # Arrange
+        expected = random.getstate()
+
+        # Act
+        play_game(3, seed=1)
+
+        # Assert
+        self.assertEqual(expected, random.getstate())
@@ -0,0 +1,27 @@
+import unittest
+
+from pynabi.tournament import run_tournament
+
+
+class TestTournament(unittest.TestCase):
+    def test_last_snapshot_covers_all_games(self):
+        # Arrange
+        expected = 5
+
+        # Act
+        snapshots = list(run_tournament(expected, workers=1, seed=0, chunk_size=2))
+
+        # Assert
+        self.assertEqual(3, len(snapshots))
+        self.assertEqual(expected, snapshots[-1].games)
+        self.assertTrue(snapshots[-1].is_complete)
+
+    def test_results_do_not_depend_on_number_of_workers(self):
+        # Arrange
+        *_, expected = run_tournament(4, workers=1, seed=7, chunk_size=1)
+
+        # Act
+        *_, actual = run_tournament(4, workers=2, seed=7, chunk_size=1)
+
+        # Assert
+        self.assertEqual(expected, actual)
@@ -0,0 +1,114 @@
+import random
+import unittest
+
+from pynabi.base import COLOURS, HanabiGameState
+from pynabi.simulation import create_game
+from pynabi.zobrist import (
+    DISCARDED,
+    FUSE_TOKENS,
+    HINT_TOKENS,
+    PILES,
+    PLAYED,
+    hash_deck,
+    hash_hand,
+    hash_masks,
+    hash_pile,
+)
+
+
+class TestZobrist(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = create_game(3, rng=random.Random(11))
+        self.game.start()
+        self.rng = random.Random(5)
+
+    def _play_randomly(self, n_moves=None):
+        while self.game.state == HanabiGameState.Playing and n_moves != 0:
+            moves = list(self.game.current_player.get_legal_moves(self.game))
+            self.game.apply_move(self.rng.choice(moves))
+            n_moves = n_moves and n_moves - 1
+            yield
+
+    def _assert_hashes_are_up_to_date(self):
+        board, deck = self.game.board, self.game.deck
+        tokens = board.tokens
+
+        self.assertEqual(
+            HINT_TOKENS[tokens.hint_tokens] ^ FUSE_TOKENS[tokens.fuse_tokens],
+            tokens.zobrist_hash,
+        )
+        piles = 0
+        for keys, colour in zip(PILES, COLOURS):
+            piles ^= keys[board[colour]]
+        self.assertEqual(
+            piles ^ hash_pile(PLAYED, board.played_cards) ^ tokens.zobrist_hash,
+            board.zobrist_hash,
+        )
+        self.assertEqual(
+            hash_deck(list(deck)) ^ hash_pile(DISCARDED, deck.discarded_pile),
+            deck.zobrist_hash,
+        )
+        for player in self.game.players:
+            kb = player.knowledgebase
+            self.assertEqual(hash_hand(list(kb.hand)), kb.hand.zobrist_hash)
+            self.assertEqual(hash_masks(kb.masks), kb.zobrist_hash)
+
+    def test_hashes_are_updated_incrementally(self):
+        # Act & Assert
+        for _ in self._play_randomly():
+            self._assert_hashes_are_up_to_date()
+
+    def test_undo_restores_the_hash(self):
+        # Arrange
+        expected = self.game.state_hash()
+        n_moves = len(list(self._play_randomly()))
+
+        # Act
+        for _ in range(n_moves):
+            self.game.undo_move()
+
+        # Assert
+        self._assert_hashes_are_up_to_date()
+        self.assertEqual(expected, self.game.state_hash())
+
+    def test_clone_has_the_same_hash(self):
+        # Arrange
+        list(self._play_randomly(10))
+
+        # Act
+        clone = self.game.clone()
+
+        # Assert
+        self.assertEqual(self.game.state_hash(), clone.state_hash())
+        self.assertEqual(
+            self.game.information_set_hash(0), clone.information_set_hash(0)
+        )
+
+    def test_moves_change_the_hash(self):
+        # Arrange
+        hashes = [self.game.state_hash()]
+
+        # Act
+        for _ in self._play_randomly():
+            hashes.append(self.game.state_hash())
+
+        # Assert
+        self.assertEqual(len(hashes), len(set(hashes)))
+
+    def test_information_set_ignores_own_hand_and_deck_order(self):
+        # Arrange
+        player = self.game.players[0]
+        hand, deck = player.knowledgebase.hand, self.game.deck
+        cards = list(deck)
+        state_hash = self.game.state_hash()
+        own_view = self.game.information_set_hash(player.player_id)
+        other_view = self.game.information_set_hash(1)
+
+        # Act
+        hand[0], cards[0] = cards[0], hand[0]
+        deck.replace(cards[::-1])
+
+        # Assert
+        self.assertNotEqual(state_hash, self.game.state_hash())
+        self.assertEqual(own_view, self.game.information_set_hash(player.player_id))
+        self.assertNotEqual(other_view, self.game.information_set_hash(1))